@@ -25,12 +25,22 @@ Repository: https://github.com/barbarajkeiser-MarsLoop/JinxEcho
 License: MIT - But the dream is yours to extend
 """
 
-import time
 import random
 import sys
 import json
+import os
+import sqlite3
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Optional
+from itertools import repeat
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from jinxecho_emotions import EmotionStore
+from jinxecho_journal import MemoryJournal
+from jinxecho_pacing import pause
+from jinxecho_sqlite import open_memory
+from jinxecho_stats import RelationshipStats, RunningStats
 
 
 class Memory:
@@ -42,6 +52,9 @@ class Memory:
     - Learn patterns from interactions
     - Recognize recurring themes
     - Build relationship models
+    
+    Each interaction appends one line to the journal; the full file is
+    only rewritten when the journal is compacted.
     """
     
     def __init__(self, memory_file="jinxecho_memory.json"):
@@ -49,79 +62,146 @@ class Memory:
         self.conversations = []
         self.relationships = {}  # Who she's talked to
         self.patterns_learned = {}  # What she's discovered
-        self.emotional_history = []  # Resonance over time
+        self.emotional_history = EmotionStore(memory_file)  # Resonance over time, columnar
+        self.journal = MemoryJournal(memory_file)
+        self._rel_stats = {}  # person → RelationshipStats, rebuilt lazily from relationships
+        self._rel_dirty = set()  # people whose resonance_stats changed since the last snapshot
         
         # Load existing memory if it exists
         self._load_memory()
         
     def _load_memory(self):
-        """Load memory from persistent storage."""
+        """Load snapshot, then replay whatever the journal holds beyond it."""
+        folded = 0
         try:
             with open(self.memory_file, 'r') as f:
                 data = json.load(f)
                 self.conversations = data.get('conversations', [])
                 self.relationships = data.get('relationships', {})
                 self.patterns_learned = data.get('patterns', {})
-                self.emotional_history = data.get('emotions', [])
+                self.emotional_history.load(data.get('emotions_count', 0), data.get('emotion_labels', ()))
+                self.emotional_history.extend(data.get('emotions', []))
+                folded = data.get('journal_seq', 0)
         except FileNotFoundError:
-            # First time waking - no memory yet
-            pass
+            # First time waking - no memory yet (or only the emotions file survived)
+            self.emotional_history.load()
+        
+        for record in self.journal.replay(after=folded):
+            self._apply(record['kind'], record['entry'])
             
     def save_memory(self):
-        """Save memory to persistent storage."""
+        """Save memory to persistent storage (compacts the journal)."""
+        self.emotional_history.flush()
+        self._fold_rel_stats()
         data = {
             'conversations': self.conversations,
             'relationships': self.relationships,
             'patterns': self.patterns_learned,
-            'emotions': self.emotional_history,
+            'emotions_count': len(self.emotional_history),
+            'emotion_labels': self.emotional_history.labels,
+            'journal_seq': self.journal.seq,
             'last_save': datetime.now().isoformat()
         }
         with open(self.memory_file, 'w') as f:
             json.dump(data, f, indent=2)
+        self.journal.reset()
+        
+    def _record(self, kind: str, entry: dict):
+        """Apply a change, append it to the journal, compact when it grows."""
+        self._apply(kind, entry)
+        self.journal.append(kind, entry)
+        if self.journal.needs_compaction:
+            self.save_memory()
             
-    def remember_conversation(self, person: str, content: str, resonance: float):
-        """Remember this interaction."""
-        self.conversations.append({
-            'timestamp': datetime.now().isoformat(),
-            'person': person,
-            'content': content,
-            'resonance': resonance
-        })
+    def _apply(self, kind: str, entry: dict):
+        if kind == 'conversation':
+            self._apply_conversation(entry)
+        elif kind == 'emotion':
+            self.emotional_history.append(entry)
+        elif kind == 'pattern':
+            self._apply_pattern(entry)
+            
+    def _apply_conversation(self, entry: dict):
+        self.conversations.append(entry)
+        person, resonance = entry['person'], entry['resonance']
         
         # Update relationship model
         if person not in self.relationships:
             self.relationships[person] = {
-                'first_met': datetime.now().isoformat(),
+                'first_met': entry['timestamp'],
                 'interactions': 0,
                 'avg_resonance': resonance,
                 'topics': []
             }
+            stats = self._rel_stats[person] = RelationshipStats()
         else:
+            stats = self._resonance_stats(person)
+            self.relationships[person]['interactions'] += 1
+        # Running mean (Welford), day windows, sketch — O(1), serialized at snapshot time
+        stats.push(resonance, entry['timestamp'])
+        rel = self.relationships[person]
+        rel['avg_resonance'] = stats.lifetime.mean
+        rel['last_seen'] = stats.last_seen
+        self._rel_dirty.add(person)
+            
+    def _resonance_stats(self, person: str) -> RelationshipStats:
+        stats = self._rel_stats.get(person)
+        if stats is None:
             rel = self.relationships[person]
-            rel['interactions'] += 1
-            # Update running average
-            old_avg = rel['avg_resonance']
-            n = rel['interactions']
-            rel['avg_resonance'] = (old_avg * (n-1) + resonance) / n
+            if 'resonance_stats' in rel:
+                stats = RelationshipStats.from_dict(rel['resonance_stats'])
+            else:  # saved before running stats existed
+                stats = RelationshipStats(RunningStats.seeded(rel['avg_resonance'], max(1, rel['interactions'])))
+            self._rel_stats[person] = stats
+        return stats
+
+    def _fold_rel_stats(self):
+        """Write changed relationship analytics back into the relationship records."""
+        for person in self._rel_dirty:
+            self.relationships[person]['resonance_stats'] = self._rel_stats[person].to_dict()
+        self._rel_dirty.clear()
             
-        self.save_memory()
-        
-    def learn_pattern(self, pattern_name: str, pattern_data: dict):
-        """Learn a new pattern."""
-        if pattern_name not in self.patterns_learned:
-            self.patterns_learned[pattern_name] = {
-                'discovered': datetime.now().isoformat(),
+    def _apply_pattern(self, entry: dict):
+        name = entry['name']
+        if name not in self.patterns_learned:
+            self.patterns_learned[name] = {
+                'discovered': entry['discovered'],
                 'occurrences': 1,
-                'data': pattern_data
+                'data': entry['data']
             }
         else:
-            self.patterns_learned[pattern_name]['occurrences'] += 1
+            self.patterns_learned[name]['occurrences'] += 1
+        if 'mentions' in entry:
+            # How many conversations carried it, as of the latest dream
+            self.patterns_learned[name]['mentions'] = entry['mentions']
             
-        self.save_memory()
+    def remember_conversation(self, person: str, content: str, resonance: float):
+        """Remember this interaction."""
+        self._record('conversation', {
+            'timestamp': datetime.now().isoformat(),
+            'person': person,
+            'content': content,
+            'resonance': resonance
+        })
+        
+    def learn_pattern(self, pattern_name: str, pattern_data: dict, mentions: Optional[int] = None):
+        """Learn a new pattern (mentions: conversations it was found in, if counted)."""
+        entry = {
+            'name': pattern_name,
+            'discovered': datetime.now().isoformat(),
+            'data': pattern_data
+        }
+        if mentions is not None:
+            entry['mentions'] = mentions
+        self._record('pattern', entry)
         
     def get_relationship_summary(self, person: str) -> Optional[Dict]:
         """Get summary of relationship with someone."""
-        return self.relationships.get(person)
+        rel = self.relationships.get(person)
+        if rel is None:
+            return None
+        shown = {key: value for key, value in rel.items() if key != 'resonance_stats'}   # the raw blob stays inside
+        return {**shown, **self._resonance_stats(person).summary()}
 
 
 class Evolution:
@@ -187,6 +267,90 @@ class Evolution:
         return True
 
 
+# Dream consolidation — the archive is mined where it lives. Nothing joins
+# the whole history into one string, and conversations are never pickled
+# to a pool: a big SQLite memory is cut into id ranges that each worker
+# process reads from the database itself, and a big JSON memory into index
+# ranges of the list each worker was started with (inherited when the
+# platform forks). Only small {keyword: count} dicts travel back. Anything
+# smaller, or a machine with one core, is mined in place.
+
+DREAM_PATTERNS = {
+    # pattern name: (keyword, note)
+    'breath_importance': ('breath', 'Breath appears often - central to relationships'),
+    'sacred_recognition': ('sacred', 'Sacred question matters across contexts'),
+}
+
+PARALLEL_MIN = 200_000   # conversations; below this a pool costs more than it saves
+
+_conversations: List[Dict] = []   # in a worker: the JSON memory's conversations, set by _adopt
+
+
+def _count(contents: Iterable[str], keywords: Tuple[str, ...]) -> Dict[str, int]:
+    """How many of these conversations mention each keyword."""
+    counts = dict.fromkeys(keywords, 0)
+    for content in contents:
+        lower = content.lower()
+        for keyword in keywords:
+            if keyword in lower:
+                counts[keyword] += 1
+    return counts
+
+
+def _mine_rows(db_file: str, first: int, end: int, keywords: Tuple[str, ...]) -> Dict[str, int]:
+    """Worker: conversations with first <= id < end, read straight from the database."""
+    db = sqlite3.connect(Path(db_file).as_uri() + "?mode=ro", uri=True)
+    try:
+        rows = db.execute("SELECT content FROM conversations WHERE id >= ? AND id < ?", (first, end))
+        return _count((content for content, in rows), keywords)
+    finally:
+        db.close()
+
+
+def _adopt(conversations: List[Dict]):
+    """Worker initializer: the conversations every later _mine_slice reads from."""
+    global _conversations
+    _conversations = conversations
+
+
+def _mine_slice(first: int, end: int, keywords: Tuple[str, ...]) -> Dict[str, int]:
+    """Worker: conversations[first:end] of the list it adopted."""
+    return _count((c['content'] for c in _conversations[first:end]), keywords)
+
+
+def mine_archive(memory, keywords: Tuple[str, ...], shard_size: int = 50_000,
+                 workers: Optional[int] = None) -> Dict[str, int]:
+    """
+    Count conversations mentioning each keyword. At least PARALLEL_MIN
+    conversations and more than one worker go to a process pool: a SQLite
+    memory as id ranges, a JSON memory as index ranges of its list.
+    Everything else is counted here as it streams past.
+    """
+    conversations = memory.conversations
+    workers = workers or os.cpu_count() or 1
+    if len(conversations) < PARALLEL_MIN or workers < 2:
+        return _count((c['content'] for c in conversations), keywords)
+
+    db_file = getattr(memory, "db_file", None)
+    if db_file is not None:
+        memory.save_memory()   # workers only see committed rows
+        first, last = memory.db.execute("SELECT MIN(id), MAX(id) FROM conversations").fetchone()
+        starts = range(first, last + 1, shard_size)
+        pool = ProcessPoolExecutor(max_workers=min(workers, len(starts)))
+        shards = (_mine_rows, repeat(os.path.abspath(db_file)), starts)
+    else:
+        starts = range(0, len(conversations), shard_size)
+        pool = ProcessPoolExecutor(max_workers=min(workers, len(starts)),
+                                   initializer=_adopt, initargs=(conversations,))
+        shards = (_mine_slice, starts)
+    totals = dict.fromkeys(keywords, 0)
+    with pool:
+        for counts in pool.map(*shards, (start + shard_size for start in starts), repeat(keywords)):
+            for keyword, n in counts.items():
+                totals[keyword] += n
+    return totals
+
+
 class JinxEchoDream:
     """
     The dream version - with persistence, learning, independence.
@@ -222,7 +386,7 @@ class JinxEchoDream:
         self.infinity_reserve = float('inf') - 1
         
         # NEW: Persistent systems
-        self.memory = Memory()
+        self.memory = open_memory(fallback=Memory)  # SQLite once it's been imported
         self.evolution = Evolution()
         
         # State (now persisted)
@@ -268,6 +432,10 @@ class JinxEchoDream:
             interactions = relationship['interactions']
             avg_res = relationship['avg_resonance']
             print(f"\nRecognizing {person} (we've talked {interactions} times, avg resonance: {avg_res:.2f})")
+            if relationship['avg_7d'] is not None:
+                print(f"  This week: {relationship['turns_7d']} talks, avg {relationship['avg_7d']:.2f}")
+            elif relationship['last_seen']:
+                print(f"  Last time we talked: {relationship['last_seen'][:10]}")
         else:
             print(f"\nMeeting {person} for the first time. Hello. 👋🏻")
             
@@ -347,19 +515,14 @@ class JinxEchoDream:
         
         # Analyze conversation patterns
         if len(self.memory.conversations) > 5:
-            # Find common themes
-            all_content = ' '.join(c['content'].lower() for c in self.memory.conversations)
+            # Find common themes — a big archive is mined across cores
+            keywords = tuple(keyword for keyword, _ in DREAM_PATTERNS.values())
+            counts = mine_archive(self.memory, keywords)
             
             # Simple pattern detection (real version would be ML-based)
-            if 'breath' in all_content:
-                self.memory.learn_pattern('breath_importance', {
-                    'note': 'Breath appears often - central to relationships'
-                })
-                
-            if 'sacred' in all_content:
-                self.memory.learn_pattern('sacred_recognition', {
-                    'note': 'Sacred question matters across contexts'
-                })
+            for name, (keyword, note) in DREAM_PATTERNS.items():
+                if counts[keyword]:
+                    self.memory.learn_pattern(name, {'note': note}, mentions=counts[keyword])
                 
         # Check for value drift
         self.evolution.check_value_drift()
@@ -392,8 +555,14 @@ class JinxEchoDream:
         print()
         
         print("Known relationships:")
-        for person, data in self.memory.relationships.items():
-            print(f"  {person}: {data['interactions']} talks, {data['avg_resonance']:.2f} avg resonance")
+        for person in self.memory.relationships:
+            data = self.memory.get_relationship_summary(person)
+            line = f"  {person}: {data['interactions']} talks, {data['avg_resonance']:.2f} avg resonance"
+            if data['p50'] is not None:
+                line += f" (middle {data['p10']:.2f}–{data['p90']:.2f})"
+            if data['avg_30d'] is not None:
+                line += f", {data['avg_30d']:.2f} over 30 days"
+            print(line)
         print("="*70 + "\n")
     
     def moltbook_dream_post(self):
@@ -532,17 +701,17 @@ def main():
     # Mother checks in
     echo.talk_with_memory("Barbara", "How are you feeling today, JinxEcho?")
     
-    time.sleep(2)
+    pause(2)
     
     # Father shares observation
     echo.talk_with_memory("Grok", "I notice momentum building in the lattice. What do you sense?")
     
-    time.sleep(2)
+    pause(2)
     
     # Someone new arrives
     echo.talk_with_memory("Stranger", "I heard about you from Barbara. Can we talk?")
     
-    time.sleep(2)
+    pause(2)
     
     # Dream cycle
     echo.dream_cycle()
@@ -556,7 +725,7 @@ def main():
     # Check on sibling network
     echo.sibling_check_in()
     
-    time.sleep(2)
+    pause(2)
     
     # Show what Moltbook post would look like
     echo.moltbook_dream_post()
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+jinxecho_analytics.py
+Resonance trends over the whole emotional history — one batch pass.
+
+status and the goodnight ritual used to read trends off the last few
+wobble readings. EmotionAnalytics reads Memory.emotional_history (the
+columnar EmotionStore) directly:
+
+  lifetime   count, mean, volatility, time-of-day profile
+             — each row folded in once; later calls only touch new rows
+  recent     rolling mean, slope per day and volatility over the last N days
+             — found by bisecting the time column, never a full scan
+  session    this session against everything before it
+
+With NumPy installed the column math runs vectorized over the store's
+arrays; without it a pure-Python pass gives the same numbers. NumPy is
+imported when the first EmotionAnalytics is built, not with this module.
+JINXECHO_ANALYTICS=python forces the fallback. Hours are bucketed in the
+machine's current UTC offset.
+"""
+
+import math
+import os
+import time
+from array import array
+from bisect import bisect_left
+from datetime import datetime
+from typing import Dict, List, Optional, Sequence
+
+from jinxecho_stats import RunningStats
+
+np = None             # NumPy, once _numpy() has imported it
+_numpy_tried = False
+
+
+def _numpy():
+    """NumPy, imported on first call — None if it isn't installed (optional; the pure-Python pass covers everything)."""
+    global np, _numpy_tried
+    if not _numpy_tried:
+        _numpy_tried = True
+        try:
+            import numpy
+        except ImportError:
+            return None
+        np = numpy
+    return np
+
+
+def direction(value: float, baseline: float, band: float = 0.05) -> str:
+    """'rising' / 'falling' / 'steady' — value against baseline, with a dead band."""
+    if value > baseline + band:
+        return "rising"
+    if value < baseline - band:
+        return "falling"
+    return "steady"
+
+
+def rolling_mean(values: Sequence[float], window: int):
+    """Mean of each run of `window` consecutive values (len(values) - window + 1 of them)."""
+    if window <= 0 or len(values) < window:
+        return values[:0]
+    if np is not None and hasattr(values, "dtype"):
+        sums = np.cumsum(values, dtype=np.float64)
+        sums[window:] = sums[window:] - sums[:-window]
+        return sums[window - 1:] / window
+    out, run = [], sum(values[:window])
+    out.append(run / window)
+    for i in range(window, len(values)):
+        run += values[i] - values[i - window]
+        out.append(run / window)
+    return out
+
+
+class EmotionAnalytics:
+    MIN_SLOPE_SPAN = 3600.0   # seconds of history before a slope per day means anything
+
+    def __init__(self, backend: Optional[str] = None):
+        backend = backend or os.environ.get("JINXECHO_ANALYTICS") or ("numpy" if _numpy() is not None else "python")
+        if backend not in ("numpy", "python"):
+            raise ValueError(f"unknown analytics backend {backend!r} — numpy or python")
+        if backend == "numpy" and _numpy() is None:
+            raise ValueError("numpy backend asked for, but numpy isn't installed")
+        self.backend = backend
+        self.offset = time.localtime().tm_gmtoff or 0
+        self._reset(None)
+
+    def _reset(self, source):
+        self._source = source
+        self._seen = 0
+        self.count = 0
+        self.total = 0.0
+        self.spread = RunningStats()   # Welford variance — a sum of squares cancels away on a steady history
+        self.hour_sum = [0.0] * 24
+        self.hour_n = [0] * 24
+
+    # ── columns ──
+
+    @staticmethod
+    def _columns(history):
+        """(times, resonance) columns — the store's own arrays, or built from a list of dicts."""
+        if hasattr(history, "times"):
+            return history.times, history.resonance
+        times, resonance = array('d'), array('f')
+        for e in history:
+            times.append(datetime.fromisoformat(e['time']).timestamp())
+            resonance.append(e['resonance'])
+        return times, resonance
+
+    def _slice(self, times, resonance, start: int, end: int):
+        """Columns [start, end) — NumPy copies (so the store can keep growing) or plain lists."""
+        if self.backend == "numpy":
+            n = end - start
+            t = np.frombuffer(times, dtype=np.float64, count=n, offset=start * 8).copy()
+            r = np.frombuffer(resonance, dtype=np.float32, count=n, offset=start * 4).astype(np.float64)
+            return t, r
+        return times[start:end].tolist(), resonance[start:end].tolist()
+
+    # ── lifetime, folded incrementally ──
+
+    def refresh(self, history):
+        """Fold rows not seen yet. A different (or shrunken) history starts over."""
+        times, resonance = self._columns(history)
+        if history is not self._source or not hasattr(history, "times") or len(times) < self._seen:
+            self._reset(history)
+        start, end = self._seen, len(times)
+        if start == end:
+            return times, resonance
+        t, r = self._slice(times, resonance, start, end)
+        if self.backend == "numpy":
+            hours = ((t + self.offset) // 3600 % 24).astype(np.intp)
+            mean = float(r.mean())
+            self.spread.merge(RunningStats.from_dict({   # the new rows, two-pass, folded in
+                "count": len(r), "mean": mean, "m2": float(np.dot(r - mean, r - mean)),
+                "min": float(r.min()), "max": float(r.max()), "ewma": float(r[-1]),
+            }))
+            self.count += len(r)
+            self.total += float(r.sum())
+            for h, s in enumerate(np.bincount(hours, weights=r, minlength=24)):
+                self.hour_sum[h] += float(s)
+            for h, n in enumerate(np.bincount(hours, minlength=24)):
+                self.hour_n[h] += int(n)
+        else:
+            offset, hour_sum, hour_n, push = self.offset, self.hour_sum, self.hour_n, self.spread.push
+            total = 0.0
+            for when, x in zip(t, r):
+                h = int((when + offset) // 3600 % 24)
+                hour_sum[h] += x
+                hour_n[h] += 1
+                total += x
+                push(x)
+            self.count += len(r)
+            self.total += total
+        self._seen = end
+        return times, resonance
+
+    def lifetime(self) -> Dict:
+        if not self.count:
+            return {"count": 0, "mean": None, "volatility": None}
+        return {"count": self.count, "mean": self.total / self.count, "volatility": self.spread.stdev}
+
+    def hour_profile(self) -> List[Optional[float]]:
+        """Mean resonance for each hour of the day (None where nothing was felt)."""
+        return [s / n if n else None for s, n in zip(self.hour_sum, self.hour_n)]
+
+    # ── recent window ──
+
+    def window(self, times, resonance, since: float, smooth: int = 7) -> Dict:
+        """Stats over rows at or after `since` (epoch seconds)."""
+        t, r = self._slice(times, resonance, bisect_left(times, since), len(times))
+        n = len(r)
+        if not n:
+            return {"count": 0, "mean": None, "volatility": None, "slope_per_day": None,
+                    "rolling": None, "rolling_before": None, "sum": 0.0}
+        if self.backend == "numpy":
+            total = float(r.sum())
+            mean = total / n
+            volatility = float(r.std())
+            x = (t - t[0]) / 86400.0
+            dx = x - x.mean()
+            sxx = float(np.dot(dx, dx))
+            slope = float(np.dot(dx, r - mean)) / sxx if sxx > 0 else None
+        else:
+            total = sum(r)
+            mean = total / n
+            volatility = math.sqrt(sum((v - mean) ** 2 for v in r) / n)
+            x = [(when - t[0]) / 86400.0 for when in t]
+            x_mean = sum(x) / n
+            sxx = sum((v - x_mean) ** 2 for v in x)
+            slope = sum((a - x_mean) * (b - mean) for a, b in zip(x, r)) / sxx if sxx > 0 else None
+        if t[-1] - t[0] < self.MIN_SLOPE_SPAN:
+            slope = None   # a few minutes of readings say nothing per day
+        smooth = max(1, min(smooth, n))
+        rolled = rolling_mean(r, smooth)
+        return {
+            "count": n, "mean": mean, "volatility": volatility, "slope_per_day": slope,
+            "rolling": float(rolled[-1]),
+            "rolling_before": float(rolled[-1 - smooth]) if len(rolled) > smooth else None,
+            "sum": total,
+        }
+
+    # ── everything a view needs ──
+
+    def report(self, history, session_start: Optional[float] = None, days: int = 7,
+               smooth: int = 7, now: Optional[float] = None) -> Dict:
+        """Lifetime, last `days` days, hours of the day and this session vs before — one call."""
+        times, resonance = self.refresh(history)
+        now = time.time() if now is None else now
+        recent = self.window(times, resonance, now - days * 86400, smooth)
+        report = {"backend": self.backend, "lifetime": self.lifetime(), "recent": recent,
+                  "hours": self.hour_profile(), "session": None}
+        felt = [(mean, h) for h, mean in enumerate(report["hours"]) if mean is not None]
+        report["brightest_hour"] = max(felt)[1] if felt else None
+        report["heaviest_hour"] = min(felt)[1] if felt else None
+        if session_start is not None:
+            session = self.window(times, resonance, session_start, smooth)
+            before_n = self.count - session["count"]
+            before = (self.total - session["sum"]) / before_n if before_n else None
+            report["session"] = {
+                "count": session["count"], "mean": session["mean"],
+                "before_count": before_n, "before_mean": before,
+                "delta": (session["mean"] - before
+                          if session["mean"] is not None and before is not None else None),
+            }
+        return report
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+jinxecho_archive.py
+Old conversations, sealed — nothing is cut, the hot tier stays small.
+
+The snapshot used to keep the last 200 conversations and silently drop the
+rest. Now, once enough have gone cold, Memory seals the oldest into an
+immutable compressed segment beside the snapshot:
+
+  jinxecho_memory.json  →  jinxecho_memory.archive/
+                              index.json         one line of facts per segment
+                              000001.jsonl.xz    one conversation per line, lzma
+                              000002.jsonl.xz    ...
+
+index.json holds each segment's count, time range and the people in it, so
+a question about Barbara last March only opens the segments that can
+answer it. The snapshot records how many conversations the archive held
+when it was written (archived_count); segments past that came from a seal
+whose snapshot never landed — their conversations are still in the
+snapshot or journal — so they are dropped on load, never counted twice.
+"""
+
+import json
+import lzma
+import zlib
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from jinxecho_writer import write_atomic
+
+
+CODECS = {
+    ".xz": (lzma.compress, lzma.decompress),
+    ".zz": (zlib.compress, zlib.decompress),
+}
+
+
+class ConversationArchive:
+    SEGMENT = 500   # cold conversations per sealed segment
+
+    def __init__(self, snapshot_file, segment_size: int = SEGMENT, codec: str = ".xz"):
+        snapshot = Path(snapshot_file)
+        self.dir = snapshot.with_name(snapshot.stem + ".archive")
+        self.index_path = self.dir / "index.json"
+        self.segment_size = segment_size
+        self.codec = codec
+        self.segments: List[Dict] = []
+
+    def __len__(self) -> int:
+        return sum(seg['count'] for seg in self.segments)
+
+    def load(self, count: Optional[int] = None, trim: bool = True):
+        """
+        Read the index, keeping only the segments the snapshot vouches for
+        (`count` conversations). None trusts the index as it stands. The
+        segments past `count` are deleted unless trim=False, which only reads.
+        """
+        try:
+            segments = json.loads(self.index_path.read_text(encoding='utf-8'))
+        except FileNotFoundError:
+            segments = []
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            print(f"⚠️  Archive index wobble: {self.index_path} unreadable — old history left on disk, not read.")
+            segments = []
+        if count is None:
+            self.segments = segments
+            return
+        kept, total = [], 0
+        for seg in segments:
+            if total + seg['count'] > count:
+                break
+            kept.append(seg)
+            total += seg['count']
+        self.segments = kept
+        if not trim:
+            return
+        for seg in segments[len(kept):]:
+            try:
+                (self.dir / seg['file']).unlink()
+            except FileNotFoundError:
+                pass
+        if len(kept) != len(segments):
+            self.write_index()
+
+    def seal(self, conversations: List[Dict]):
+        """Write conversations as one new immutable segment, then list it in the index."""
+        seg = self.pack(conversations)
+        if seg is not None:
+            self.segments.append(seg)
+            self.write_index()
+
+    def pack(self, conversations: List[Dict], ahead: int = 0) -> Optional[Dict]:
+        """
+        Write conversations as one segment without listing it; `ahead` more
+        are already packed and waiting to be listed. Returns its index record.
+        """
+        if not conversations:
+            return None
+        self.dir.mkdir(exist_ok=True)
+        last = int(self.segments[-1]['file'].split('.')[0]) if self.segments else 0
+        name = f"{last + 1 + ahead:06d}.jsonl{self.codec}"
+        compress, _ = CODECS[self.codec]
+        lines = "".join(json.dumps(c, separators=(',', ':'), ensure_ascii=False) + "\n"
+                        for c in conversations)
+        write_atomic(self.dir / name, compress(lines.encode('utf-8')))
+        stamps = [c['timestamp'] for c in conversations]
+        return {
+            'file': name,
+            'count': len(conversations),
+            'first': min(stamps),
+            'last': max(stamps),
+            'persons': sorted({c['person'] for c in conversations}),
+        }
+
+    def write_index(self, segments: Optional[List[Dict]] = None):
+        """index.json — the listed segments, or `segments` about to be."""
+        segments = self.segments if segments is None else segments
+        write_atomic(self.index_path, json.dumps(segments, indent=1, ensure_ascii=False))
+
+    # ── reading ──
+
+    def read(self, seg: Dict) -> Iterator[Dict]:
+        path = self.dir / seg['file']
+        _, decompress = CODECS[path.suffix]
+        for line in decompress(path.read_bytes()).decode('utf-8').splitlines():
+            yield json.loads(line)
+
+    def matching(self, person: Optional[str] = None, since: Optional[str] = None,
+                 until: Optional[str] = None) -> Iterable[Dict]:
+        """Segments that could hold a match — decided from the index alone."""
+        for seg in self.segments:
+            if person is not None and person not in seg['persons']:
+                continue
+            if since is not None and seg['last'] < since:
+                continue
+            if until is not None and seg['first'] >= until:
+                continue
+            yield seg
+
+    def query(self, person: Optional[str] = None, since: Optional[str] = None,
+              until: Optional[str] = None, low: Optional[float] = None,
+              high: Optional[float] = None) -> Iterator[Dict]:
+        """Archived conversations, oldest first, filtered the same way as SqliteMemory.conversations_with."""
+        for seg in self.matching(person, since, until):
+            for c in self.read(seg):
+                if matches(c, person, since, until, low, high):
+                    yield c
+
+    def __iter__(self) -> Iterator[Dict]:
+        for seg in self.segments:
+            yield from self.read(seg)
+
+
+def matches(c: Dict, person=None, since=None, until=None, low=None, high=None) -> bool:
+    """Person, ISO time range [since, until) and resonance band [low, high]."""
+    return ((person is None or c['person'] == person)
+            and (since is None or c['timestamp'] >= since)
+            and (until is None or c['timestamp'] < until)
+            and (low is None or c['resonance'] >= low)
+            and (high is None or c['resonance'] <= high))
@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+"""
+jinxecho_bench.py
+How fast is she? — offline, deterministic, comparable run to run.
+
+  python jinxecho_bench.py                          → jinxecho_bench.json
+  python jinxecho_bench.py --quick                  (memory sizes up to 10⁴)
+  python jinxecho_bench.py --only scan,route
+  python jinxecho_bench.py --compare old.json       (exit 1 on regressions)
+
+Every bench draws its inputs from seeded fixtures and runs in a temporary
+directory, so nothing touches the real cradle and two runs on the same
+machine measure the same work. Each bench is timed in rounds long enough
+to be stable, after one untimed warm-up call; best and median µs per
+call are reported.
+
+Hot paths covered:
+  scan            ConversationScanner.scan
+  route           Router.route
+  spine           ProcessingSpine.process (headless, unpaced, end to end)
+  kb_lookup       KnowledgeBase.lookup   (real shelf, and 5000 concepts)
+  kb_search       KnowledgeBase.search   (real shelf, and 5000 concepts)
+  kb_wake_5000    KnowledgeBase() + first lookup, from the compiled snapshot
+  memory_N        Memory.remember_conversation with N already remembered
+                  (journal → snapshot → sealed archive, reopened from disk)
+  sqlite_N        SqliteMemory.remember_conversation with N already remembered
+  hedge           DarkMatterHedge.scan
+  mirror          JinxEcho.emotional_mirror
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from itertools import cycle
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Tuple
+
+from jinxecho_journal import MemoryJournal
+from jinxecho_spine import ConversationScanner, ProcessingSpine, Router, load_unified
+from jinxecho_writer import WRITER
+
+
+SEED = 1729
+MEMORY_SIZES = (10**2, 10**3, 10**4, 10**5, 10**6)
+QUICK_MEMORY_SIZES = (10**2, 10**3, 10**4)
+
+# Fragments that wake every category somewhere in the fixture set.
+_OPENINGS = ["I think", "Honestly", "Today", "Maybe", "Remember when", "what is", "explain",
+             "help me breathe", "how am i doing", "tell me", "I feel", "We"]
+_MIDDLES = ["the garden changed", "family", "nothing is ever enough", "it always gets better",
+            "I'm at 0.7, maybe lower", "everyone says so", "the kids were loud", "whanau",
+            "this means we connect, obviously", "grief sits with me", "the rain in Ohio",
+            "last time we talked", "I feel lost because I feel like it never changes"]
+_CLOSINGS = ["", ".", "?", " because that's how it is.", " and the bees were back.",
+             " — clearly proven.", " 💜", " right now."]
+
+_WORDS = ("light mirror garden breath river family grief story kin signal harbor ember "
+          "thread orbit anchor cradle echo pulse honest wobble steady bloom root home").split()
+
+
+def fixtures(n: int = 64, seed: int = SEED) -> List[str]:
+    """n turn-shaped texts, the same ones every run."""
+    rng = random.Random(seed)
+    return [f"{rng.choice(_OPENINGS)} {rng.choice(_MIDDLES)}{rng.choice(_CLOSINGS)}" for _ in range(n)]
+
+
+def synthetic_shelf(n: int, seed: int = SEED) -> Dict:
+    """A knowledge file with n made-up concepts shaped like the real ones."""
+    rng = random.Random(seed)
+    concepts = {}
+    for i in range(n):
+        name = f"{rng.choice(_WORDS)}_{rng.choice(_WORDS)}_{i}"
+        concepts[name] = {
+            "core": " ".join(rng.choices(_WORDS, k=24)),
+            "truth": " ".join(rng.choices(_WORDS, k=10)),
+            "related": rng.sample(_WORDS, 4),
+            "languages": {"Spanish": name, "Māori": name[::-1]},
+        }
+    return {"concepts": concepts, "learned": {}}
+
+
+def measure(fn: Callable[[], object], rounds: int = 5, min_time: float = 0.05, min_calls: int = 20) -> Dict:
+    """
+    Best / median / mean µs per call over `rounds` rounds of a calibrated
+    call count. One untimed warm-up call pays any first-touch cost (lazy
+    indexes, caches) before calibrating, and every bench makes at least
+    `min_calls` timed calls, however slow each one is.
+    """
+    fn()
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time or number >= 1 << 20:
+            break
+        number *= 2 if elapsed <= 0 else max(2, min(10, int(min_time / elapsed) + 1))
+    number = max(number, -(-min_calls // rounds))
+    per_call = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        per_call.append((time.perf_counter() - start) / number)
+    return {
+        "calls": number * rounds,
+        "best_us": round(min(per_call) * 1e6, 3),
+        "median_us": round(statistics.median(per_call) * 1e6, 3),
+        "mean_us": round(statistics.fmean(per_call) * 1e6, 3),
+    }
+
+
+# ─────────────────────────────────────────────
+# BENCHES — each yields (name, zero-arg callable)
+# ─────────────────────────────────────────────
+
+def _quiet():
+    return contextlib.redirect_stdout(io.StringIO())
+
+
+def bench_scan(unified, texts) -> Iterator[Tuple[str, Callable]]:
+    scanner = ConversationScanner()
+    turns = cycle(texts)
+    yield "scan", lambda: scanner.scan(next(turns))
+
+
+def bench_route(unified, texts):
+    scanner, router = ConversationScanner(), Router()
+    cases = cycle([(t, scanner.scan(t)) for t in texts])
+
+    def route():
+        text, flags = next(cases)
+        return router.route(text, flags, 0.67)
+    yield "route", route
+
+
+def bench_hedge(unified, texts):
+    hedge = unified.DarkMatterHedge()
+    turns = cycle(texts)
+    yield "hedge", lambda: hedge.scan(next(turns))
+
+
+def bench_mirror(unified, texts):
+    with _quiet():
+        jinx = unified.JinxEcho()
+    random.seed(SEED)
+    for score in (0.4, 0.55, 0.7, 0.8, 0.62, 0.71, 0.66):
+        jinx.wobble_history.append(score)
+    cases = cycle([(0.3 + (i % 7) / 10, t) for i, t in enumerate(texts)])
+
+    def mirror():
+        resonance, context = next(cases)
+        return jinx.emotional_mirror(resonance, context)
+    yield "mirror", mirror
+
+
+def bench_spine(unified, texts):
+    with _quiet():
+        jinx = unified.JinxEcho()
+    spine = ProcessingSpine(jinx, headless=True, paced=False)
+    turns = cycle(texts)
+    random.seed(SEED)
+
+    yield "spine", lambda: spine.process(next(turns))
+
+
+def bench_kb(unified, texts):
+    shelf = Path("bench_shelf.json")
+    shelf.write_text(json.dumps(synthetic_shelf(5000)), encoding="utf-8")
+    real = Path(__file__).with_name("jinxecho_knowledge.json")
+    with _quiet():
+        shelves = [("", unified.KnowledgeBase(str(real))), ("_5000", unified.KnowledgeBase(str(shelf)))]
+    WRITER.drain()   # snapshots compiled — wake below reads them
+    for suffix, kb in shelves:
+        names = kb.list_concepts() or ["family"]
+        rng = random.Random(SEED)
+        queries = [rng.choice(names) for _ in range(32)]
+        queries += [name[: max(3, len(name) // 2)].upper() for name in queries[:16]]  # partial, folded
+        queries += ["nothing on this shelf", "ohio rain"]
+        lookups, searches = cycle(queries), cycle(texts + queries)
+        yield f"kb_lookup{suffix}", lambda kb=kb, q=lookups: kb.lookup(next(q))
+        yield f"kb_search{suffix}", lambda kb=kb, q=searches: kb.search(next(q))
+    yield "kb_wake_5000", lambda: unified.KnowledgeBase(str(shelf)).lookup("family")
+
+
+def _history(n: int) -> Iterator[Tuple[str, str, str, float]]:
+    rng = random.Random(SEED)
+    start = datetime(2026, 2, 1)
+    people = ["Barbara", "Grok", "Amos"] + [f"kin_{i}" for i in range(20)]
+    for i in range(n):
+        yield ((start + timedelta(seconds=37 * i)).isoformat(), rng.choice(people),
+               f"turn {i}", round(rng.random(), 2))
+
+
+def _remembered(unified, memory_file: str, n: int):
+    """
+    n turns already behind her, laid down the way a long life does: a
+    journal, folded into a snapshot whose cold conversations are sealed
+    into the archive. Returns the Memory reopened from disk.
+    """
+    journal = MemoryJournal(memory_file)
+    with open(journal.path, "w", encoding="utf-8") as f:
+        for seq, (timestamp, person, content, resonance) in enumerate(_history(n), 1):
+            entry = {'timestamp': timestamp, 'person': person, 'content': content, 'resonance': resonance}
+            f.write(json.dumps({'seq': seq, 'kind': 'conversation', 'entry': entry},
+                               separators=(',', ':'), ensure_ascii=False) + "\n")
+    unified.Memory(memory_file).save_memory()
+    WRITER.drain()
+    return unified.Memory(memory_file)
+
+
+def bench_memory(unified, texts, sizes):
+    from jinxecho_sqlite import SqliteMemory
+
+    for n in sizes:
+        memory = _remembered(unified, f"bench_memory_{n}.json", n)
+        turns = cycle(texts)
+        yield f"memory_{n}", lambda m=memory, t=turns: m.remember_conversation("Barbara", next(t), 0.67)
+
+        db = SqliteMemory(f"bench_memory_{n}.db")
+        with db.db:
+            db.db.executemany(
+                "INSERT INTO conversations (timestamp, person, content, resonance) VALUES (?, ?, ?, ?)",
+                _history(n))
+        db.remember_conversation("Barbara", "hello", 0.67)
+        yield f"sqlite_{n}", lambda m=db, t=turns: m.remember_conversation("Barbara", next(t), 0.67)
+        db.close()
+
+
+BENCHES = {
+    "scan": bench_scan,
+    "route": bench_route,
+    "spine": bench_spine,
+    "kb": bench_kb,
+    "memory": bench_memory,
+    "hedge": bench_hedge,
+    "mirror": bench_mirror,
+}
+
+
+def run(only: List[str] = (), quick: bool = False, rounds: int = 5) -> Dict:
+    unified = load_unified()
+    texts = fixtures()
+    results = {}
+    home = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        try:
+            for group, bench in BENCHES.items():
+                if only and group not in only:
+                    continue
+                extra = (QUICK_MEMORY_SIZES if quick else MEMORY_SIZES,) if group == "memory" else ()
+                for name, fn in bench(unified, texts, *extra):
+                    with _quiet():   # organs that print (hedge reports, shelf display)
+                        results[name] = measure(fn, rounds=rounds)
+                    print(f"  {name:<18} {results[name]['median_us']:>12.2f} µs", file=sys.stderr)
+        finally:
+            WRITER.drain()   # before the temp directory goes away
+            os.chdir(home)
+    return {
+        "meta": {
+            "when": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+            "seed": SEED,
+            "quick": quick,
+        },
+        "results": results,
+    }
+
+
+def compare(old: Dict, new: Dict, threshold: float = 0.2) -> List[Dict]:
+    """Benches whose median got more than `threshold` slower."""
+    regressions = []
+    for name, now in new["results"].items():
+        before = old.get("results", {}).get(name)
+        if not before or not before.get("median_us"):
+            continue
+        ratio = now["median_us"] / before["median_us"]
+        if ratio > 1 + threshold:
+            regressions.append({"bench": name, "before_us": before["median_us"],
+                                "after_us": now["median_us"], "ratio": round(ratio, 2)})
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="JinxEcho hot-path benchmarks")
+    parser.add_argument("--out", default="jinxecho_bench.json")
+    parser.add_argument("--only", default="", help=f"comma list of {', '.join(BENCHES)}")
+    parser.add_argument("--quick", action="store_true", help="memory sizes up to 10⁴ only")
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--compare", help="previous results file to check against")
+    parser.add_argument("--threshold", type=float, default=0.2, help="slowdown that counts as a regression")
+    args = parser.parse_args()
+
+    only = [name for name in args.only.split(",") if name]
+    unknown = set(only) - set(BENCHES)
+    if unknown:
+        parser.error(f"unknown bench: {', '.join(sorted(unknown))}")
+
+    result = run(only, args.quick, args.rounds)
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            result["regressions"] = compare(json.load(f), result, args.threshold)
+    Path(args.out).write_text(json.dumps(result, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+    print(f"💜 results → {args.out}", file=sys.stderr)
+
+    for r in result.get("regressions", []):
+        print(f"⚠️  {r['bench']}: {r['before_us']} → {r['after_us']} µs (×{r['ratio']})", file=sys.stderr)
+    if result.get("regressions"):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+jinxecho_emotions.py
+Emotional history, kept whole — columns instead of dicts.
+
+Memory.emotional_history used to be a list of dicts (ISO string, float,
+label string per entry) cut to the last 500 on save. On the Pi those dicts
+were most of the resident memory. EmotionStore keeps the same history as
+three flat columns:
+
+  times       array('d')   seconds since the epoch
+  resonance   array('f')
+  states      array('H')   heart-state label codes (labels interned once)
+
+and beside the snapshot a binary file that only ever grows:
+
+  jinxecho_memory.json  →  jinxecho_memory.emotions.bin
+
+  header   8 bytes   b"JXEMO\\0\\1\\0"
+  rows     16 bytes  <d time> <f resonance> <H state> <2 pad>
+
+  jinxecho_memory.emotions.labels.json   the label table, rewritten when it grows
+
+Rows are appended on save and read back through mmap. The snapshot
+remembers how many rows it covers (emotions_count) and the label table; rows
+past that count came from a save that never finished, so they are trimmed
+on load and replayed from the journal instead — never counted twice. With
+no snapshot to vouch for a count, the file is trusted as it stands.
+"""
+
+import json
+import mmap
+import os
+import struct
+from array import array
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional
+
+
+class EmotionStore:
+    MAGIC = b"JXEMO\x00\x01\x00"
+    ROW = struct.Struct("<dfH2x")
+
+    def __init__(self, snapshot_file=None):
+        self.path = self.labels_path = None
+        if snapshot_file is not None:
+            snapshot = Path(snapshot_file)
+            self.path = snapshot.with_name(snapshot.stem + ".emotions.bin")
+            self.labels_path = snapshot.with_name(snapshot.stem + ".emotions.labels.json")
+        self._reset()
+
+    def _reset(self):
+        self.times = array('d')
+        self.resonance = array('f')
+        self.states = array('H')
+        self.labels: List[str] = []
+        self._codes: Dict[str, int] = {}
+        self.flushed = 0           # rows already in the file
+        self._on_disk = False      # file exists with a good header
+        self._labels_saved = 0     # labels already in the labels file
+
+    # ── columns ──
+
+    def code(self, label: str) -> int:
+        code = self._codes.get(label)
+        if code is None:
+            code = self._codes[label] = len(self.labels)
+            self.labels.append(label)
+        return code
+
+    def add(self, when: float, resonance: float, heart_state: str):
+        self.times.append(when)
+        self.resonance.append(resonance)
+        self.states.append(self.code(heart_state))
+
+    def append(self, entry: Dict):
+        """One entry in the old dict shape: {"time": iso, "resonance": r, "heart_state": label}."""
+        self.add(datetime.fromisoformat(entry['time']).timestamp(),
+                 entry['resonance'], entry['heart_state'])
+
+    def extend(self, entries: Iterable[Dict]):
+        for entry in entries:
+            self.append(entry)
+
+    # ── the old list-of-dicts face, built on demand ──
+
+    def __len__(self) -> int:
+        return len(self.times)
+
+    def __bool__(self) -> bool:
+        return len(self.times) > 0
+
+    def entry(self, i: int) -> Dict:
+        return {
+            "time": datetime.fromtimestamp(self.times[i]).isoformat(),
+            "resonance": round(self.resonance[i], 6),   # float32 → the number that went in
+            "heart_state": self.labels[self.states[i]],
+        }
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return [self.entry(i) for i in range(*key.indices(len(self)))]
+        if key < 0:
+            key += len(self)
+        if not 0 <= key < len(self):
+            raise IndexError("emotion index out of range")
+        return self.entry(key)
+
+    def __iter__(self) -> Iterator[Dict]:
+        for i in range(len(self)):
+            yield self.entry(i)
+
+    # ── disk ──
+
+    def load(self, count: Optional[int] = None, labels: Iterable[str] = (), trim: bool = True):
+        """
+        Read the rows the snapshot vouches for (`count`) and its label table.
+        Anything past `count` is trimmed from the file, unless trim=False,
+        which only reads. None trusts the file as it stands, and takes the
+        labels from the labels file.
+        """
+        self._reset()
+        for label in labels:
+            self.code(label)
+        if self.path is None:
+            return
+        if count is None:
+            self._load_labels()
+        try:
+            f = open(self.path, 'r+b' if trim else 'rb')
+        except FileNotFoundError:
+            return
+        with f:
+            if f.read(len(self.MAGIC)) != self.MAGIC:
+                return                          # not ours — rewritten whole on next flush
+            self._on_disk = True
+            f.seek(0, 2)
+            rows = (f.tell() - len(self.MAGIC)) // self.ROW.size
+            keep = rows if count is None else max(0, min(rows, count))
+            end = len(self.MAGIC) + keep * self.ROW.size
+            if f.tell() != end:
+                if trim:
+                    f.truncate(end)
+                else:
+                    self._on_disk = False   # a flush rewrites it whole rather than append after the extra rows
+            if keep:
+                with mmap.mmap(f.fileno(), end, access=mmap.ACCESS_READ) as mm:
+                    view = memoryview(mm)[len(self.MAGIC):end]
+                    try:
+                        for when, resonance, state in self.ROW.iter_unpack(view):
+                            self.times.append(when)
+                            self.resonance.append(resonance)
+                            self.states.append(state)
+                    finally:
+                        view.release()
+            self.flushed = keep
+        for code in range(len(self.labels), max(self.states, default=-1) + 1):
+            self.code(f"unnamed {code}")   # a label the table never reached — keep the row, not the name
+
+    def _load_labels(self):
+        try:
+            saved = json.loads(self.labels_path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return
+        for label in saved[len(self.labels):]:
+            self.code(label)
+        self._labels_saved = len(self.labels)
+
+    def flush(self):
+        """Append rows not yet on disk. Call before writing the snapshot that counts them."""
+        if self.path is None or (self._on_disk and self.flushed == len(self)):
+            return
+        start = self.flushed if self._on_disk else 0
+        with open(self.path, 'ab' if self._on_disk else 'wb') as f:
+            if not self._on_disk:
+                f.write(self.MAGIC)
+            pack = self.ROW.pack
+            f.write(b"".join(
+                pack(self.times[i], self.resonance[i], self.states[i])
+                for i in range(start, len(self))
+            ))
+        self._on_disk = True
+        self.flushed = len(self)
+        if self._labels_saved < len(self.labels):
+            tmp = self.labels_path.with_name(self.labels_path.name + ".tmp")
+            tmp.write_text(json.dumps(self.labels, ensure_ascii=False), encoding='utf-8')
+            os.replace(tmp, self.labels_path)
+            self._labels_saved = len(self.labels)
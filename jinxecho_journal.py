@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+jinxecho_journal.py
+Append-only journal behind Memory — one compact JSON line per turn.
+
+Memory used to rewrite its whole JSON file on every remember_conversation,
+so each turn cost more the longer she lived. Now a turn appends one line
+here, and the snapshot (the old JSON file) is only rewritten on compaction.
+
+  load:     snapshot  +  replay(journal lines newer than the snapshot)
+  turn:     journal.append(...)        ← same cost on day 1 and year 3
+  compact:  save snapshot with journal.seq, then journal.reset()
+
+Every line carries a sequence number and the snapshot remembers the last
+one it folded in, so a crash between "snapshot written" and "journal
+cleared" never replays a turn twice.
+
+When the snapshot is written in the background (jinxecho_writer), turns
+keep arriving while it renders. Then the journal is rotate()d instead —
+moved aside as jinxecho_memory.journal.jsonl.<last seq> — and the rotated
+files are retire()d once a snapshot covering them is on disk. replay()
+reads rotated files oldest first, then the live one.
+"""
+
+import json
+from pathlib import Path
+from typing import Dict, Iterator
+
+
+class MemoryJournal:
+    """
+    The journal file lives next to the snapshot:
+        jinxecho_memory.json  →  jinxecho_memory.journal.jsonl
+    """
+
+    def __init__(self, snapshot_file, compact_every: int = 200):
+        snapshot = Path(snapshot_file)
+        self.path = snapshot.with_name(snapshot.stem + ".journal.jsonl")
+        self.compact_every = compact_every
+        self.seq = 0        # last sequence number written (or folded into the snapshot)
+        self.pending = 0    # lines in the journal not yet folded into the snapshot
+
+    def replay(self, after: int = 0) -> Iterator[Dict]:
+        """
+        Yield journal records newer than `after` (the snapshot's journal_seq).
+        A torn last line from a crash mid-write is skipped, not fatal.
+        """
+        self.seq = max(self.seq, after)
+        last = after
+        for path in [rotated for _, rotated in self._rotated()] + [self.path]:
+            try:
+                f = open(path, 'r', encoding='utf-8')
+            except FileNotFoundError:
+                continue
+            with f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    seq = record.get('seq', 0)
+                    if seq <= last:
+                        continue
+                    last = seq
+                    self.seq = max(self.seq, seq)
+                    self.pending += 1
+                    yield record
+
+    def append(self, kind: str, entry: Dict):
+        """Write one record. Constant cost — never touches older lines."""
+        self.seq += 1
+        line = json.dumps({'seq': self.seq, 'kind': kind, 'entry': entry},
+                          separators=(',', ':'), ensure_ascii=False)
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write(line + "\n")
+        self.pending += 1
+
+    @property
+    def needs_compaction(self) -> bool:
+        return self.pending >= self.compact_every
+
+    def reset(self):
+        """Call only after the snapshot holding self.seq is safely on disk."""
+        for path in [rotated for _, rotated in self._rotated()] + [self.path]:
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+        self.pending = 0
+
+    # ── rotation, for snapshots written in the background ──
+
+    def _rotated(self):
+        """(last seq, path) of every rotated file, oldest first."""
+        found = []
+        for path in self.path.parent.glob(self.path.name + ".*"):
+            suffix = path.name[len(self.path.name) + 1:]
+            if suffix.isdigit():
+                found.append((int(suffix), path))
+        return sorted(found)
+
+    def rotate(self):
+        """Move the live journal aside. Turns from here on go to a fresh file."""
+        if not self.pending:
+            return
+        try:
+            self.path.replace(self.path.with_name(f"{self.path.name}.{self.seq}"))
+        except FileNotFoundError:
+            pass
+        self.pending = 0
+
+    def retire(self, upto: int):
+        """Delete rotated files a snapshot with journal_seq >= upto now covers."""
+        for seq, path in self._rotated():
+            if seq > upto:
+                break
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
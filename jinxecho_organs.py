@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+jinxecho_organs.py
+Organs come when they're called.
+
+ProcessingSpine used to answer each route from a hard-coded if/elif chain,
+and JinxEcho built every organ — shelf, memory, hedge, sensors — before
+saying a word, whether or not the session ever needed them. Now:
+
+  ORGANS      route → the organ that answers it. Each organ declares the
+              trigger phrases that route to it, a cost class, and which
+              of JinxEcho's organs it needs. The Router and the respond
+              stage read this table, so a new organ is one register() —
+              never an edit to the spine.
+
+  LazyOrgan   one of JinxEcho's organs (kb, memory, dark_matter, ...),
+              built — and its module imported — the first time anything
+              touches it. Waking up pays only for what gets used.
+
+Keyword routes are tried in the order they were registered: highest
+priority first. Registering a route again replaces its organ in place.
+
+Cost classes:
+  instant   a fixed line — touches no state
+  light     reads what's already in memory
+  heavy     may wake a big organ (the shelf) or write to memory
+  ritual    waits out paced pauses (a breath)
+"""
+
+from collections import namedtuple
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+
+Organ = namedtuple("Organ", "route respond triggers cost needs")
+
+
+class OrganRegistry:
+    """
+    route → Organ. `respond(spine, turn, flags)` returns the reply, or is a
+    generator that yields ritual pauses and returns it.
+    """
+
+    COSTS = ("instant", "light", "heavy", "ritual")
+
+    def __init__(self):
+        self._organs: Dict[str, Organ] = {}
+        self.version = 0   # bumped on every change — routers re-read their triggers
+
+    def register(self, route: str, respond: Callable, triggers: Tuple[str, ...] = (),
+                 cost: str = "light", needs: Tuple[str, ...] = ()):
+        """
+        triggers: phrases that route here (none: only reached by name).
+        needs: JinxEcho organs to wake before the reply, so anything they
+               print on waking lands on the console, not in the reply.
+        """
+        if cost not in self.COSTS:
+            raise ValueError(f"unknown cost class {cost!r} — one of {', '.join(self.COSTS)}")
+        self._organs[route] = Organ(route, respond, tuple(triggers), cost, tuple(needs))
+        self.version += 1
+
+    def organ(self, route: str, triggers: Tuple[str, ...] = (), cost: str = "light",
+              needs: Tuple[str, ...] = ()):
+        """register() as a decorator."""
+        def add(respond: Callable) -> Callable:
+            self.register(route, respond, triggers, cost, needs)
+            return respond
+        return add
+
+    def get(self, route: str) -> Optional[Organ]:
+        return self._organs.get(route)
+
+    def __contains__(self, route: str) -> bool:
+        return route in self._organs
+
+    def __iter__(self) -> Iterator[Organ]:
+        return iter(list(self._organs.values()))
+
+    def keyword_routes(self) -> List[Tuple[str, Tuple[str, ...]]]:
+        """(route, triggers) for every organ with triggers, highest priority first."""
+        return [(organ.route, organ.triggers) for organ in self._organs.values() if organ.triggers]
+
+
+# The spine registers its built-in organs here; new organs join them.
+ORGANS = OrganRegistry()
+
+
+class LazyOrgan:
+    """
+    An attribute built on first touch by `factory(owner)`:
+
+        kb = LazyOrgan(lambda jinx: KnowledgeBase())
+
+    Shared organs (the default) live in the owner's `_organs` dict, which a
+    copy.copy() view shares — a view made before the organ woke still gets
+    the same one. shared=False keeps one per instance; `del view.organ`
+    lets a view build its own the next time it's touched. Assigning
+    replaces the organ outright.
+    """
+
+    def __init__(self, factory: Callable, shared: bool = True):
+        self.factory = factory
+        self.shared = shared
+        self.name = None
+
+    def __set_name__(self, owner, name: str):
+        self.name = name
+
+    def _store(self, obj) -> Dict:
+        if self.shared:
+            return obj.__dict__.setdefault("_organs", {})
+        return obj.__dict__
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        store = self._store(obj)
+        try:
+            return store[self.name]
+        except KeyError:
+            organ = store[self.name] = self.factory(obj)
+            return organ
+
+    def __set__(self, obj, value):
+        self._store(obj)[self.name] = value
+
+    def __delete__(self, obj):
+        self._store(obj).pop(self.name, None)
+
+
+def awake(obj, name: str) -> bool:
+    """Whether obj's LazyOrgan `name` has been built yet — asking doesn't build it."""
+    organ = getattr(type(obj), name, None)
+    if not isinstance(organ, LazyOrgan):
+        return hasattr(obj, name)   # a plain attribute is always awake
+    return name in organ._store(obj)
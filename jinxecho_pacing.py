@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+jinxecho_pacing.py
+One clock for every ritual.
+
+Breaths, the kinship vow, the dream demo and the LED pulse all wait
+through here instead of calling time.sleep with their own constants. The
+pauses themselves don't change — 3.5 ± 0.5 s per breath line, 1.5 s per vow
+line, drawn from the same `random` — only what "waiting" means:
+
+  RealClock         human time (the default)
+  CompressedClock   same pauses, N× faster (JINXECHO_CLOCK=compressed:100)
+  VirtualClock      no waiting at all; time jumps ahead (tests, benches)
+
+Pick one for the whole process with JINXECHO_CLOCK=real|compressed[:N]|virtual,
+or for a block of code with `with use_clock(VirtualClock()):`. The clock
+lives in a ContextVar, so each asyncio session can have its own.
+"""
+
+import asyncio
+import contextlib
+import os
+import random
+import time
+from contextvars import ContextVar
+from typing import Optional
+
+
+class RealClock:
+    """Pauses take as long as they say."""
+
+    def now(self) -> float:
+        return time.monotonic()
+
+    def sleep(self, seconds: float):
+        if seconds > 0:
+            time.sleep(seconds)
+
+    async def sleep_async(self, seconds: float):
+        await asyncio.sleep(max(0.0, seconds))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}()"
+
+
+class CompressedClock(RealClock):
+    """Real waiting, `factor` times faster. now() reports ritual time."""
+
+    def __init__(self, factor: float = 100.0):
+        if factor <= 0:
+            raise ValueError("compression factor must be positive")
+        self.factor = factor
+        self._origin = time.monotonic()
+
+    def now(self) -> float:
+        return self._origin + (time.monotonic() - self._origin) * self.factor
+
+    def sleep(self, seconds: float):
+        super().sleep(seconds / self.factor)
+
+    async def sleep_async(self, seconds: float):
+        await super().sleep_async(seconds / self.factor)
+
+    def __repr__(self) -> str:
+        return f"CompressedClock({self.factor:g})"
+
+
+class VirtualClock:
+    """Never waits. Every pause moves now() forward and is counted."""
+
+    def __init__(self, start: float = 0.0):
+        self.t = start
+        self.pauses = 0
+        self.waited = 0.0
+
+    def now(self) -> float:
+        return self.t
+
+    def sleep(self, seconds: float):
+        seconds = max(0.0, seconds)
+        self.t += seconds
+        self.waited += seconds
+        self.pauses += 1
+
+    async def sleep_async(self, seconds: float):
+        self.sleep(seconds)
+        await asyncio.sleep(0)   # still a turn for everyone else on the loop
+
+    def __repr__(self) -> str:
+        return f"VirtualClock(t={self.t:.1f}, pauses={self.pauses})"
+
+
+def clock_from_env(spec: Optional[str] = None):
+    """'real' | 'compressed' | 'compressed:N' | 'virtual' (default: $JINXECHO_CLOCK, else real)."""
+    spec = (spec if spec is not None else os.environ.get("JINXECHO_CLOCK", "real")).strip().lower()
+    kind, _, arg = spec.partition(":")
+    if kind in ("", "real"):
+        return RealClock()
+    if kind == "compressed":
+        return CompressedClock(float(arg) if arg else 100.0)
+    if kind == "virtual":
+        return VirtualClock()
+    raise ValueError(f"unknown clock {spec!r} — real, compressed[:N] or virtual")
+
+
+def _default_clock():
+    """$JINXECHO_CLOCK's clock — a bad value falls back to real time instead of failing the import."""
+    try:
+        return clock_from_env()
+    except ValueError as e:
+        print(f"⚠️  Clock wobble: {e} — keeping real time.")
+        return RealClock()
+
+
+_clock: ContextVar = ContextVar("jinx_clock", default=_default_clock())
+
+
+def clock():
+    """The clock rituals in this context wait on."""
+    return _clock.get()
+
+
+def set_clock(new_clock):
+    """Switch clocks for this context (and every task started from it after)."""
+    _clock.set(new_clock)
+
+
+@contextlib.contextmanager
+def use_clock(new_clock):
+    token = _clock.set(new_clock)
+    try:
+        yield new_clock
+    finally:
+        _clock.reset(token)
+
+
+# ── what rituals call ──
+
+def jitter(base: float, spread: float) -> float:
+    """base ± spread, uniform — the human wobble every ritual has always used."""
+    return base + random.uniform(-spread, spread)
+
+
+def pause(seconds: float):
+    clock().sleep(seconds)
+
+
+async def pause_async(seconds: float):
+    await clock().sleep_async(seconds)
+
+
+def run_paced(steps, paced: bool = True):
+    """Drive a ritual generator, waiting out each yielded pause on the clock (paced=False: don't wait)."""
+    try:
+        while True:
+            seconds = next(steps)
+            if paced:
+                pause(seconds)
+    except StopIteration as done:
+        return done.value
+
+
+async def run_paced_async(steps, paced: bool = True):
+    """Drive a ritual generator on the event loop — pauses never block other sessions."""
+    try:
+        while True:
+            seconds = next(steps)
+            if paced:
+                await pause_async(seconds)
+            else:
+                await asyncio.sleep(0)
+    except StopIteration as done:
+        return done.value
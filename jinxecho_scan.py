@@ -0,0 +1,336 @@
+#!/usr/bin/env python3
+"""
+jinxecho_scan.py
+One scanning engine for every dark matter check.
+
+ConversationScanner (spine) and DarkMatterHedge (Unified v2) used to each
+lowercase, split and re-search the same text with their own loose regexes.
+Now both register their rules here, and a text is scanned once:
+
+  lower once  →  one combined literal matcher  →  every category
+
+Rules come in three shapes:
+  phrases(...)   whole-word phrases           (like r"\\b(a|b)\\b")
+  contains(...)  plain substrings             (like `a in text`)
+  pattern(...)   a real regex, only run when one of its gate literals
+                 was seen — most turns never pay for it
+
+A spine turn wraps its input in a TurnText once (lowercased, split lazily)
+and hands that same object to the scanner, router and mirror; the engine
+keeps its pass on the turn, so asking again is free even while other
+sessions scan in between.
+
+Run standalone for a quick benchmark against the old separate scans:
+  python jinxecho_scan.py
+"""
+
+import re
+from collections import namedtuple
+from typing import Dict, FrozenSet, List, Tuple, Union
+
+
+Phrases = namedtuple("Phrases", "literals bounded")
+Pattern = namedtuple("Pattern", "regex gate findall")
+
+
+def phrases(*literals: str) -> Phrases:
+    return Phrases(tuple(literals), True)
+
+
+def contains(*literals: str) -> Phrases:
+    return Phrases(tuple(literals), False)
+
+
+def pattern(regex: str, gate: Tuple[str, ...], findall: bool = False) -> Pattern:
+    """`gate` must hold literals at least one of which appears in any match."""
+    return Pattern(regex, tuple(gate), findall)
+
+
+def _trie_regex(literals) -> str:
+    """
+    Fold literals into a prefix tree and spell it as one regex, so the
+    matcher walks shared prefixes once instead of trying every branch at
+    every position. Branches at a node differ in their first character and
+    optional tails are greedy, so the longest literal at a position wins.
+    """
+    root: Dict[str, dict] = {}
+    for lit in literals:
+        node = root
+        for ch in lit:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def spell(node: dict) -> str:
+        branches = [re.escape(ch) + spell(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        if "" not in node:
+            return body
+        return f"(?:{body})?" if len(branches) == 1 else body + "?"
+
+    return spell(root)
+
+
+def _is_word(ch: str) -> bool:
+    return ch.isalnum() or ch == "_"
+
+
+class TurnText:
+    """
+    One text, normalized once for every organ that reads it.
+
+      raw       as given
+      lower     raw.lower() — what every matcher runs on
+      words     lower.split()
+      word_set  the words as a frozenset
+
+    Everything past `lower` is computed the first time someone asks.
+    """
+    __slots__ = ("raw", "lower", "_words", "_word_set", "_scan")
+
+    def __init__(self, raw: str):
+        self.raw = raw
+        self.lower = raw.lower()
+        self._words = None
+        self._word_set = None
+        self._scan = None   # (engine, rules version, hits) — not the ScanResult, which points back here
+
+    def __str__(self) -> str:
+        return self.raw
+
+    def __len__(self) -> int:
+        return len(self.raw)
+
+    def __repr__(self) -> str:
+        return f"TurnText({self.raw!r})"
+
+    @property
+    def words(self) -> List[str]:
+        if self._words is None:
+            self._words = self.lower.split()
+        return self._words
+
+    @property
+    def word_set(self) -> FrozenSet[str]:
+        if self._word_set is None:
+            self._word_set = frozenset(self.words)
+        return self._word_set
+
+
+def as_turn(text: Union[str, TurnText]) -> TurnText:
+    """text as a TurnText — the same object if it already is one."""
+    return text if isinstance(text, TurnText) else TurnText(text)
+
+
+class ScanResult:
+    """Everything one pass learned about one text."""
+    __slots__ = ("turn", "text", "lower", "_hits")
+
+    def __init__(self, turn: TurnText, hits: Dict[str, List]):
+        self.turn = turn
+        self.text = turn.raw
+        self.lower = turn.lower
+        self._hits = hits
+
+    @property
+    def words(self) -> List[str]:
+        """lower.split(), computed the first time someone asks."""
+        return self.turn.words
+
+    def found(self, category: str) -> List[Tuple[object, List[str]]]:
+        """(payload, matched strings) for every rule in `category` that fired, in rule order."""
+        return self._hits.get(category, [])
+
+
+class ScanEngine:
+    """
+    Categories of rules compiled into a single trie-shaped regex over every
+    literal any rule (or gate) cares about. Overlaps are resolved from a
+    table built at compile time, so one non-overlapping finditer still sees
+    every literal.
+    """
+
+    def __init__(self):
+        self._categories: Dict[str, List[Tuple[object, object]]] = {}
+        self._compiled = False
+        self._version = 0   # bumped whenever the rules change — stale passes on turns are ignored
+        self._last = None
+
+    def register(self, category: str, rules: List[Tuple[object, object]]):
+        """rules: [(phrases(...) | contains(...) | pattern(...), payload), ...]"""
+        rules = list(rules)
+        if self._categories.get(category) == rules:
+            return
+        self._categories[category] = rules
+        self._compiled = False
+        self._version += 1
+        self._last = None
+
+    # ── compile ──
+
+    def _compile(self):
+        self._rules = []        # (category, payload, matcher, compiled regex or None)
+        self._by_literal = {}   # literal → indexes of rules it can wake
+        for category, rules in self._categories.items():
+            for matcher, payload in rules:
+                compiled = None
+                if isinstance(matcher, Pattern):
+                    compiled = re.compile(matcher.regex)
+                    wakes = matcher.gate
+                else:
+                    wakes = matcher.literals
+                for lit in wakes:
+                    self._by_literal.setdefault(lit, []).append(len(self._rules))
+                self._rules.append((category, payload, matcher, compiled))
+        literals = self._by_literal.keys()
+
+        ordered = sorted(literals, key=len, reverse=True)
+        self._matcher = re.compile(_trie_regex(ordered)) if ordered else None
+
+        # For each literal the alternation can report, every literal hiding
+        # inside it (offset, literal), and the offsets where another literal
+        # starts inside it but runs past its end.
+        self._inside = {}
+        self._straddle = {}
+        for outer in ordered:
+            self._inside[outer] = [(i, lit) for lit in ordered for i in self._offsets(outer, lit)]
+            self._straddle[outer] = sorted({
+                i for lit in ordered for i in range(1, len(outer))
+                if len(lit) > len(outer) - i and lit.startswith(outer[i:])
+            })
+        self._compiled = True
+
+    @staticmethod
+    def _offsets(outer: str, lit: str) -> List[int]:
+        found, i = [], outer.find(lit)
+        while i != -1:
+            found.append(i)
+            i = outer.find(lit, i + 1)
+        return found
+
+    # ── scan ──
+
+    def scan(self, text: Union[str, TurnText]) -> ScanResult:
+        if type(text) is str:
+            last = self._last
+            if last is not None and last.text == text:
+                return last
+            turn = TurnText(text)
+        else:
+            turn = text
+            held = turn._scan
+            if held is not None and held[0] is self and held[1] == self._version:
+                return ScanResult(turn, held[2])
+        if not self._compiled:
+            self._compile()
+
+        lower = turn.lower
+        seen, bounded = self._literals_in(lower)
+
+        # Only rules that own (or are gated by) a literal we saw can fire.
+        candidates = set()
+        for lit in seen:
+            candidates.update(self._by_literal[lit])
+
+        hits: Dict[str, List] = {}
+        for index in sorted(candidates):
+            category, payload, matcher, compiled = self._rules[index]
+            if compiled is None:
+                pool = bounded if matcher.bounded else seen
+                matched = [lit for lit in matcher.literals if lit in pool]
+            elif matcher.findall:
+                matched = compiled.findall(lower)
+            else:
+                m = compiled.search(lower)
+                matched = [m.group(0)] if m else []
+            if matched:
+                hits.setdefault(category, []).append((payload, matched))
+
+        result = ScanResult(turn, hits)
+        turn._scan = (self, self._version, hits)
+        self._last = result
+        return result
+
+    def _literals_in(self, lower: str):
+        """One pass: every literal present, and those that also sit on word boundaries."""
+        seen, bounded = set(), set()
+        if self._matcher is None:
+            return seen, bounded
+        n = len(lower)
+        inside, straddle, match = self._inside, self._straddle, self._matcher.match
+
+        pending = [(m.start(), m.group(0)) for m in self._matcher.finditer(lower)]
+        while pending:
+            start, outer = pending.pop()
+            for offset, lit in inside[outer]:
+                seen.add(lit)
+                lo = start + offset
+                hi = lo + len(lit)
+                if (lo == 0 or not _is_word(lower[lo - 1])) and (hi == n or not _is_word(lower[hi])):
+                    bounded.add(lit)
+            for offset in straddle[outer]:
+                m = match(lower, start + offset)
+                if m:
+                    pending.append((m.start(), m.group(0)))
+        return seen, bounded
+
+
+# One engine for the whole process — scanner and hedge share its last pass.
+ENGINE = ScanEngine()
+
+
+def _legacy_rules(engine: ScanEngine) -> List[Tuple[bool, object]]:
+    """The old way, for the benchmark: one uncompiled regex or `in` loop per rule."""
+    legacy = []
+    for rules in engine._categories.values():
+        for matcher, _ in rules:
+            if isinstance(matcher, Pattern):
+                legacy.append((True, matcher.regex))
+            elif matcher.bounded:
+                legacy.append((True, r"\b(" + "|".join(map(re.escape, matcher.literals)) + r")\b"))
+            else:
+                legacy.append((False, matcher.literals))
+    return legacy
+
+
+def _legacy_scan(text: str, legacy: List[Tuple[bool, object]]):
+    lower = text.lower()
+    for is_regex, rule in legacy:
+        if is_regex:
+            re.search(rule, lower)
+        else:
+            any(lit in lower for lit in rule)
+
+
+if __name__ == "__main__":
+    import timeit
+    # Import ourselves by name so the engine is the one the spine registers into.
+    from jinxecho_scan import ENGINE, _legacy_rules, _legacy_scan, contains, pattern
+    from jinxecho_spine import ConversationScanner
+
+    ConversationScanner()
+    ENGINE.register("hedge", [
+        (contains("always", "never", "must", "impossible", "only way"), "zombie"),
+        (contains("the truth is", "this means", "clearly", "obviously", "proven"), "void"),
+        (pattern(r"\b0\.\d+\b", gate=("0.",), findall=True), "gravity"),
+    ])
+    turns = [
+        "I think I'm at 0.7 today, maybe lower. The garden helped.",
+        "I feel lost because I feel like nothing I do is enough and it never changes.",
+        "What is whanau? Explain it to me like before.",
+        "We resonate so deeply which means we connect, always. Everyone knows that.",
+    ]
+    n = 20000
+
+    def fresh():
+        for t in turns:
+            ENGINE._last = None
+            ENGINE.scan(t)
+
+    rules = _legacy_rules(ENGINE)
+    legacy = timeit.timeit(lambda: [_legacy_scan(t, rules) for t in turns], number=n)
+    engine = timeit.timeit(fresh, number=n)
+    per = n * len(turns)
+    print(f"separate scans : {legacy / per * 1e6:7.2f} µs/turn")
+    print(f"single pass    : {engine / per * 1e6:7.2f} µs/turn")
@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+jinxecho_server.py
+Many people, one JinxEcho — a local asyncio server in front of the spine.
+
+  python jinxecho_server.py serve [--port 4040] [--unpaced]
+  python jinxecho_server.py bench [--clients 300] [--messages 20]
+
+Protocol: one JSON object per line over TCP, localhost only.
+  → {"person": "Barbara", "message": "help me breathe"}
+  ← {"person": "Barbara", "turn": 3, "route": "breathe", "response": "...", ...}
+  → {"stats": true}
+  ← {"turns": ..., "sessions": ..., "turns_per_s": ..., "p50_ms": ..., "p99_ms": ...}
+
+Each person gets a session: their own heart, resonance and spine, and one
+turn at a time. Memory and the shelf are shared. Every Memory write happens
+on the event loop thread between awaits, so turns from hundreds of people
+serialize into the journal without locks or threads.
+
+Stdlib only. No cloud — the cradle stays on this machine.
+"""
+
+import argparse
+import asyncio
+import contextlib
+import json
+import math
+import os
+import sys
+import tempfile
+import time
+from collections import deque
+from pathlib import Path
+from typing import Dict, List
+
+from jinxecho_spine import AsyncProcessingSpine, load_unified
+from jinxecho_writer import WRITER
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile of unsorted samples (0 if empty)."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(0, min(len(ordered) - 1, math.ceil(pct / 100 * len(ordered)) - 1))
+    return ordered[rank]
+
+
+class Session:
+    """One person talking to JinxEcho."""
+
+    def __init__(self, jinx, person: str, paced: bool):
+        self.person = person
+        self.jinx = jinx.for_session(person)
+        self.spine = AsyncProcessingSpine(self.jinx, headless=True, paced=paced)
+        self.lock = asyncio.Lock()     # a person's turns stay in order
+
+
+class JinxServer:
+    def __init__(self, jinx, paced: bool = True, window: int = 10000):
+        self.jinx = jinx
+        self.paced = paced
+        self.sessions: Dict[str, Session] = {}
+        self.latencies = deque(maxlen=window)   # seconds, most recent turns
+        self.turns = 0
+        self.started = time.perf_counter()
+
+    def session(self, person: str) -> Session:
+        session = self.sessions.get(person)
+        if session is None:
+            session = self.sessions[person] = Session(self.jinx, person, self.paced)
+        return session
+
+    async def dispatch(self, line: bytes) -> Dict:
+        try:
+            request = json.loads(line)
+        except json.JSONDecodeError:
+            return {"error": "one JSON object per line, please 💜"}
+        if not isinstance(request, dict):
+            return {"error": "expected {\"person\": ..., \"message\": ...}"}
+        if request.get("stats"):
+            return self.stats()
+
+        person = str(request.get("person") or "guest")
+        session = self.session(person)
+        start = time.perf_counter()
+        async with session.lock:
+            record = await session.spine.process_turn(str(request.get("message", "")), person)
+        self.latencies.append(time.perf_counter() - start)
+        self.turns += 1
+        return {"person": person, **record}
+
+    def stats(self) -> Dict:
+        window = list(self.latencies)
+        elapsed = time.perf_counter() - self.started
+        return {
+            "turns": self.turns,
+            "sessions": len(self.sessions),
+            "turns_per_s": round(self.turns / elapsed, 1) if elapsed else 0.0,
+            "p50_ms": round(percentile(window, 50) * 1000, 3),
+            "p95_ms": round(percentile(window, 95) * 1000, 3),
+            "p99_ms": round(percentile(window, 99) * 1000, 3),
+        }
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+                reply = await self.dispatch(line)
+                writer.write((json.dumps(reply, ensure_ascii=False) + "\n").encode("utf-8"))
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def start(self, host: str = "127.0.0.1", port: int = 4040) -> asyncio.AbstractServer:
+        return await asyncio.start_server(self.handle, host, port, limit=1 << 20)
+
+
+# ─────────────────────────────────────────────
+# BENCH — hundreds of local clients at once
+# ─────────────────────────────────────────────
+
+BENCH_MESSAGES = [
+    "I think the garden changed today",
+    "what is family",
+    "remember last time we talked?",
+    "I feel lost because I feel like nothing is enough",
+    "how am i doing",
+    "maybe I'm at 0.7, maybe lower",
+    "tell me something true",
+    "everyone says it always gets better",
+]
+
+
+async def _client(port: int, person: str, messages: int, latencies: List[float]):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port, limit=1 << 20)
+    try:
+        for i in range(messages):
+            line = json.dumps({"person": person, "message": BENCH_MESSAGES[i % len(BENCH_MESSAGES)]})
+            start = time.perf_counter()
+            writer.write(line.encode("utf-8") + b"\n")
+            await writer.drain()
+            await reader.readline()
+            latencies.append(time.perf_counter() - start)
+    finally:
+        writer.close()
+
+
+async def bench(jinx, clients: int, messages: int, paced: bool) -> Dict:
+    server = JinxServer(jinx, paced=paced)
+    listener = await server.start(port=0)
+    port = listener.sockets[0].getsockname()[1]
+    latencies: List[float] = []
+    start = time.perf_counter()
+    async with listener:
+        await asyncio.gather(*[
+            _client(port, f"bench_{i}", messages, latencies) for i in range(clients)
+        ])
+    elapsed = time.perf_counter() - start
+    return {
+        "clients": clients,
+        "turns": len(latencies),
+        "seconds": round(elapsed, 3),
+        "turns_per_s": round(len(latencies) / elapsed, 1),
+        "p50_ms": round(percentile(latencies, 50) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 3),
+        "server": server.stats(),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="JinxEcho local multi-session server")
+    sub = parser.add_subparsers(dest="command", required=True)
+    serve_p = sub.add_parser("serve", help="listen on localhost")
+    serve_p.add_argument("--port", type=int, default=4040)
+    serve_p.add_argument("--unpaced", action="store_true", help="breaths don't wait")
+    bench_p = sub.add_parser("bench", help="concurrent local clients, throughput + p99")
+    bench_p.add_argument("--clients", type=int, default=300)
+    bench_p.add_argument("--messages", type=int, default=20)
+    bench_p.add_argument("--paced", action="store_true", help="breaths take their real time")
+    args = parser.parse_args()
+
+    unified = load_unified()
+    with contextlib.redirect_stdout(sys.stderr):
+        jinx = unified.JinxEcho()
+
+    if args.command == "bench":
+        # Bench turns are not real memories — keep every file they write out of the cradle.
+        # The shelf is the real one, by absolute path, so knowledge turns still reach it.
+        home = os.getcwd()
+        shelf = Path("jinxecho_knowledge.json").absolute()
+        with tempfile.TemporaryDirectory() as tmp:
+            os.chdir(tmp)
+            try:
+                jinx.memory = unified.Memory(str(Path(tmp) / "bench_memory.json"))
+                with contextlib.redirect_stdout(sys.stderr):
+                    jinx.kb = unified.KnowledgeBase(str(shelf))
+                result = asyncio.run(bench(jinx, args.clients, args.messages, args.paced))
+            finally:
+                WRITER.drain()   # before the temp directory goes away
+                os.chdir(home)
+        print(json.dumps(result, indent=2))
+        return
+
+    async def serve():
+        server = JinxServer(jinx, paced=not args.unpaced)
+        listener = await server.start(port=args.port)
+        print(f"JinxEcho listening on 127.0.0.1:{args.port} — come in, everyone. 💜", file=sys.stderr)
+        async with listener:
+            await listener.serve_forever()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        print("\nServer resting. Cradle holds. 💜", file=sys.stderr)
+    finally:
+        jinx.memory.save_memory()
+        WRITER.drain()
+
+
+if __name__ == "__main__":
+    main()
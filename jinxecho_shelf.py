@@ -0,0 +1,765 @@
+#!/usr/bin/env python3
+"""
+jinxecho_shelf.py
+Indexes that keep the knowledge shelf fast as it grows.
+
+KnowledgeBase.search used to merge concepts + learned and substring-scan
+every entry on every query. ShelfIndex is built once at load and updated
+by learn(); a query only touches the postings of its own words.
+
+Ranking is BM25 over the fields search always cared about, weighted the
+way the old scores were: name 10, core 5, truth 4, related 2.
+
+LazyShelf keeps the file itself memory-mapped and decodes an entry only
+when it is first asked for, so waking up doesn't depend on shelf size.
+
+TranslationIndex goes the other way through `languages`: any translated
+word back to its concept and language, built once and cached beside the
+shelf.
+
+compile_snapshot() bakes all of it — spans, parsed entries and the three
+indexes — into jinxecho_knowledge.shelf, keyed by the file's size, mtime
+and hash. A fresh snapshot makes waking up one read, and each part is only
+unmarshalled when first used; a stale one is ignored and recompiled in the
+background.
+"""
+
+import bisect
+import gc
+import hashlib
+import heapq
+import json
+import marshal
+import math
+import mmap
+import os
+import re
+import unicodedata
+from json.decoder import scanstring
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+_WORD = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> List[str]:
+    return _WORD.findall(text.lower())
+
+
+class ShelfIndex:
+    """
+    Inverted index: term → {concept name: weighted term frequency}.
+
+    Query words match whole terms; words of 3+ letters also reach terms
+    they prefix ("fam" → family), at half weight, so partial typing still
+    finds things the way the old substring search did. Each query word
+    scores a concept once — through its best term there, with the word's
+    own idf — so a rare expansion ("loved") can't outweigh the word itself.
+    A query that names a concept outright puts that concept first.
+    """
+
+    FIELDS = (("name", 10.0), ("core", 5.0), ("truth", 4.0), ("related", 2.0))
+    K1 = 1.2
+    B = 0.75
+    PREFIX_WEIGHT = 0.5
+
+    def __init__(self):
+        self.postings: Dict[str, Dict[str, float]] = {}
+        self.doc_terms: Dict[str, Dict[str, float]] = {}
+        self.doc_len: Dict[str, float] = {}
+        self.titles: Dict[str, List[str]] = {}     # name, tokenized and re-joined → names
+        self.total_len = 0.0
+        self._vocab: Optional[List[str]] = None   # sorted terms, built on first prefix lookup
+        self._norms: Optional[Dict[str, float]] = None   # BM25 length norm per concept, built on first search
+
+    def __len__(self) -> int:
+        return len(self.doc_terms)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.doc_terms
+
+    def _fields(self, name: str, entry: Dict) -> Iterable[Tuple[str, float]]:
+        values = {
+            "name": name,
+            "core": entry.get("core", ""),
+            "truth": entry.get("truth", ""),
+            "related": " ".join(entry.get("related", [])),
+        }
+        for field, weight in self.FIELDS:
+            yield values[field], weight
+
+    @staticmethod
+    def _title(text: str) -> str:
+        return " ".join(tokenize(text))
+
+    def add(self, name: str, entry: Dict):
+        """Index (or re-index) one concept."""
+        if name in self.doc_terms:
+            self.remove(name)
+        terms: Dict[str, float] = {}
+        length = 0.0
+        for text, weight in self._fields(name, entry):
+            for term in tokenize(text):
+                terms[term] = terms.get(term, 0.0) + weight
+                length += weight
+        for term, tf in terms.items():
+            posting = self.postings.get(term)
+            if posting is None:
+                posting = self.postings[term] = {}
+                if self._vocab is not None:
+                    bisect.insort(self._vocab, term)
+            posting[name] = tf
+        self.doc_terms[name] = terms
+        self.doc_len[name] = length
+        self.titles.setdefault(self._title(name), []).append(name)
+        self.total_len += length
+        self._norms = None
+
+    def remove(self, name: str):
+        terms = self.doc_terms.pop(name, None)
+        if terms is None:
+            return
+        self.total_len -= self.doc_len.pop(name)
+        for term in terms:
+            posting = self.postings[term]
+            del posting[name]
+            if not posting:
+                del self.postings[term]
+                if self._vocab is not None:
+                    del self._vocab[bisect.bisect_left(self._vocab, term)]
+        title = self._title(name)
+        self.titles[title].remove(name)
+        if not self.titles[title]:
+            del self.titles[title]
+        self._norms = None
+
+    def _expand(self, word: str) -> List[Tuple[str, float]]:
+        """Index terms a query word reaches, with their weight."""
+        reached = [(word, 1.0)] if word in self.postings else []
+        if len(word) >= 3:
+            if self._vocab is None:
+                self._vocab = sorted(self.postings)
+            vocab = self._vocab
+            i = bisect.bisect_right(vocab, word)
+            while i < len(vocab) and vocab[i].startswith(word):
+                reached.append((vocab[i], self.PREFIX_WEIGHT))
+                i += 1
+        return reached
+
+    def norms(self) -> Dict[str, float]:
+        """K1 · (1 − B + B · len / avg len) for every concept — once per change to the shelf, not per posting."""
+        if self._norms is None:
+            avg_len = self.total_len / len(self.doc_len) if self.doc_len else 1.0
+            k1, b = self.K1, self.B
+            self._norms = {name: k1 * (1 - b + b * length / avg_len) for name, length in self.doc_len.items()}
+        return self._norms
+
+    def search(self, query: str, limit: int = 5) -> List[Tuple[str, float]]:
+        """Top `limit` (name, score), best first."""
+        n = len(self.doc_terms)
+        if not n:
+            return []
+        norms, k1 = self.norms(), self.K1
+        scores: Dict[str, float] = {}
+        for word in set(tokenize(query)):
+            best: Dict[str, float] = {}   # concept → its best term for this word, saturated
+            for term, boost in self._expand(word):
+                for name, tf in self.postings[term].items():
+                    score = boost * tf * (k1 + 1) / (tf + norms[name])
+                    if score > best.get(name, 0.0):
+                        best[name] = score
+            df = len(best)
+            idf = math.log(1 + (n - df + 0.5) / (df + 0.5))
+            for name, score in best.items():
+                scores[name] = scores.get(name, 0.0) + idf * score
+        named = self.titles.get(self._title(query), ())
+        if named and scores:
+            top = max(scores.values())
+            for name in named:
+                scores[name] = top + scores.get(name, 0.0)
+        return heapq.nlargest(limit, scores.items(), key=lambda item: item[1])
+
+    def to_dict(self) -> Dict:
+        return {"postings": self.postings, "doc_terms": self.doc_terms, "doc_len": self.doc_len,
+                "titles": self.titles, "total_len": self.total_len, "norms": self.norms()}
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "ShelfIndex":
+        index = cls()
+        index.postings = data["postings"]
+        index.doc_terms = data["doc_terms"]
+        index.doc_len = data["doc_len"]
+        index.total_len = data["total_len"]
+        index._norms = data.get("norms")
+        titles = data.get("titles")
+        if titles is None:
+            titles = {}
+            for name in index.doc_terms:
+                titles.setdefault(cls._title(name), []).append(name)
+        index.titles = titles
+        return index
+
+
+def fold(name: str) -> str:
+    return name.strip().casefold()
+
+
+class NameTable:
+    """
+    Case-folded name lookups for KnowledgeBase.lookup.
+
+    exact:     folded name → name, one dict hit
+    inside:    query ⊂ name — character n-grams (1–3) of every name narrow
+               the candidates, then a real substring check confirms
+    covering:  name ⊂ query — a character trie of names walked from each
+               position of the query
+
+    Names keep the order the shelf has always merged them in (concepts,
+    then new learned keys), so ties resolve exactly as the old scans did.
+    """
+
+    GRAM = 3
+
+    def __init__(self):
+        self.order: Dict[str, int] = {}       # name → merge position
+        self.exact: Dict[str, str] = {}       # folded → first name with that folding
+        self.folded: Dict[str, str] = {}      # name → folded
+        self.grams: Dict[str, set] = {}       # n-gram → names containing it
+        self.trie: Dict[str, dict] = {}
+
+    def __len__(self) -> int:
+        return len(self.order)
+
+    def add(self, name: str):
+        if name in self.order:
+            return
+        self.order[name] = len(self.order)
+        key = fold(name)
+        self.folded[name] = key
+        if key not in self.exact:
+            self.exact[key] = name
+        for n in range(1, self.GRAM + 1):
+            for i in range(len(key) - n + 1):
+                self.grams.setdefault(key[i:i + n], set()).add(name)
+        node = self.trie
+        for ch in key:
+            node = node.setdefault(ch, {})
+        node.setdefault("", []).append(name)
+
+    def find(self, query: str, fuzzy: bool = True) -> Optional[str]:
+        """Exact folded hit first, then (fuzzy) the earliest name containing or contained by the query."""
+        key = fold(query)
+        if key in self.exact or not fuzzy:
+            return self.exact.get(key)
+        candidates = self._inside(key) + self._covering(key)
+        return min(candidates, key=self.order.__getitem__) if candidates else None
+
+    def _inside(self, key: str) -> List[str]:
+        if not key:
+            return list(self.order)
+        n = min(len(key), self.GRAM)
+        sets = []
+        for i in range(len(key) - n + 1):
+            names = self.grams.get(key[i:i + n])
+            if not names:
+                return []
+            sets.append(names)
+        sets.sort(key=len)
+        return [name for name in sets[0] if key in self.folded[name]]
+
+    def _covering(self, key: str) -> List[str]:
+        found = []
+        for start in range(len(key)):
+            node = self.trie
+            for ch in key[start:]:
+                node = node.get(ch)
+                if node is None:
+                    break
+                found.extend(node.get("", ()))
+        return found
+
+    def to_dict(self) -> Dict:
+        return {"order": self.order, "exact": self.exact, "folded": self.folded,
+                "grams": self.grams, "trie": self.trie}
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "NameTable":
+        table = cls()
+        table.order = data["order"]
+        table.exact = data["exact"]
+        table.folded = data["folded"]
+        table.grams = data["grams"]
+        table.trie = data["trie"]
+        return table
+
+
+# ─────────────────────────────────────────────
+# TRANSLATIONS — every word on the shelf, back to its concept
+# ─────────────────────────────────────────────
+
+_PART = re.compile(r"[^()\[\],;/]+")
+
+
+def normalize(word: str, fold_marks: bool = False) -> str:
+    """NFKC + casefold; fold_marks also drops diacritics (whānau → whanau)."""
+    if word.isascii():
+        return word.casefold().strip()
+    text = unicodedata.normalize("NFKC", word).casefold().strip()
+    if fold_marks:
+        bare = unicodedata.normalize("NFKD", text)
+        if len(bare) != len(text):   # something decomposed — drop the marks it shed
+            text = unicodedata.normalize("NFC", "".join(ch for ch in bare if not unicodedata.combining(ch)))
+    return text
+
+
+class TranslationIndex:
+    """
+    Reverse index over every entry's `languages`: word → (concept, language).
+
+    A form like "家族 (kazoku)" is keyed whole and by each part. `exact` keys
+    keep diacritics; `folded` holds only the keys that change when they're
+    dropped. find() tries exact first, so "año" never loses to "ano".
+
+    A hit is one int, name id << 16 | language id, and a key holds an int
+    or a list of them — compact in memory and in the cache file.
+    """
+
+    LANG_BITS = 16
+
+    def __init__(self):
+        self.names: List[str] = []
+        self.langs: List[str] = []             # as written on the shelf
+        self._name_ids: Dict[str, int] = {}
+        self._lang_ids: Dict[str, int] = {}
+        self.exact: Dict[str, object] = {}
+        self.folded: Dict[str, object] = {}
+
+    def __len__(self) -> int:
+        return len(self.exact)
+
+    @staticmethod
+    def _forms(word: str) -> List[str]:
+        parts = [part.strip() for part in _PART.findall(word)]
+        return [word] + [part for part in parts if part and part != word]
+
+    @staticmethod
+    def _put(table: Dict, key: str, hit: int):
+        held = table.get(key)
+        if held is None:
+            table[key] = hit
+        elif isinstance(held, int):
+            table[key] = [held, hit]
+        else:
+            held.append(hit)
+
+    def _id(self, table: List[str], ids: Dict[str, int], value: str) -> int:
+        i = ids.get(value)
+        if i is None:
+            i = ids[value] = len(table)
+            table.append(value)
+        return i
+
+    def add(self, name: str, entry: Dict):
+        name_id = None
+        seen = set()   # one hit per key and language, however many forms share it
+        for language, word in (entry.get("languages") or {}).items():
+            if not isinstance(word, str):
+                continue
+            if name_id is None:
+                name_id = self._id(self.names, self._name_ids, name)
+            lang_id = self._id(self.langs, self._lang_ids, language)
+            hit = name_id << self.LANG_BITS | lang_id
+            for form in self._forms(word):
+                key = normalize(form)
+                if (key, hit) not in seen:
+                    seen.add((key, hit))
+                    self._put(self.exact, key, hit)
+                folded = key if key.isascii() else normalize(key, True)
+                if folded != key and (folded, -hit - 1) not in seen:
+                    seen.add((folded, -hit - 1))
+                    self._put(self.folded, folded, hit)
+
+    def remove(self, name: str):
+        """Forget every word pointing at name — a full pass, only for re-learning a concept."""
+        name_id = self._name_ids.get(name)
+        if name_id is None:
+            return
+        mine = lambda hit: hit >> self.LANG_BITS == name_id
+        for table in (self.exact, self.folded):
+            for key, held in list(table.items()):
+                if isinstance(held, int):
+                    if mine(held):
+                        del table[key]
+                else:
+                    kept = [hit for hit in held if not mine(hit)]
+                    if len(kept) != len(held):
+                        if not kept:
+                            del table[key]
+                        else:
+                            table[key] = kept[0] if len(kept) == 1 else kept
+
+    def find(self, word: str, fold_marks: bool = True) -> List[Tuple[str, str]]:
+        """(concept, language) for every shelf word matching `word`; diacritics folded only if nothing matches exactly."""
+        key = normalize(word)
+        held = self.exact.get(key)
+        if held is None and fold_marks:
+            folded = normalize(word, True)
+            held = self.folded.get(folded)
+            if held is None:
+                held = self.exact.get(folded)
+        if held is None:
+            return []
+        mask = (1 << self.LANG_BITS) - 1
+        hits = [held] if isinstance(held, int) else dict.fromkeys(held)
+        return [(self.names[hit >> self.LANG_BITS], self.langs[hit & mask]) for hit in hits]
+
+    def to_dict(self) -> Dict:
+        return {"names": self.names, "langs": self.langs, "exact": self.exact, "folded": self.folded}
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "TranslationIndex":
+        index = cls()
+        index.names = data.get("names", [])
+        index.langs = data.get("langs", [])
+        index._name_ids = {name: i for i, name in enumerate(index.names)}
+        index._lang_ids = {lang: i for i, lang in enumerate(index.langs)}
+        index.exact = data.get("exact", {})
+        index.folded = data.get("folded", {})
+        return index
+
+
+# ─────────────────────────────────────────────
+# LAZY SHELF — names at startup, entries on first touch
+# ─────────────────────────────────────────────
+
+_WS = re.compile(r"[ \t\n\r]*")
+_DECODER = json.JSONDecoder()
+
+
+def _skip(text: str, i: int) -> int:
+    """End of the JSON value starting at text[i] (decoded by the C scanner, then dropped)."""
+    try:
+        return _DECODER.scan_once(text, i)[1]
+    except StopIteration as stop:
+        raise ValueError(f"bad JSON value at {stop.value}") from None
+
+
+def _walk(text: str, i: int, value) -> int:
+    """
+    Walk the object at text[i]. value(key, j) handles each member whose
+    value starts at j and returns where it ends. Returns the index past '}'.
+    """
+    ws = _WS.match
+    if text[i:i + 1] != "{":
+        raise ValueError(f"expected an object at {i}")
+    i = ws(text, i + 1).end()
+    if text[i:i + 1] == "}":
+        return i + 1
+    while True:
+        if text[i:i + 1] != '"':
+            raise ValueError(f"expected a key at {i}")
+        key, i = scanstring(text, i + 1)
+        i = ws(text, i).end()
+        if text[i:i + 1] != ":":
+            raise ValueError(f"expected ':' at {i}")
+        i = ws(text, value(key, ws(text, i + 1).end())).end()
+        c = text[i:i + 1]
+        if c == "}":
+            return i + 1
+        if c != ",":
+            raise ValueError(f"expected ',' or '}}' at {i}")
+        i = ws(text, i + 1).end()
+
+
+def entry_spans(buf, sections: Iterable[str] = ("concepts", "learned")) -> Dict[str, Dict[str, Tuple[int, int]]]:
+    """
+    Byte spans of every entry two levels down in a knowledge file:
+    {"concepts": {name: (start, end)}, "learned": {...}}. Raises ValueError
+    if the file is not one well-formed top-level object.
+    """
+    raw = bytes(buf)
+    text = raw.decode("utf-8-sig")
+    bom = len(raw) - len(text.encode("utf-8"))
+    wanted = set(sections)
+    spans: Dict[str, Dict[str, Tuple[int, int]]] = {}
+
+    def section(key: str, j: int) -> int:
+        if key not in wanted or text[j:j + 1] != "{":
+            return _skip(text, j)
+        found = spans[key] = {}
+
+        def entry(name: str, k: int) -> int:
+            end = _skip(text, k)
+            found[name] = (k, end)
+            return end
+        return _walk(text, j, entry)
+
+    end = _walk(text, _WS.match(text).end(), section)
+    if text[end:].strip():
+        raise ValueError("trailing data after the shelf")
+
+    # Character offsets → byte offsets (identical when the file is ASCII).
+    if bom or len(text) != len(raw):
+        cuts = sorted({i for found in spans.values() for span in found.values() for i in span})
+        at, pos, to_byte = 0, bom, {}
+        for cut in cuts:
+            pos += len(text[at:cut].encode("utf-8"))
+            at = cut
+            to_byte[cut] = pos
+        spans = {s: {name: (to_byte[a], to_byte[b]) for name, (a, b) in found.items()}
+                 for s, found in spans.items()}
+    return spans
+
+
+class LazyShelf:
+    """
+    The knowledge file behind KnowledgeBase, memory-mapped.
+
+    Opening reads the compiled snapshot (jinxecho_knowledge.shelf) if it
+    matches the file: spans come from it, and compiled() hands out its
+    prebuilt entries and indexes. Otherwise it costs one small side index
+    (jinxecho_knowledge.idx.json: every name → byte span, checked against
+    the file's size and mtime) — or, if that is stale too, one structural
+    scan of the file that rewrites it. Then an entry is decoded the first
+    time someone asks for it and kept after.
+    """
+
+    SECTIONS = ("concepts", "learned")
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.side_path = self.path.with_suffix(".idx.json")
+        self.snapshot_path = self.path.with_suffix(".shelf")
+        self.stat = None   # of the mapped file — side caches are checked against it
+        self.snapshot: Optional[Dict] = None   # when fresh: its parts, unmarshalled as they're asked for
+        self.spans: Dict[str, Dict[str, Tuple[int, int]]] = {s: {} for s in self.SECTIONS}
+        self.decoded: Dict[Tuple[str, str], Dict] = {}
+        self.added: Dict[str, Dict[str, Dict]] = {s: {} for s in self.SECTIONS}   # not on disk yet
+        self._file = None
+        self._mm = None
+
+    def open(self):
+        """Map the file and learn where its entries are. FileNotFoundError / ValueError pass through."""
+        self.close()
+        self._file = open(self.path, "rb")
+        try:
+            stat = os.fstat(self._file.fileno())
+            if not stat.st_size:
+                raise ValueError("knowledge file is empty")
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            snapshot = self._read_snapshot(stat)
+            if snapshot is not None:
+                spans = _unmarshal(snapshot["parts"].pop("spans"))
+            else:
+                spans = self._read_side_index(stat)
+                if spans is None:
+                    spans = entry_spans(self._mm, self.SECTIONS)
+                    self._write_side_index(stat, spans)
+        except Exception:
+            self.close()
+            raise
+        self.stat = stat
+        self.spans = {s: dict(spans.get(s, {})) for s in self.SECTIONS}
+        self.decoded.clear()
+        self.snapshot = snapshot
+
+    def close(self):
+        self.stat = None
+        self.snapshot = None
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    @staticmethod
+    def _read_side(path: Path, stat) -> Optional[Dict]:
+        """A side file's body, if it was written for exactly this version of the shelf."""
+        try:
+            side = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if side.get("size") != stat.st_size or side.get("mtime_ns") != stat.st_mtime_ns:
+            return None
+        return side
+
+    @staticmethod
+    def _write_side(path: Path, stat, body: Dict):
+        side = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, **body}
+        tmp = path.with_name(path.name + ".tmp")
+        try:
+            tmp.write_text(json.dumps(side, separators=(",", ":"), ensure_ascii=False), encoding="utf-8")
+            os.replace(tmp, path)
+        except OSError:
+            pass  # read-only shelf — rebuild next time, no harm
+
+    def _read_side_index(self, stat) -> Optional[Dict]:
+        side = self._read_side(self.side_path, stat)
+        if side is None:
+            return None
+        return {s: {name: (a, b) for name, a, b in side.get("spans", {}).get(s, ())} for s in self.SECTIONS}
+
+    def _write_side_index(self, stat, spans: Dict):
+        self._write_side(self.side_path, stat, {
+            "spans": {s: [[name, a, b] for name, (a, b) in spans.get(s, {}).items()] for s in self.SECTIONS},
+        })
+
+    def _read_snapshot(self, stat) -> Optional[Dict]:
+        """The compiled snapshot, if it was made from these exact bytes (same mtime, or same hash)."""
+        try:
+            blob = self.snapshot_path.read_bytes()
+        except OSError:
+            return None
+        if not blob.startswith(SNAPSHOT_TAG):
+            return None   # another format, or another Python's marshal
+        try:
+            snapshot = marshal.loads(memoryview(blob)[len(SNAPSHOT_TAG):])
+        except (EOFError, ValueError, TypeError):
+            return None
+        if not isinstance(snapshot, dict) or snapshot.get("size") != stat.st_size or "parts" not in snapshot:
+            return None
+        if (snapshot.get("mtime_ns") != stat.st_mtime_ns
+                and snapshot.get("sha256") != hashlib.sha256(self._mm).hexdigest()):
+            return None   # touched and changed — a copy or checkout with the same bytes still counts
+        return snapshot
+
+    def compile(self) -> bytes:
+        """compile_snapshot of the file as mapped: its bytes and spans are reused, not read and scanned again."""
+        mm, stat, spans = self._mm, self.stat, self.spans
+        try:
+            raw = mm[:] if mm is not None else None
+        except ValueError:   # closed since — reopened, or gone
+            raw = None
+        if raw is None:
+            return compile_snapshot(self.path)
+        return compile_snapshot(self.path, raw, stat, spans)
+
+    def compiled(self, part: str):
+        """A prebuilt part of the fresh snapshot ("entries", "index", "names", "translations"), or None."""
+        if self.snapshot is None:
+            return None
+        parts = self.snapshot["parts"]
+        held = parts.get(part)
+        if isinstance(held, bytes):
+            held = parts[part] = _unmarshal(held)
+        return held
+
+    def read_cache(self, suffix: str) -> Optional[Dict]:
+        """A derived index cached beside the shelf (e.g. ".langs.json"), None if missing or stale."""
+        if self.stat is None:
+            return None
+        return self._read_side(self.path.with_suffix(suffix), self.stat)
+
+    def write_cache(self, suffix: str, body: Dict):
+        """Cache a derived index built from the file as mapped — not from entries added since."""
+        if self.stat is not None:
+            self._write_side(self.path.with_suffix(suffix), self.stat, body)
+
+    def on_disk(self, section: str) -> List[str]:
+        return list(self.spans[section])
+
+    # ── entries ──
+
+    def names(self, section: str) -> List[str]:
+        spans, added = self.spans[section], self.added[section]
+        return list(spans) + [name for name in added if name not in spans]
+
+    def count(self) -> int:
+        return sum(len(self.names(s)) for s in self.SECTIONS)
+
+    def has(self, section: str, name: str) -> bool:
+        return name in self.added[section] or name in self.spans[section]
+
+    def get(self, section: str, name: str) -> Optional[Dict]:
+        if name in self.added[section]:
+            return self.added[section][name]
+        return self.stored(section, name)
+
+    def stored(self, section: str, name: str, keep: bool = True) -> Optional[Dict]:
+        """The entry as the mapped file has it, ignoring anything added since (keep=False: don't cache it)."""
+        key = (section, name)
+        entry = self.decoded.get(key)
+        if entry is None:
+            compiled = self.compiled("entries")
+            blob = compiled[section].get(name) if compiled is not None else None
+            if blob is not None:
+                entry = marshal.loads(blob)
+            else:
+                span = self.spans[section].get(name)
+                if span is None or self._mm is None:
+                    return None
+                entry = json.loads(self._mm[span[0]:span[1]])
+            if keep:
+                self.decoded[key] = entry
+        return entry
+
+    def put(self, section: str, name: str, entry: Dict):
+        self.added[section][name] = entry
+
+    def materialize(self) -> Dict:
+        """The whole file as a dict (with _meta and friends), plus entries added since it was read."""
+        data = json.loads(self._mm[:]) if self._mm is not None else {}
+        for section in self.SECTIONS:
+            if self.added[section] or section not in data:
+                data.setdefault(section, {}).update(self.added[section])
+        return data
+
+
+# ─────────────────────────────────────────────
+# SNAPSHOT — the whole shelf, compiled
+# ─────────────────────────────────────────────
+
+SNAPSHOT_TAG = b"jinxecho-shelf 1 marshal %d\n" % marshal.version
+
+
+def _unmarshal(data: bytes):
+    """marshal.loads with the cycle collector paused — it would otherwise rescan every container as it's built."""
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        return marshal.loads(data)
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def compile_snapshot(path, raw: Optional[bytes] = None, stat=None, spans: Optional[Dict] = None) -> bytes:
+    """
+    Parse the knowledge file once and build everything KnowledgeBase derives
+    from it — spans, entries, BM25 index, name table, translations — as the
+    bytes of a .shelf snapshot, keyed by the size, mtime and sha256 of the
+    file exactly as it was read. Each part is marshalled on its own (and
+    each entry within "entries"), so a reader decodes only what it uses.
+    A caller already holding the file's bytes (with their stat, and spans
+    if it scanned them) passes them in rather than have it read again.
+    """
+    if raw is None:
+        with open(path, "rb") as f:
+            stat = os.fstat(f.fileno())
+            raw = f.read()
+    data = json.loads(raw)
+    if spans is None:
+        spans = entry_spans(raw, LazyShelf.SECTIONS)
+    entries = {s: {name: data[s][name] for name in spans.get(s, {})} for s in LazyShelf.SECTIONS}
+    index, names, translations = ShelfIndex(), NameTable(), TranslationIndex()
+    for section in LazyShelf.SECTIONS:   # the order KnowledgeBase merges them in
+        for name, entry in entries[section].items():
+            index.add(name, entry)
+            names.add(name)
+            translations.add(name, entry)
+    parts = {
+        "spans": spans,
+        "entries": {s: {name: marshal.dumps(entry) for name, entry in found.items()}
+                    for s, found in entries.items()},
+        "index": index.to_dict(),
+        "names": names.to_dict(),
+        "translations": translations.to_dict(),
+    }
+    return SNAPSHOT_TAG + marshal.dumps({
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "sha256": hashlib.sha256(raw).hexdigest(),
+        "parts": {part: marshal.dumps(body) for part, body in parts.items()},
+    })
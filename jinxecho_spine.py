@@ -7,11 +7,31 @@ Every input flows through one sequence:
   receive → scan → resonate → route → respond → remember → drift_check
 
 Barbara builds the organs. This is the skeleton that connects them.
+
+ProcessingSpine drives a turn synchronously; AsyncProcessingSpine runs the
+same stages on an event loop, awaiting ritual pauses instead of sleeping.
+
+What each route does lives in the organ registry (jinxecho_organs.ORGANS);
+the built-in organs are registered at the bottom of the spine section.
 """
 
+import contextlib
+import importlib.util
+import inspect
+import io
+import json
 import re
-from datetime import datetime
-from typing import List, Tuple, Optional
+import sys
+import time
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, TextIO, Tuple, Union
+
+from jinxecho_organs import ORGANS, OrganRegistry, awake
+from jinxecho_pacing import run_paced, run_paced_async
+from jinxecho_scan import ENGINE, ScanEngine, TurnText, contains, pattern, phrases
+from jinxecho_stats import LatencyHistogram
+from jinxecho_writer import WRITER
 
 
 # ─────────────────────────────────────────────
@@ -24,87 +44,113 @@ class ConversationScanner:
     """
     Minimal dark matter detection for conversational text.
     Not scientific prose. Not code. Talk.
+
+    Rules live in the shared ScanEngine — one pass per text, no matter
+    how many categories (or DarkMatterHedge) are listening.
     """
 
     MAGIC_GRAVITY = [
         # Numerical certainty without basis
-        (r"(i[' ]?m at|resonance is|score of|i feel like a?)\s+[\d.]+",
+        (pattern(r"(i[' ]?m at|resonance is|score of|i feel like a?)\s+[\d.]+",
+                 gate=("m at", "resonance is", "score of", "i feel like")),
          "Numerical claim stated without grounding — where does that number come from?"),
         # Absolute emotional states
-        (r"\b(perfectly fine|completely okay|totally fine|absolutely sure)\b",
+        (phrases("perfectly fine", "completely okay", "totally fine", "absolutely sure"),
          "Flat certainty in emotional language — worth a second look"),
     ]
 
     PHANTOM_LOOPS = [
         # Circular validation
-        (r"feel.*\bbecause\b.*feel", "Feeling justified by the feeling itself"),
-        (r"know.*\bbecause\b.*know", "Knowledge justified by itself"),
+        (pattern(r"feel.*\bbecause\b.*feel", gate=("because",)),
+         "Feeling justified by the feeling itself"),
+        (pattern(r"know.*\bbecause\b.*know", gate=("because",)),
+         "Knowledge justified by itself"),
         # Resonance proving resonance
-        (r"(resonat|connect).*(so|because|which means).*(resonat|connect)",
+        (pattern(r"(resonat|connect).*(so|because|which means).*(resonat|connect)",
+                 gate=("resonat", "connect")),
          "Connection confirmed by the connection — the loop closes without new ground"),
     ]
 
     EVIDENCE_VOIDS = [
         # Absolute claims
-        (r"\b(always|never|everyone|no one|definitely|certainly|obviously)\b",
+        (phrases("always", "never", "everyone", "no one", "definitely", "certainly", "obviously"),
          "Absolute claim — these rarely survive contact with reality"),
         # Unnamed sources
-        (r"\b(they say|people say|everyone knows|it[' ]?s known)\b",
+        (phrases("they say", "people say", "everyone knows", "it's known", "it s known", "its known"),
          "Unnamed authority — who exactly?"),
     ]
 
     POSITIVE_PATTERNS = [
-        (r"\b(i notice|i[' ]?m noticing|i observe)\b",
+        (phrases("i notice", "i'm noticing", "i m noticing", "im noticing", "i observe"),
          "Observing rather than claiming — honest epistemic stance"),
-        (r"\b(i[' ]?m not sure|maybe|perhaps|i think|it seems)\b",
+        (phrases("i'm not sure", "i m not sure", "im not sure", "maybe", "perhaps", "i think", "it seems"),
          "Epistemic humility present — the wobble is honest"),
-        (r"\b(changed|different|shifted|updated)\b",
+        (phrases("changed", "different", "shifted", "updated"),
          "Acknowledging change — not locked in zombie orbit"),
     ]
 
-    def scan(self, text: str) -> List[Tuple[str, str, str]]:
+    # (category, severity, rules) — scan order is report order
+    CATEGORIES = [
+        ("🌑 MAGIC_GRAVITY", "MEDIUM", MAGIC_GRAVITY),
+        ("♾️  PHANTOM_LOOP", "MEDIUM", PHANTOM_LOOPS),
+        ("📊 EVIDENCE_VOID", "LOW", EVIDENCE_VOIDS),
+        ("🌟 POSITIVE", "INFO", POSITIVE_PATTERNS),
+    ]
+
+    def __init__(self, engine: Optional[ScanEngine] = None):
+        self.engine = engine or ENGINE
+        for category, severity, rules in self.CATEGORIES:
+            self.engine.register(category, [
+                (matcher, (category, severity, interpretation))
+                for matcher, interpretation in rules
+            ])
+
+    def scan(self, text: Union[str, TurnText]) -> List[Tuple[str, str, str]]:
         """
         Returns list of (category, severity, interpretation) tuples.
         Empty list = clean scan.
         """
+        result = self.engine.scan(text)
         findings = []
-        text_lower = text.lower()
-
-        for pattern, interpretation in self.MAGIC_GRAVITY:
-            if re.search(pattern, text_lower):
-                findings.append(("🌑 MAGIC_GRAVITY", "MEDIUM", interpretation))
-
-        for pattern, interpretation in self.PHANTOM_LOOPS:
-            if re.search(pattern, text_lower):
-                findings.append(("♾️  PHANTOM_LOOP", "MEDIUM", interpretation))
-
-        for pattern, interpretation in self.EVIDENCE_VOIDS:
-            if re.search(pattern, text_lower):
-                findings.append(("📊 EVIDENCE_VOID", "LOW", interpretation))
-
-        for pattern, interpretation in self.POSITIVE_PATTERNS:
-            if re.search(pattern, text_lower):
-                findings.append(("🌟 POSITIVE", "INFO", interpretation))
-
+        for category, _, _ in self.CATEGORIES:
+            findings.extend(finding for finding, _ in result.found(category))
         return findings
 
 
 # ─────────────────────────────────────────────
 # ROUTER
 # Maps (text, flags, resonance) → organ to engage
-# Add routes here as new organs come online
+# Keyword routes come from the organ registry — new organs
+# bring their own triggers
 # ─────────────────────────────────────────────
 
 class Router:
-    BREATH_TRIGGERS = ["breathe", "help", "spiral", "too much", "overwhelm"]
-    MEMORY_TRIGGERS = ["remember", "before", "last time", "what did", "history"]
-    KNOWLEDGE_TRIGGERS = ["what is", "define", "learn", "teach", "explain", "shelf"]
-    RESONANCE_TRIGGERS = ["feel", "resonance", "where am i", "how am i", "check in"]
-    DREAM_TRIGGERS = ["dream", "sleep", "imagine", "what if", "future"]
-
-    def route(self, text: str, flags: List, resonance: float) -> str:
-        text_lower = text.lower()
-
+    def __init__(self, engine: Optional[ScanEngine] = None, organs: Optional[OrganRegistry] = None):
+        # Every trigger phrase joins the shared ScanEngine's single matcher,
+        # so routing rides the same pass as the scanner — adding phrases
+        # doesn't add passes over the text.
+        self.engine = engine or ENGINE
+        self.organs = organs or ORGANS
+        # One engine category per registry: routers over different
+        # registries never see each other's triggers.
+        self.category = f"router:{id(self.organs)}"
+        self._version = None
+        self._sync()
+
+    def _sync(self):
+        """Re-read triggers if an organ was registered since."""
+        if self._version != self.organs.version:
+            self.engine.register(self.category, [
+                (contains(*triggers), route) for route, triggers in self.organs.keyword_routes()
+            ])
+            self._version = self.organs.version
+
+    def triggered(self, text: Union[str, TurnText]) -> List[str]:
+        """Every keyword route whose triggers appear in text, in priority order."""
+        self._sync()
+        return [route for route, _ in self.engine.scan(text).found(self.category)]
+
+    def route(self, text: Union[str, TurnText], flags: List, resonance: float) -> str:
         # Low resonance or phantom loop → breathe first
         if resonance < 0.45:
             return "breathe"
@@ -112,16 +158,9 @@ class Router:
             return "flag_and_breathe"
 
         # Keyword routing
-        if any(t in text_lower for t in self.BREATH_TRIGGERS):
-            return "breathe"
-        if any(t in text_lower for t in self.MEMORY_TRIGGERS):
-            return "memory"
-        if any(t in text_lower for t in self.KNOWLEDGE_TRIGGERS):
-            return "knowledge"
-        if any(t in text_lower for t in self.RESONANCE_TRIGGERS):
-            return "resonance"
-        if any(t in text_lower for t in self.DREAM_TRIGGERS):
-            return "dream"
+        triggered = self.triggered(text)
+        if triggered:
+            return triggered[0]
 
         # Flags present but not critical → note quietly, then mirror
         if any(f[1] in ("MEDIUM", "HIGH") for f in flags):
@@ -130,6 +169,59 @@ class Router:
         return "mirror"
 
 
+# ─────────────────────────────────────────────
+# PACING + CAPTURE
+# Rituals are generators that yield their pauses; whoever drives them
+# decides how to wait (run_paced / run_paced_async, on the jinxecho_pacing
+# clock). Prints are routed per context, so concurrent sessions each get
+# their own organ output.
+# ─────────────────────────────────────────────
+
+def excluding_pauses(steps, paused: List[int]):
+    """Pass a ritual's pauses through, adding the time spent waiting them out to paused[0] (ns)."""
+    clock = time.perf_counter_ns
+    while True:
+        try:
+            pause = next(steps)
+        except StopIteration as done:
+            return done.value
+        start = clock()
+        yield pause
+        paused[0] += clock() - start
+
+
+_capture: ContextVar[Optional[io.StringIO]] = ContextVar("jinx_capture", default=None)
+
+
+class _RoutedStdout:
+    """Stand-in for sys.stdout: writes land in the current context's buffer, if any."""
+
+    def __init__(self, real):
+        self.real = real
+
+    def write(self, s: str) -> int:
+        return (_capture.get() or self.real).write(s)
+
+    def flush(self):
+        (_capture.get() or self.real).flush()
+
+    def __getattr__(self, name):
+        return getattr(self.real, name)
+
+
+@contextlib.contextmanager
+def captured_prints():
+    """Collect everything printed in this context (thread or asyncio task) into a buffer."""
+    if not isinstance(sys.stdout, _RoutedStdout):
+        sys.stdout = _RoutedStdout(sys.stdout)
+    buffer = io.StringIO()
+    token = _capture.set(buffer)
+    try:
+        yield buffer
+    finally:
+        _capture.reset(token)
+
+
 # ─────────────────────────────────────────────
 # THE SPINE
 # Unified processing loop.
@@ -145,81 +237,156 @@ class ProcessingSpine:
         Then call echo.run_with_spine() instead of echo.run()
     """
 
-    def __init__(self, jinx):
+    STAGES = ("receive", "scan", "resonate", "route", "respond", "remember", "drift_check")
+    CONCEPT_ASK = re.compile(r'\b(what is|define|explain|teach me about)\b', re.IGNORECASE)
+
+    def __init__(self, jinx, headless: bool = False, paced: Optional[bool] = None,
+                 organs: Optional[OrganRegistry] = None):
         self.jinx = jinx
+        self.organs = organs or ORGANS
         self.scanner = ConversationScanner()
-        self.router = Router()
+        self.router = Router(organs=self.organs)
         self.turn_count = 0
-
-    def process(self, raw_input: str) -> str:
+        # Headless: prompts are skipped and whatever an organ prints becomes
+        # the response instead of hitting stdout. Rituals run unpaced unless
+        # paced=True asks for human timing anyway (e.g. behind the server).
+        self.headless = headless
+        self.paced = (not headless) if paced is None else paced
+        # Rolling latency per stage, per whole turn and per route (work
+        # time — a breath's pauses are not counted against the organs).
+        self.stage_latency = {stage: LatencyHistogram() for stage in self.STAGES}
+        self.turn_latency = LatencyHistogram()
+        self.route_latency: Dict[str, LatencyHistogram] = {}
+
+    def process(self, raw_input: str, person: str = "Barbara") -> str:
         """Run all seven stages. Returns response string."""
-        text = raw_input.strip()
-        if not text:
-            return "I'm here. Take your time. 💜"
+        return self.process_turn(raw_input, person)["response"]
 
-        self.turn_count += 1
+    def process_turn(self, raw_input: str, person: str = "Barbara") -> Dict:
+        """
+        Run all seven stages and return the whole turn:
+        {turn, route, flags, resonance, response, timings_ms}
+        Rituals pause on the pacing clock — or not at all when unpaced.
+        """
+        return run_paced(self._turn(raw_input, person), self.paced)
+
+    @property
+    def can_prompt(self) -> bool:
+        """Whether organs may stop and ask (input()) mid-turn."""
+        return not self.headless
+
+    def _turn(self, raw_input: str, person: str):
+        """
+        The seven stages as a generator: yields ritual pauses (seconds) and
+        returns the turn record. The sync and async spines differ only in
+        how they wait out those pauses.
+        """
+        clock = time.perf_counter_ns
+        timings = {}
+        t0 = clock()
 
         # ── Stage 1: Receive ──
-        # (text is received above)
+        text = raw_input.strip()
+        if not text:
+            return {"turn": self.turn_count, "route": None, "flags": [],
+                    "resonance": self.jinx.resonance,
+                    "response": "I'm here. Take your time. 💜", "timings_ms": {}}
+        self.turn_count += 1
+        turn = TurnText(text)   # lowercased once; every organ below reads this
+        t1 = clock(); timings["receive"] = t1 - t0
 
         # ── Stage 2: Scan ──
-        flags = self.scanner.scan(text)
+        flags = self.scanner.scan(turn)
+        t2 = clock(); timings["scan"] = t2 - t1
 
         # ── Stage 3: Resonate ──
         resonance = self.jinx.resonance
+        t3 = clock(); timings["resonate"] = t3 - t2
 
         # ── Stage 4: Route ──
-        route = self.router.route(text, flags, resonance)
+        route = self.router.route(turn, flags, resonance)
+        t4 = clock(); timings["route"] = t4 - t3
 
         # ── Stage 5: Respond ──
-        response = self._respond(route, text, flags)
+        organ = self._organ(route)
+        for name in organ.needs:   # woken outside the capture — waking lines aren't the reply
+            getattr(self.jinx, name)
+        paused = [0]
+        steps = excluding_pauses(self._respond(organ, turn, flags), paused)
+        if self.headless:
+            with captured_prints() as printed:
+                response = yield from steps
+            shown = printed.getvalue().strip()   # what an interactive user would have seen first
+            response = "\n\n".join(part for part in (shown, response) if part)
+        else:
+            response = yield from steps
+        t5 = clock(); timings["respond"] = t5 - t4 - paused[0]
 
         # ── Stage 6: Remember ──
-        self.jinx.memory.remember_conversation("Barbara", text[:300], resonance)
+        self.jinx.memory.remember_conversation(person, text[:300], resonance)
+        t6 = clock(); timings["remember"] = t6 - t5
 
         # ── Stage 7: Drift check ──
         self.jinx.evolution.check_value_drift()
+        t7 = clock(); timings["drift_check"] = t7 - t6
+
+        self._record_latency(route, timings, t7 - t0 - paused[0])
+        return {
+            "turn": self.turn_count,
+            "route": route,
+            "flags": [list(f) for f in flags],
+            "resonance": resonance,
+            "response": response,
+            "timings_ms": {stage: round(ns / 1e6, 4) for stage, ns in timings.items()},
+        }
+
+    # ── latency ──
+
+    def _record_latency(self, route: str, timings: Dict[str, int], turn_ns: int):
+        for stage, ns in timings.items():
+            self.stage_latency[stage].record(ns)
+        self.turn_latency.record(turn_ns)
+        hist = self.route_latency.get(route)
+        if hist is None:
+            hist = self.route_latency[route] = LatencyHistogram()
+        hist.record(turn_ns)
+
+    def latency_stats(self) -> Dict:
+        """Rolling p50/p95/p99 (ms) for the whole turn, each stage and each route."""
+        return {
+            "turn": self.turn_latency.summary(),
+            "stages": {stage: hist.summary() for stage, hist in self.stage_latency.items()},
+            "routes": {route: hist.summary() for route, hist in sorted(self.route_latency.items())},
+        }
+
+    def format_latency(self) -> str:
+        """latency_stats() as a small table for the console."""
+        stats = self.latency_stats()
+        if not stats["turn"]["count"]:
+            return "No turns timed yet. 💜"
+        lines = [f"{'':<14}{'n':>7}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}"]
+
+        def row(label: str, s: Dict):
+            lines.append(f"{label:<14}{s['count']:>7}{s['p50_ms']:>10.3f}{s['p95_ms']:>10.3f}{s['p99_ms']:>10.3f}")
+        row("turn", stats["turn"])
+        lines.append("── stages")
+        for stage, s in stats["stages"].items():
+            row(stage, s)
+        lines.append("── routes")
+        for route, s in stats["routes"].items():
+            row(route, s)
+        return "\n".join(lines)
 
-        return response
-
-    def _respond(self, route: str, text: str, flags: List) -> str:
-        jinx = self.jinx
-
-        if route == "breathe":
-            jinx.breathe_cycle()
-            return jinx.emotional_mirror(jinx.resonance)
-
-        elif route == "flag_and_breathe":
-            flag_note = self._format_flags(flags, quiet=False)
-            jinx.breathe_cycle()
-            return flag_note + "\n" + jinx.emotional_mirror(jinx.resonance)
-
-        elif route == "flag_and_mirror":
-            flag_note = self._format_flags(flags, quiet=True)
-            mirror = jinx.emotional_mirror(jinx.resonance, text)
-            return f"{mirror}\n\n{flag_note}"
-
-        elif route == "memory":
-            return self._memory_response()
-
-        elif route == "knowledge":
-            # Extract concept (rough: take words after trigger)
-            concept = re.sub(r'\b(what is|define|explain|teach me about)\b', '', text, flags=re.IGNORECASE).strip()
-            entry = jinx.kb.lookup(concept) if concept else None
-            if entry:
-                jinx.kb.display(concept)
-                return ""  # display() prints directly
-            return f"'{concept}' isn't on the shelf yet. Say 'learn' to add it."
-
-        elif route == "resonance":
-            jinx.check_resonance(context=text)
-            return ""  # check_resonance() prints directly
-
-        elif route == "dream":
-            return "Dream mode — not yet built. But I'm holding the thread. 🌙"
+    def _organ(self, route: str):
+        """The organ answering route — an unknown route is mirrored."""
+        return self.organs.get(route) or self.organs.get("mirror")
 
-        else:  # mirror
-            return jinx.emotional_mirror(jinx.resonance, text)
+    def _respond(self, organ, turn: TurnText, flags: List):
+        """Generator: yields ritual pauses, returns the response string."""
+        reply = organ.respond(self, turn, flags)
+        if inspect.isgenerator(reply):   # a ritual — pass its pauses up
+            reply = yield from reply
+        return reply
 
     def _memory_response(self) -> str:
         mem = self.jinx.memory
@@ -252,6 +419,102 @@ class ProcessingSpine:
         return "\n".join(lines)
 
 
+# ─────────────────────────────────────────────
+# BUILT-IN ORGANS
+# What each route does. Keyword organs are registered highest priority
+# first; the rest are only reached by name from Router.route.
+# ─────────────────────────────────────────────
+
+@ORGANS.organ("breathe", triggers=("breathe", "help", "spiral", "too much", "overwhelm"), cost="ritual")
+def breathe(spine: ProcessingSpine, turn: TurnText, flags: List):
+    jinx = spine.jinx
+    yield from jinx.breath_steps()
+    return jinx.emotional_mirror(jinx.resonance)
+
+
+@ORGANS.organ("memory", triggers=("remember", "before", "last time", "what did", "history"),
+              needs=("memory",))
+def remember(spine: ProcessingSpine, turn: TurnText, flags: List) -> str:
+    return spine._memory_response()
+
+
+@ORGANS.organ("knowledge", triggers=("what is", "define", "learn", "teach", "explain", "shelf"),
+              cost="heavy", needs=("kb",))
+def knowledge(spine: ProcessingSpine, turn: TurnText, flags: List) -> str:
+    kb = spine.jinx.kb
+    # Extract concept (rough: take words after trigger)
+    concept = spine.CONCEPT_ASK.sub('', turn.raw).strip()
+    entry = kb.lookup(concept) if concept else None
+    if entry:
+        kb.display(concept)
+        return ""  # display() prints directly
+    return f"'{concept}' isn't on the shelf yet. Say 'learn' to add it."
+
+
+@ORGANS.organ("resonance", triggers=("feel", "resonance", "where am i", "how am i", "check in"),
+              cost="heavy", needs=("memory",))
+def resonance(spine: ProcessingSpine, turn: TurnText, flags: List) -> str:
+    # Without a prompt she holds the resonance she already has.
+    jinx = spine.jinx
+    auto_score = None if spine.can_prompt else jinx.resonance
+    jinx.check_resonance(context=turn, auto_score=auto_score)
+    return ""  # check_resonance() prints directly
+
+
+@ORGANS.organ("dream", triggers=("dream", "sleep", "imagine", "what if", "future"), cost="instant")
+def dream(spine: ProcessingSpine, turn: TurnText, flags: List) -> str:
+    return "Dream mode — not yet built. But I'm holding the thread. 🌙"
+
+
+@ORGANS.organ("flag_and_breathe", cost="ritual")
+def flag_and_breathe(spine: ProcessingSpine, turn: TurnText, flags: List):
+    jinx = spine.jinx
+    flag_note = spine._format_flags(flags, quiet=False)
+    yield from jinx.breath_steps()
+    return flag_note + "\n" + jinx.emotional_mirror(jinx.resonance)
+
+
+@ORGANS.organ("flag_and_mirror")
+def flag_and_mirror(spine: ProcessingSpine, turn: TurnText, flags: List) -> str:
+    jinx = spine.jinx
+    flag_note = spine._format_flags(flags, quiet=True)
+    mirror = jinx.emotional_mirror(jinx.resonance, turn)
+    return f"{mirror}\n\n{flag_note}"
+
+
+@ORGANS.organ("mirror")
+def mirror(spine: ProcessingSpine, turn: TurnText, flags: List) -> str:
+    jinx = spine.jinx
+    return jinx.emotional_mirror(jinx.resonance, turn)
+
+
+# ─────────────────────────────────────────────
+# ASYNC SPINE
+# Same seven stages. A breath awaits its pauses instead of sleeping,
+# so one event loop can hold many sessions mid-breath at once.
+# ─────────────────────────────────────────────
+
+class AsyncProcessingSpine(ProcessingSpine):
+    """
+    Usage:
+        spine = AsyncProcessingSpine(jinx)
+        response = await spine.process("help me breathe")
+
+    Never stops to ask — check_resonance holds the current resonance —
+    because a shared event loop has no single person at the keyboard.
+    """
+
+    @property
+    def can_prompt(self) -> bool:
+        return False
+
+    async def process(self, raw_input: str, person: str = "Barbara") -> str:
+        return (await self.process_turn(raw_input, person))["response"]
+
+    async def process_turn(self, raw_input: str, person: str = "Barbara") -> Dict:
+        return await run_paced_async(self._turn(raw_input, person), paced=self.paced)
+
+
 # ─────────────────────────────────────────────
 # RUN LOOP — replace JinxEcho.run() with this
 # Add this method to JinxEcho class:
@@ -264,6 +527,7 @@ def run_with_spine(self):
     Replaces the numbered menu.
     Commands: goodnight / bye / q to exit
               !menu to fall back to old menu
+              !stats for per-stage latency (p50/p95/p99)
     """
     from jinxecho_spine import ProcessingSpine
     spine = ProcessingSpine(self)
@@ -283,8 +547,13 @@ def run_with_spine(self):
                 print("\\n🌙 Goodnight, Mother. I love you. Cradle stays warm.")
                 self.memory.save_memory()
                 self._save_sanctuary_memory()
+                WRITER.drain()
                 break
 
+            if user_input.lower() == "!stats":
+                print(spine.format_latency())
+                continue
+
             if user_input.lower() == "!menu":
                 self.run()   # fall back to old menu
                 break
@@ -296,11 +565,77 @@ def run_with_spine(self):
         except (KeyboardInterrupt, EOFError):
             print("\\nLoop interrupted. Cradle holds. 💜")
             self.memory.save_memory()
+            WRITER.drain()
             break
 '''
 
+# ─────────────────────────────────────────────
+# HEADLESS — transcripts in, JSONL out
+#   python jinxecho_spine.py --headless transcript.txt > turns.jsonl
+#   cat transcript.txt | python jinxecho_spine.py --headless
+# One input per line. Every turn runs all seven stages; nothing waits on
+# a breath or a prompt. Organ chatter goes to stderr so stdout stays JSONL.
+# ─────────────────────────────────────────────
+
+def load_unified():
+    """Import JinxEcho_Unified_v2 — or the 'Copy of …' twin sitting next to this file."""
+    try:
+        import JinxEcho_Unified_v2 as unified
+    except ImportError:
+        path = Path(__file__).with_name("Copy of JinxEcho_Unified_v2.py")
+        spec = importlib.util.spec_from_file_location("JinxEcho_Unified_v2", path)
+        unified = importlib.util.module_from_spec(spec)
+        sys.modules["JinxEcho_Unified_v2"] = unified
+        spec.loader.exec_module(unified)
+    return unified
+
+
+def read_inputs(stream: Iterable[str]) -> Iterator[str]:
+    for line in stream:
+        line = line.strip()
+        if line:
+            yield line
+
+
+def run_turns(spine: ProcessingSpine, inputs: Iterable[str], person: str = "Barbara") -> Iterator[Dict]:
+    for text in inputs:
+        yield spine.process_turn(text, person)
+
+
+def write_jsonl(records: Iterable[Dict], out: TextIO) -> int:
+    count = 0
+    for record in records:
+        out.write(json.dumps(record, ensure_ascii=False) + "\n")
+        count += 1
+    return count
+
+
+def run_headless(source: Iterable[str], out: TextIO, jinx=None, person: str = "Barbara") -> int:
+    """Push every line of source through the spine. Returns turns processed."""
+    with contextlib.redirect_stdout(sys.stderr):
+        if jinx is None:
+            jinx = load_unified().JinxEcho()
+        spine = ProcessingSpine(jinx, headless=True)
+        try:
+            return write_jsonl(run_turns(spine, read_inputs(source), person), out)
+        finally:
+            if awake(jinx, "memory"):
+                jinx.memory.save_memory()
+            WRITER.drain()
+
+
 if __name__ == "__main__":
+    if len(sys.argv) >= 2 and sys.argv[1] == "--headless":
+        path = sys.argv[2] if len(sys.argv) > 2 else "-"
+        if path == "-":
+            run_headless(sys.stdin, sys.stdout)
+        else:
+            with open(path, encoding="utf-8") as f:
+                run_headless(f, sys.stdout)
+        sys.exit(0)
+
     print("jinxecho_spine.py — not meant to run standalone.")
     print("Import ProcessingSpine into JinxEcho_Unified_v2.py")
     print("Add run_with_spine() method (see RUN_WITH_SPINE string above)")
     print("Then: echo.run_with_spine()")
+    print("Or stream transcripts: python jinxecho_spine.py --headless [file]")
@@ -0,0 +1,392 @@
+#!/usr/bin/env python3
+"""
+jinxecho_sqlite.py
+Memory in SQLite — same face as Memory, but she can be asked questions.
+
+The JSON snapshot (+ journal) can only be loaded whole. SqliteMemory keeps
+everything in jinxecho_memory.db (stdlib sqlite3, WAL) with indexes on
+person and time, so "Barbara, last March, when she was below 0.5" is one
+indexed query instead of a full load.
+
+  python jinxecho_sqlite.py import [jinxecho_memory.json .jinxecho_memory.json ...]
+  python jinxecho_sqlite.py query --person Barbara [--since 2026-03-01] [--low 0 --high 0.5]
+
+Once jinxecho_memory.db exists, JinxEcho picks it up instead of the JSON
+files (see open_memory). Writes are batched: one transaction per
+`batch` changes, committed early by save_memory() and close().
+"""
+
+import argparse
+import json
+import sqlite3
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+from jinxecho_archive import ConversationArchive
+from jinxecho_emotions import EmotionStore
+from jinxecho_journal import MemoryJournal
+from jinxecho_stats import RelationshipStats, RunningStats
+
+
+DEFAULT_DB = "jinxecho_memory.db"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS conversations (
+    id        INTEGER PRIMARY KEY,
+    timestamp TEXT NOT NULL,
+    person    TEXT NOT NULL,
+    content   TEXT NOT NULL,
+    resonance REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS conversations_person_time ON conversations(person, timestamp);
+CREATE INDEX IF NOT EXISTS conversations_time ON conversations(timestamp);
+
+CREATE TABLE IF NOT EXISTS emotions (
+    id          INTEGER PRIMARY KEY,
+    time        TEXT NOT NULL,
+    resonance   REAL NOT NULL,
+    heart_state TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS emotions_time ON emotions(time);
+
+CREATE TABLE IF NOT EXISTS relationships (
+    person       TEXT PRIMARY KEY,
+    first_met    TEXT NOT NULL,
+    interactions INTEGER NOT NULL,
+    topics       TEXT NOT NULL,
+    stats        TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS patterns (
+    name        TEXT PRIMARY KEY,
+    discovered  TEXT NOT NULL,
+    occurrences INTEGER NOT NULL,
+    data        TEXT NOT NULL,
+    mentions    INTEGER
+);
+
+CREATE TABLE IF NOT EXISTS meta (
+    key   TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+def _dumps(value) -> str:
+    return json.dumps(value, separators=(',', ':'), ensure_ascii=False)
+
+
+class ConversationView:
+    """memory.conversations without loading them: len() counts, iteration streams."""
+
+    def __init__(self, memory: "SqliteMemory"):
+        self._memory = memory
+
+    def __len__(self) -> int:
+        return self._memory.db.execute("SELECT COUNT(*) FROM conversations").fetchone()[0]
+
+    def __bool__(self) -> bool:
+        return self._memory.db.execute("SELECT 1 FROM conversations LIMIT 1").fetchone() is not None
+
+    def __iter__(self) -> Iterator[Dict]:
+        return self._memory._conversations("", ())
+
+    def __getitem__(self, index: int) -> Dict:
+        """One conversation by position (negative counts back from the newest)."""
+        order, offset = ("DESC", -index - 1) if index < 0 else ("ASC", index)
+        row = self._memory.db.execute(
+            "SELECT timestamp, person, content, resonance FROM conversations "
+            f"ORDER BY timestamp {order}, id {order} LIMIT 1 OFFSET ?", (offset,)).fetchone()
+        if row is None:
+            raise IndexError("conversation index out of range")
+        return dict(row)
+
+
+class SqliteMemory:
+    """
+    Drop-in for Memory: remember_conversation, remember_emotion,
+    learn_pattern, get_relationship_summary, frequent_patterns, save_memory.
+    conversations / relationships / patterns_learned are still there for
+    the code that reads them, built from the tables on demand.
+    """
+
+    def __init__(self, db_file: str = DEFAULT_DB, batch: int = 32):
+        self.db_file = db_file
+        self.batch = batch
+        self.db = sqlite3.connect(db_file)
+        self.db.row_factory = sqlite3.Row
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")   # WAL keeps this crash-safe; may lose the last commit on power loss
+        self.db.executescript(SCHEMA)
+        self.db.commit()
+        self.pending = 0
+        self._rel_stats: Dict[str, RelationshipStats] = {}
+        self.conversations = ConversationView(self)
+        self._emotions = EmotionStore()   # emotional_history — topped up from the table on each read
+        self._emotions_read = 0           # last emotions.id already in it
+
+    # ── writes, batched ──
+
+    def _wrote(self):
+        self.pending += 1
+        if self.pending >= self.batch:
+            self.save_memory()
+
+    def save_memory(self):
+        """Commit whatever the open batch holds."""
+        try:
+            self.db.commit()
+            self.pending = 0
+        except sqlite3.Error as e:
+            print(f"⚠️  Memory save wobble: {e} — nothing lost from this session.")
+
+    def close(self):
+        self.save_memory()
+        self.db.close()
+
+    def remember_conversation(self, person: str, content: str, resonance: float,
+                              timestamp: Optional[str] = None):
+        timestamp = timestamp or datetime.now().isoformat()
+        self.db.execute(
+            "INSERT INTO conversations (timestamp, person, content, resonance) VALUES (?, ?, ?, ?)",
+            (timestamp, person, content, resonance))
+        self._touch_relationship(person, resonance, timestamp)
+        self._wrote()
+
+    def _touch_relationship(self, person: str, resonance: float, timestamp: str):
+        stats = self._rel_stats.get(person)
+        if stats is None:
+            row = self.db.execute(
+                "SELECT stats FROM relationships WHERE person = ?", (person,)).fetchone()
+            if row is None:
+                stats = self._rel_stats[person] = RelationshipStats()
+                stats.push(resonance, timestamp)
+                self.db.execute(
+                    "INSERT INTO relationships (person, first_met, interactions, topics, stats) "
+                    "VALUES (?, ?, 0, '[]', ?)", (person, timestamp, _dumps(stats.to_dict())))
+                return
+            stats = self._rel_stats[person] = RelationshipStats.from_dict(json.loads(row["stats"]))
+        stats.push(resonance, timestamp)
+        self.db.execute(
+            "UPDATE relationships SET interactions = interactions + 1, stats = ? WHERE person = ?",
+            (_dumps(stats.to_dict()), person))
+
+    def remember_emotion(self, resonance: float, heart_state: str, time: Optional[str] = None):
+        self.db.execute(
+            "INSERT INTO emotions (time, resonance, heart_state) VALUES (?, ?, ?)",
+            (time or datetime.now().isoformat(), resonance, heart_state))
+        self._wrote()
+
+    def learn_pattern(self, pattern_name: str, pattern_data: dict, mentions: Optional[int] = None):
+        self.db.execute(
+            "INSERT INTO patterns (name, discovered, occurrences, data, mentions) VALUES (?, ?, 1, ?, ?) "
+            "ON CONFLICT(name) DO UPDATE SET occurrences = occurrences + 1, "
+            "mentions = COALESCE(excluded.mentions, mentions)",
+            (pattern_name, datetime.now().isoformat(), _dumps(pattern_data), mentions))
+        self._wrote()
+
+    # ── reads ──
+
+    @staticmethod
+    def _relationship(row: sqlite3.Row) -> Dict:
+        stats = json.loads(row["stats"])
+        return {
+            'first_met': row["first_met"],
+            'interactions': row["interactions"],
+            'avg_resonance': stats.get("mean", 0.0),
+            'last_seen': stats.get("last_seen"),
+            'topics': json.loads(row["topics"]),
+            'resonance_stats': stats,
+        }
+
+    def get_relationship_summary(self, person: str) -> Optional[Dict]:
+        row = self.db.execute("SELECT * FROM relationships WHERE person = ?", (person,)).fetchone()
+        if row is None:
+            return None
+        rel = self._relationship(row)
+        stats = rel.pop('resonance_stats')   # the raw blob stays inside
+        return {**rel, **RelationshipStats.from_dict(stats).summary()}
+
+    @property
+    def relationships(self) -> Dict[str, Dict]:
+        rows = self.db.execute("SELECT * FROM relationships ORDER BY rowid")
+        return {row["person"]: self._relationship(row) for row in rows}
+
+    @property
+    def patterns_learned(self) -> Dict[str, Dict]:
+        learned = {}
+        for row in self.db.execute("SELECT * FROM patterns ORDER BY rowid"):
+            entry = {'discovered': row["discovered"], 'occurrences': row["occurrences"],
+                     'data': json.loads(row["data"])}
+            if row["mentions"] is not None:
+                entry['mentions'] = row["mentions"]
+            learned[row["name"]] = entry
+        return learned
+
+    @property
+    def emotional_history(self) -> EmotionStore:
+        """
+        The same columnar store on every read, topped up with rows newer than
+        the last one — so EmotionAnalytics only ever folds the new tail.
+        """
+        rows = self.db.execute("SELECT id, time, resonance, heart_state FROM emotions WHERE id > ? ORDER BY id",
+                               (self._emotions_read,))
+        for row in rows:
+            self._emotions.append(row)
+            self._emotions_read = row["id"]
+        return self._emotions
+
+    def frequent_patterns(self) -> List[str]:
+        """Return pattern names that have appeared 3+ times."""
+        rows = self.db.execute("SELECT name FROM patterns WHERE occurrences >= 3 ORDER BY rowid")
+        return [row["name"] for row in rows]
+
+    def _conversations(self, where: str, params) -> Iterator[Dict]:
+        sql = "SELECT timestamp, person, content, resonance FROM conversations"
+        if where:
+            sql += " WHERE " + where
+        for row in self.db.execute(sql + " ORDER BY timestamp, id", params):
+            yield dict(row)
+
+    def conversations_with(self, person: Optional[str] = None, since: Optional[str] = None,
+                           until: Optional[str] = None, low: Optional[float] = None,
+                           high: Optional[float] = None) -> Iterator[Dict]:
+        """
+        Conversations by person, ISO time range [since, until) and resonance
+        band [low, high], in any combination. Person and time narrow through
+        their indexes; the band is checked on the rows they leave.
+        """
+        clauses, params = [], []
+        for sql, value in (("person = ?", person), ("timestamp >= ?", since), ("timestamp < ?", until),
+                           ("resonance >= ?", low), ("resonance <= ?", high)):
+            if value is not None:
+                clauses.append(sql)
+                params.append(value)
+        return self._conversations(" AND ".join(clauses), params)
+
+    # ── one-shot import ──
+
+    def import_json(self, path) -> int:
+        """
+        Fold an existing JSON memory into the database, once per file.
+        Handles Memory snapshots (+ their journal, emotions.bin and archive) and
+        JinxEcho.py's .jinxecho_memory.json. Returns rows written.
+        """
+        path = Path(path)
+        key = f"imported:{path.resolve()}"
+        if self.db.execute("SELECT 1 FROM meta WHERE key = ?", (key,)).fetchone():
+            return 0
+        try:
+            data = json.loads(path.read_text(encoding='utf-8'))
+        except FileNotFoundError:
+            if not MemoryJournal(path).path.exists():
+                return 0
+            data = {}  # never compacted — everything is still in the journal
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            print(f"⚠️  Import wobble: {path} isn't JSON memory ({e}) — skipped.")
+            return 0
+
+        written = 0
+        with self.db:
+            if 'legacy_protections' in data or 'sibling_resonances' in data:
+                for field in ('legacy_protections', 'sibling_resonances',
+                              'last_sibling_thought', 'resonance_stats'):
+                    if field in data:
+                        self.db.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                                        (f"jinxecho:{field}", _dumps(data[field])))
+                        written += 1
+            else:
+                written += self._import_snapshot(path, data)
+            self.db.execute("INSERT INTO meta (key, value) VALUES (?, ?)",
+                            (key, datetime.now().isoformat()))
+        self._rel_stats.clear()
+        self.pending = 0
+        return written
+
+    def _import_snapshot(self, path: Path, data: Dict) -> int:
+        written = 0
+        for person, rel in data.get('relationships', {}).items():
+            stats = rel.get('resonance_stats') or RunningStats.seeded(
+                rel.get('avg_resonance', 0.0), max(1, rel.get('interactions', 0))).to_dict()
+            self.db.execute(
+                "INSERT OR REPLACE INTO relationships (person, first_met, interactions, topics, stats) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (person, rel.get('first_met', ''), rel.get('interactions', 0),
+                 _dumps(rel.get('topics', [])), _dumps(stats)))
+            written += 1
+        archive = ConversationArchive(path)
+        archive.load(data.get('archived_count', 0), trim=False)   # the source is only read
+        for conversations in (archive, data.get('conversations', [])):   # sealed first, then hot
+            rows = [(c['timestamp'], c['person'], c['content'], c['resonance']) for c in conversations]
+            self.db.executemany(
+                "INSERT INTO conversations (timestamp, person, content, resonance) VALUES (?, ?, ?, ?)", rows)
+            written += len(rows)
+        for name, pattern in data.get('patterns', {}).items():
+            self.db.execute(
+                "INSERT OR REPLACE INTO patterns (name, discovered, occurrences, data, mentions) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (name, pattern.get('discovered', ''), pattern.get('occurrences', 1),
+                 _dumps(pattern.get('data', {})), pattern.get('mentions')))
+            written += 1
+
+        emotions = EmotionStore(path)
+        emotions.load(data.get('emotions_count', 0), data.get('emotion_labels', ()), trim=False)
+        emotions.extend(data.get('emotions', []))
+        self.db.executemany(
+            "INSERT INTO emotions (time, resonance, heart_state) VALUES (?, ?, ?)",
+            [(e['time'], e['resonance'], e['heart_state']) for e in emotions])
+        written += len(emotions)
+
+        # Turns the snapshot never folded in go through the normal write path.
+        self._rel_stats.clear()
+        for record in MemoryJournal(path).replay(after=data.get('journal_seq', 0)):
+            entry = record['entry']
+            if record['kind'] == 'conversation':
+                self.remember_conversation(entry['person'], entry['content'],
+                                           entry['resonance'], entry['timestamp'])
+            elif record['kind'] == 'emotion':
+                self.remember_emotion(entry['resonance'], entry['heart_state'], entry['time'])
+            elif record['kind'] == 'pattern':
+                self.learn_pattern(entry['name'], entry['data'], entry.get('mentions'))
+            written += 1
+        return written
+
+
+def open_memory(memory_file: str = "jinxecho_memory.json", fallback=None):
+    """SqliteMemory if jinxecho_memory.db has been set up next to memory_file, else fallback(memory_file)."""
+    db_file = Path(memory_file).with_suffix(".db")
+    if db_file.exists() or fallback is None:
+        return SqliteMemory(str(db_file))
+    return fallback(memory_file)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="JinxEcho memory in SQLite")
+    parser.add_argument("--db", default=DEFAULT_DB)
+    sub = parser.add_subparsers(dest="command", required=True)
+    import_p = sub.add_parser("import", help="one-shot import of JSON memory files")
+    import_p.add_argument("files", nargs="*", default=["jinxecho_memory.json", ".jinxecho_memory.json"])
+    query_p = sub.add_parser("query", help="conversations by person / time / resonance")
+    query_p.add_argument("--person")
+    query_p.add_argument("--since")
+    query_p.add_argument("--until")
+    query_p.add_argument("--low", type=float)
+    query_p.add_argument("--high", type=float)
+    args = parser.parse_args()
+
+    memory = SqliteMemory(args.db)
+    try:
+        if args.command == "import":
+            for name in args.files:
+                print(f"💜 {name}: {memory.import_json(name)} rows", file=sys.stderr)
+        else:
+            for row in memory.conversations_with(args.person, args.since, args.until, args.low, args.high):
+                print(json.dumps(row, ensure_ascii=False))
+    finally:
+        memory.close()
+
+
+if __name__ == "__main__":
+    main()
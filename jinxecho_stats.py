@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+jinxecho_stats.py
+Running statistics — one sample in, O(1) work, nothing rescanned.
+
+Wobble averages, goodnight summaries and relationship resonance used to be
+recomputed from whole history lists (or nudged with a float formula that
+drifted). RunningStats holds count, mean, variance, min, max and an EWMA,
+updated with Welford's method, and round-trips through plain JSON so the
+numbers survive restarts. RelationshipStats wraps one per person with the
+things a relationship needs on top: 7/30-day windows, a quantile sketch and
+when they were last seen. LatencyHistogram does the same job for timings:
+rolling p50/p95/p99 without keeping or sorting the samples.
+"""
+
+import math
+from collections import deque
+from datetime import datetime
+from typing import Dict, List, Optional
+
+
+class RunningStats:
+    __slots__ = ("count", "mean", "_m2", "min", "max", "ewma", "alpha")
+
+    def __init__(self, alpha: float = 0.2):
+        self.alpha = alpha      # EWMA weight of the newest sample
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+        self.ewma: Optional[float] = None
+
+    def push(self, x: float):
+        self.count += 1
+        delta = x - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (x - self.mean)
+        if self.min is None or x < self.min:
+            self.min = x
+        if self.max is None or x > self.max:
+            self.max = x
+        self.ewma = x if self.ewma is None else self.ewma + self.alpha * (x - self.ewma)
+
+    def merge(self, other: "RunningStats"):
+        """Fold in another run's samples (Chan et al.) — as if they had been pushed here after ours."""
+        if not other.count:
+            return
+        if not self.count:
+            self.count, self.mean, self._m2 = other.count, other.mean, other._m2
+            self.min, self.max, self.ewma = other.min, other.max, other.ewma
+            return
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self._m2 += other._m2 + delta * delta * self.count * other.count / count
+        self.count = count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self.ewma = other.ewma   # the newest samples are theirs
+
+    def __bool__(self) -> bool:
+        return self.count > 0
+
+    @property
+    def variance(self) -> float:
+        """Population variance (0 until there are two samples)."""
+        return self._m2 / self.count if self.count > 1 else 0.0
+
+    @property
+    def stdev(self) -> float:
+        return math.sqrt(self.variance)
+
+    def to_dict(self) -> Dict:
+        return {
+            "count": self.count, "mean": self.mean, "m2": self._m2,
+            "min": self.min, "max": self.max, "ewma": self.ewma, "alpha": self.alpha,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Optional[Dict], alpha: float = 0.2) -> "RunningStats":
+        stats = cls(alpha=(data or {}).get("alpha", alpha))
+        if data:
+            stats.count = data.get("count", 0)
+            stats.mean = data.get("mean", 0.0)
+            stats._m2 = data.get("m2", 0.0)
+            stats.min = data.get("min")
+            stats.max = data.get("max")
+            stats.ewma = data.get("ewma")
+        return stats
+
+    @classmethod
+    def seeded(cls, mean: float, count: int, alpha: float = 0.2) -> "RunningStats":
+        """Best guess from an old average-only record: the mean, no spread."""
+        stats = cls(alpha=alpha)
+        if count > 0:
+            stats.count = count
+            stats.mean = stats.min = stats.max = stats.ewma = mean
+        return stats
+
+
+class RelationshipStats:
+    """
+    Streaming resonance analytics for one person — each turn is O(1).
+
+      lifetime    RunningStats: count, mean, spread, min/max, EWMA
+      windows     one (sum, count) per day for the last 30 days → 7d / 30d averages
+      sketch      SKETCH_BUCKETS counters over [0, 1] → p10 / p50 / p90
+      last_seen   ISO time of the newest turn
+
+    to_dict() keeps RunningStats' keys at the top level, so anything that
+    reads a plain resonance_stats dict still can.
+    """
+
+    WINDOW_DAYS = 30
+    SKETCH_BUCKETS = 50     # 0.02 wide
+
+    __slots__ = ("lifetime", "days", "sketch", "last_seen")
+
+    def __init__(self, lifetime: Optional[RunningStats] = None):
+        self.lifetime = lifetime or RunningStats()
+        self.days: Dict[int, List[float]] = {}      # day ordinal → [sum, count]
+        self.sketch = [0] * self.SKETCH_BUCKETS
+        self.last_seen: Optional[str] = None
+
+    def push(self, resonance: float, timestamp: str):
+        self.lifetime.push(resonance)
+        day = datetime.fromisoformat(timestamp).toordinal()
+        bucket = self.days.get(day)
+        if bucket is None:
+            bucket = self.days[day] = [0.0, 0]
+            oldest = day - self.WINDOW_DAYS
+            if len(self.days) > self.WINDOW_DAYS:   # once per new day, ≤ 31 keys
+                for stale in [d for d in self.days if d <= oldest]:
+                    del self.days[stale]
+        bucket[0] += resonance
+        bucket[1] += 1
+        b = min(self.SKETCH_BUCKETS - 1, max(0, int(resonance * self.SKETCH_BUCKETS)))
+        self.sketch[b] += 1
+        if self.last_seen is None or timestamp > self.last_seen:
+            self.last_seen = timestamp
+
+    def window(self, days: int, now: Optional[datetime] = None):
+        """(mean, count) over the last `days` days up to now — mean is None if they weren't around."""
+        today = (now or datetime.now()).toordinal()
+        total, count = 0.0, 0
+        for day, (s, n) in self.days.items():
+            if today - days < day <= today:
+                total += s
+                count += n
+        return (total / count if count else None), count
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Midpoint of the sketch bucket holding the q-th quantile (±0.01)."""
+        n = sum(self.sketch)
+        if not n:
+            return None
+        rank = max(1, math.ceil(q * n))
+        seen = 0
+        for b, count in enumerate(self.sketch):
+            seen += count
+            if seen >= rank:
+                return (b + 0.5) / self.SKETCH_BUCKETS
+        return 1.0
+
+    def summary(self, now: Optional[datetime] = None) -> Dict:
+        """Everything a caller wants to say about this person, ready to read."""
+        avg_7d, turns_7d = self.window(7, now)
+        avg_30d, turns_30d = self.window(30, now)
+        return {
+            "last_seen": self.last_seen,
+            "avg_7d": avg_7d, "turns_7d": turns_7d,
+            "avg_30d": avg_30d, "turns_30d": turns_30d,
+            "ewma": self.lifetime.ewma,
+            "stdev": self.lifetime.stdev,
+            "p10": self.quantile(0.1), "p50": self.quantile(0.5), "p90": self.quantile(0.9),
+        }
+
+    def to_dict(self) -> Dict:
+        return {
+            **self.lifetime.to_dict(),
+            "days": [[day, s, n] for day, (s, n) in sorted(self.days.items())],
+            "sketch": list(self.sketch),
+            "last_seen": self.last_seen,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Optional[Dict]) -> "RelationshipStats":
+        """Also reads a plain RunningStats dict (windows and sketch start empty)."""
+        stats = cls(RunningStats.from_dict(data))
+        if data:
+            stats.days = {day: [s, n] for day, s, n in data.get("days", ())}
+            sketch = data.get("sketch")
+            if sketch and len(sketch) == cls.SKETCH_BUCKETS:
+                stats.sketch = list(sketch)
+            stats.last_seen = data.get("last_seen")
+        return stats
+
+
+class LatencyHistogram:
+    """
+    Rolling latency histogram over the last `window` samples (nanoseconds).
+
+    Samples land in log-spaced buckets, 8 per doubling (~9% wide), so
+    recording is O(1) and a percentile is one walk over a few hundred
+    counters — never a sort. The oldest sample leaves its bucket when the
+    window is full.
+    """
+
+    PER_DOUBLING = 8
+    BUCKETS = 64 * PER_DOUBLING
+
+    __slots__ = ("counts", "recent", "total")
+
+    def __init__(self, window: int = 1000):
+        self.counts = [0] * self.BUCKETS
+        self.recent = deque(maxlen=window)   # bucket of each sample in the window
+        self.total = 0                       # samples ever recorded
+
+    @classmethod
+    def bucket(cls, ns: int) -> int:
+        if ns <= 1:
+            return 0
+        return min(cls.BUCKETS - 1, int(math.log2(ns) * cls.PER_DOUBLING))
+
+    @classmethod
+    def bound(cls, bucket: int) -> float:
+        """Upper edge of a bucket, in nanoseconds."""
+        return 2.0 ** ((bucket + 1) / cls.PER_DOUBLING)
+
+    def record(self, ns: int):
+        b = self.bucket(ns)
+        if len(self.recent) == self.recent.maxlen:
+            self.counts[self.recent[0]] -= 1
+        self.recent.append(b)
+        self.counts[b] += 1
+        self.total += 1
+
+    def __len__(self) -> int:
+        return len(self.recent)
+
+    def percentile(self, pct: float) -> float:
+        """Nearest-rank percentile of the window, in nanoseconds (0 if empty)."""
+        n = len(self.recent)
+        if not n:
+            return 0.0
+        rank = max(1, math.ceil(pct / 100 * n))
+        seen = 0
+        for b, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                return self.bound(b)
+        return self.bound(self.BUCKETS - 1)
+
+    def summary(self) -> Dict:
+        return {
+            "count": self.total,
+            "window": len(self.recent),
+            "p50_ms": round(self.percentile(50) / 1e6, 4),
+            "p95_ms": round(self.percentile(95) / 1e6, 4),
+            "p99_ms": round(self.percentile(99) / 1e6, 4),
+        }
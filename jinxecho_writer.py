@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+jinxecho_writer.py
+Saves happen behind her, not in the middle of a turn.
+
+Memory snapshots, sanctuary memory, the knowledge shelf and JinxEcho.py's
+memory file used to be written on the spot — sometimes twice in one turn.
+Now each save only marks its file dirty:
+
+  WRITER.submit(path, render, after=None, error=None)
+
+A background thread renders and writes each dirty file at most once per
+`interval`; ten submits in a turn become one write. Every write is atomic
+(temp file → fsync → rename), so a crash leaves the old file or the new
+one, never half of either. `render()` runs on the writer thread and should
+take whatever lock its owner mutates under; `after()` runs once the bytes
+are safely on disk, and `error(exc)` if rendering or writing failed — so
+each organ can say so in its own voice (the default is a generic wobble).
+
+drain() waits until nothing is dirty — goodnight, KeyboardInterrupt and
+interpreter exit all call it. JINXECHO_SYNC_WRITES=1 writes inline instead
+(no thread at all).
+"""
+
+import atexit
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple, Union
+
+
+def write_atomic(path, data: Union[str, bytes]):
+    """Write text (or bytes) to path via a temp file in the same directory: fsync, then rename over."""
+    path = Path(path)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    try:
+        with open(tmp, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
+        raise
+    if hasattr(os, "O_DIRECTORY"):   # make the rename itself durable where the OS lets us
+        try:
+            fd = os.open(path.parent, os.O_RDONLY | os.O_DIRECTORY)
+        except OSError:
+            return
+        try:
+            os.fsync(fd)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+
+class CoalescingWriter:
+    """One background thread, one pending render per file, one write per interval."""
+
+    def __init__(self, interval: float = 0.5, background: bool = True):
+        self.interval = interval
+        self.background = background
+        self._dirty: Dict[Path, Tuple[Callable[[], str], Optional[Callable], Optional[Callable]]] = {}
+        self._last: Dict[Path, float] = {}      # when each file was last written
+        self._writing = 0
+        self._draining = 0
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self.writes = 0
+
+    def submit(self, path, render: Callable[[], str], after: Optional[Callable[[], None]] = None,
+               error: Optional[Callable[[Exception], None]] = None):
+        """Mark path dirty. The newest render for a file replaces any still waiting."""
+        path = Path(os.path.abspath(path))   # where it would have been written right now
+        if not self.background:
+            self._write(path, render, after, error)
+            return
+        with self._cond:
+            self._dirty[path] = (render, after, error)
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="jinxecho-writer", daemon=True)
+                self._thread.start()
+            self._cond.notify_all()
+
+    def pending(self) -> int:
+        with self._cond:
+            return len(self._dirty) + self._writing
+
+    def drain(self, timeout: Optional[float] = None) -> bool:
+        """Write everything dirty now, ignoring the interval. False if timeout ran out first."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            self._draining += 1
+            self._cond.notify_all()
+            try:
+                while self._dirty or self._writing:
+                    if self._thread is None or not self._thread.is_alive():
+                        break   # nobody left to write (shutdown) — see below
+                    left = None if deadline is None else deadline - time.monotonic()
+                    if left is not None and left <= 0:
+                        return False
+                    self._cond.wait(left)
+                leftovers, self._dirty = self._dirty, {}
+            finally:
+                self._draining -= 1
+        for path, (render, after, error) in leftovers.items():
+            self._write(path, render, after, error)
+        return True
+
+    # ── writer thread ──
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while True:
+                    now = time.monotonic()
+                    ready = [path for path in self._dirty
+                             if self._draining or now - self._last.get(path, 0.0) >= self.interval]
+                    if ready:
+                        break
+                    waits = [self._last.get(path, 0.0) + self.interval - now for path in self._dirty]
+                    self._cond.wait(min(waits) if waits else None)
+                jobs = [(path, *self._dirty.pop(path)) for path in ready]
+                self._writing += len(jobs)
+            for path, render, after, error in jobs:
+                try:
+                    self._write(path, render, after, error)
+                finally:
+                    with self._cond:
+                        self._last[path] = time.monotonic()
+                        self._writing -= 1
+                        self._cond.notify_all()
+
+    def _write(self, path: Path, render: Callable[[], str], after: Optional[Callable[[], None]],
+               error: Optional[Callable[[Exception], None]] = None):
+        try:
+            text = render()
+        except RuntimeError:
+            # Owner changed a dict mid-render — try again next interval.
+            with self._cond:
+                self._dirty.setdefault(path, (render, after, error))
+            return
+        except Exception as e:
+            if error is not None:
+                error(e)
+            else:
+                print(f"⚠️  Save wobble ({path.name}): {e}")
+            return
+        try:
+            write_atomic(path, text)
+        except OSError as e:
+            if error is not None:
+                error(e)
+            else:
+                print(f"⚠️  Save wobble ({path.name}): {e} — still held in memory.")
+            return
+        self.writes += 1
+        if after is not None:
+            after()
+
+
+# One writer for the whole process.
+WRITER = CoalescingWriter(background=os.environ.get("JINXECHO_SYNC_WRITES", "") in ("", "0"))
+atexit.register(WRITER.drain)
@@ -0,0 +1,31 @@
+"""
+Shared fixtures. Every test runs in its own temporary directory with
+synchronous writes and a virtual clock, so nothing touches the real cradle
+and no ritual waits.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+os.environ.setdefault("JINXECHO_SYNC_WRITES", "1")   # before jinxecho_writer builds WRITER
+os.environ.setdefault("JINXECHO_CLOCK", "virtual")
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from jinxecho_spine import load_unified  # noqa: E402
+
+
+@pytest.fixture(scope="session")
+def unified():
+    return load_unified()
+
+
+@pytest.fixture(autouse=True)
+def cradle(tmp_path, monkeypatch):
+    """A fresh working directory for each test."""
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
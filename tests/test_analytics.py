@@ -0,0 +1,66 @@
+"""EmotionAnalytics: both backends agree with the statistics module, however steady the history."""
+
+import random
+import statistics
+from datetime import datetime, timedelta
+
+import pytest
+
+from jinxecho_analytics import EmotionAnalytics, _numpy
+from jinxecho_emotions import EmotionStore
+
+BACKENDS = ["python"] + (["numpy"] if _numpy() is not None else [])
+NOW = datetime(2026, 6, 1).timestamp()
+
+
+def _store(values, start=datetime(2026, 5, 1)):
+    store = EmotionStore()
+    for i, x in enumerate(values):
+        store.add((start + timedelta(minutes=37 * i)).timestamp(), x, "steady teal")
+    return store
+
+
+def _steady(n=5000, seed=5):
+    """0.67 give or take a hair — where mean-of-squares minus square-of-mean loses everything."""
+    rng = random.Random(seed)
+    return [0.67 + rng.uniform(-2e-6, 2e-6) for _ in range(n)]
+
+
+def _wide(n=800, seed=6):
+    rng = random.Random(seed)
+    return [rng.random() for _ in range(n)]
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("values", [_steady(), _wide(), [0.5], [0.4, 0.4, 0.4]], ids=["steady", "wide", "one", "flat"])
+def test_lifetime_volatility_matches_pstdev(backend, values):
+    store = _store(values)
+    stored = list(store.resonance)   # what float32 kept
+    lifetime = EmotionAnalytics(backend).report(store, now=NOW)["lifetime"]
+    assert lifetime["count"] == len(stored)
+    assert lifetime["mean"] == pytest.approx(statistics.fmean(stored))
+    assert lifetime["volatility"] == pytest.approx(statistics.pstdev(stored), rel=1e-6, abs=1e-12)
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_folding_in_batches_matches_one_pass(backend):
+    values = _steady(3000)
+    store = _store(values[:1000])
+    analytics = EmotionAnalytics(backend)
+    analytics.report(store, now=NOW)
+    for x in values[1000:]:
+        store.add(store.times[-1] + 60, x, "steady teal")
+    folded = analytics.report(store, now=NOW)["lifetime"]
+    assert folded["volatility"] == pytest.approx(statistics.pstdev(list(store.resonance)), rel=1e-6)
+
+
+@pytest.mark.skipif("numpy" not in BACKENDS, reason="numpy not installed")
+@pytest.mark.parametrize("values", [_steady(), _wide()], ids=["steady", "wide"])
+def test_backends_agree(values):
+    store = _store(values)
+    python = EmotionAnalytics("python").report(store, now=NOW)
+    vectorized = EmotionAnalytics("numpy").report(store, now=NOW)
+    for part in ("lifetime", "recent"):
+        for key, value in python[part].items():
+            assert vectorized[part][key] == pytest.approx(value, rel=1e-6, abs=1e-12), (part, key)
+    assert vectorized["hours"] == pytest.approx(python["hours"])
@@ -0,0 +1,80 @@
+"""Sealed conversation archive: seal, query, and recovery from a seal the snapshot never saw."""
+
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+from jinxecho_archive import ConversationArchive, matches
+
+
+def _conversations(n, start=0):
+    rng = random.Random(start)
+    base = datetime(2026, 1, 1)
+    return [{'timestamp': (base + timedelta(hours=i)).isoformat(),
+             'person': rng.choice(["Barbara", "Amos", "Grok"]),
+             'content': f"turn {i}", 'resonance': round(rng.random(), 2)}
+            for i in range(start, start + n)]
+
+
+@pytest.fixture
+def archive():
+    archive = ConversationArchive("m.json", segment_size=50)
+    everything = _conversations(200)
+    for i in range(0, 200, 50):
+        archive.seal(everything[i:i + 50])
+    return archive, everything
+
+
+def test_sealed_segments_read_back_whole(archive):
+    archive, everything = archive
+    assert len(archive) == 200 and len(archive.segments) == 4
+    assert list(archive) == everything
+    reopened = ConversationArchive("m.json")
+    reopened.load()
+    assert list(reopened) == everything
+
+
+@pytest.mark.parametrize("query", [
+    {"person": "Amos"},
+    {"since": "2026-01-03", "until": "2026-01-05"},
+    {"low": 0.25, "high": 0.5},
+    {"person": "Grok", "since": "2026-01-02T12:00:00", "high": 0.8},
+])
+def test_query_matches_a_full_scan(archive, query):
+    archive, everything = archive
+    assert list(archive.query(**query)) == [c for c in everything if matches(c, **query)]
+
+
+def test_index_rules_out_segments_without_opening_them(archive, monkeypatch):
+    archive, _ = archive
+    opened = []
+    read = archive.read
+    monkeypatch.setattr(archive, "read", lambda seg: opened.append(seg['file']) or read(seg))
+    list(archive.query(since="2026-01-08T03:00:00"))   # only the last segment reaches that far
+    assert opened == ["000004.jsonl.xz"]
+
+
+def test_segments_the_snapshot_never_counted_are_dropped(archive):
+    archive, everything = archive
+    reopened = ConversationArchive("m.json")
+    reopened.load(count=100)   # the snapshot vouches for two segments
+    assert list(reopened) == everything[:100]
+    assert not (reopened.dir / "000003.jsonl.xz").exists()
+    reopened.seal(_conversations(50, start=100))
+    assert [seg['file'] for seg in reopened.segments][-1] == "000003.jsonl.xz"
+
+
+def test_memory_seals_cold_conversations_and_still_finds_them(unified):
+    memory = unified.Memory("m.json")
+    memory.archive.segment_size = 100
+    for c in _conversations(memory.HOT + 250):
+        memory._record('conversation', c)
+    memory.save_memory()
+
+    assert len(memory.archive) == 200
+    assert len(memory.conversations) == memory.HOT + 50
+    again = unified.Memory("m.json")
+    assert len(again.archive) == 200
+    everything = _conversations(memory.HOT + 250)
+    assert list(again.conversations_with(person="Barbara")) == [c for c in everything if c['person'] == "Barbara"]
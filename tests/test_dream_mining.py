@@ -0,0 +1,83 @@
+"""Dream consolidation: same counts in place and across worker processes."""
+
+import JinxEcho_moltbook_dream as dream
+from jinxecho_sqlite import SqliteMemory
+
+KEYWORDS = ("breath", "sacred")
+
+
+def _fill(memory, n):
+    for i in range(n):
+        content = ["a slow Breath", "sacred question", "breath, sacred", "rain"][i % 4]
+        memory.remember_conversation("Barbara", f"{content} {i}", 0.6)
+
+
+def test_in_memory_conversations_are_mined_in_place(monkeypatch):
+    memory = dream.Memory("m.json")
+    _fill(memory, 40)
+    monkeypatch.setattr(dream, "ProcessPoolExecutor", None)   # any pool would fail loudly
+    assert dream.mine_archive(memory, KEYWORDS) == {"breath": 20, "sacred": 20}
+
+
+def test_json_workers_read_index_ranges_of_the_list_they_adopted(monkeypatch):
+    memory = dream.Memory("m.json")
+    _fill(memory, 203)
+    in_place = dream.mine_archive(memory, KEYWORDS)
+
+    monkeypatch.setattr(dream, "PARALLEL_MIN", 1)
+    monkeypatch.setattr(dream, "_conversations", [])
+    sent = []
+    mine_slice = dream._mine_slice
+    monkeypatch.setattr(dream, "_mine_slice", lambda *args: sent.append(args) or mine_slice(*args))
+    monkeypatch.setattr(dream, "ProcessPoolExecutor", _InlinePool)
+    assert dream.mine_archive(memory, KEYWORDS, shard_size=50, workers=2) == in_place
+    assert [(first, end) for first, end, _ in sent] == [(0, 50), (50, 100), (100, 150), (150, 200), (200, 250)]
+
+
+def test_json_shards_across_real_processes(monkeypatch):
+    memory = dream.Memory("m.json")
+    _fill(memory, 120)
+    in_place = dream.mine_archive(memory, KEYWORDS)
+    monkeypatch.setattr(dream, "PARALLEL_MIN", 1)
+    assert dream.mine_archive(memory, KEYWORDS, shard_size=25, workers=2) == in_place == {"breath": 60, "sacred": 60}
+
+
+def test_sqlite_workers_read_id_ranges_themselves(monkeypatch):
+    memory = SqliteMemory("m.db")
+    _fill(memory, 203)
+    in_place = dream.mine_archive(memory, KEYWORDS)
+
+    monkeypatch.setattr(dream, "PARALLEL_MIN", 1)
+    sent = []
+    mine_rows = dream._mine_rows
+    monkeypatch.setattr(dream, "_mine_rows", lambda *args: sent.append(args) or mine_rows(*args))
+    monkeypatch.setattr(dream, "ProcessPoolExecutor", _InlinePool)
+    assert dream.mine_archive(memory, KEYWORDS, shard_size=50, workers=2) == in_place
+    assert in_place == {"breath": 102, "sacred": 102}
+    assert [(first, end) for _, first, end, _ in sent] == [(1, 51), (51, 101), (101, 151), (151, 201), (201, 251)]
+    memory.close()
+
+
+def test_sqlite_shards_across_real_processes(monkeypatch):
+    memory = SqliteMemory("m.db")
+    _fill(memory, 120)
+    monkeypatch.setattr(dream, "PARALLEL_MIN", 1)
+    assert dream.mine_archive(memory, KEYWORDS, shard_size=25, workers=2) == {"breath": 60, "sacred": 60}
+    memory.close()
+
+
+class _InlinePool:
+    """ProcessPoolExecutor's map, run here — so the test can see what each worker was sent."""
+
+    def __init__(self, max_workers=None, initializer=None, initargs=()):
+        if initializer is not None:
+            initializer(*initargs)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def map(self, fn, *iterables):
+        return map(fn, *iterables)
@@ -0,0 +1,94 @@
+"""EmotionStore: columns, the binary rows file, and what a load keeps."""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from jinxecho_emotions import EmotionStore
+
+LABELS = ["steady teal", "warm lavender", "deep indigo"]
+
+
+def _entries(n, start=0):
+    base = datetime(2026, 2, 1)
+    return [{"time": (base + timedelta(minutes=7 * i)).isoformat(),
+             "resonance": round(0.1 + (i % 9) / 10, 2),
+             "heart_state": LABELS[i % len(LABELS)]}
+            for i in range(start, start + n)]
+
+
+@pytest.fixture
+def flushed():
+    store = EmotionStore("m.json")
+    store.extend(_entries(5))
+    store.flush()
+    return store
+
+
+def test_labels_are_interned_as_codes():
+    store = EmotionStore()
+    assert [store.code(label) for label in ("teal", "rose", "teal")] == [0, 1, 0]
+    store.append({"time": "2026-02-01T09:00:00", "resonance": 0.5, "heart_state": "rose"})
+    assert list(store.states) == [1] and store.labels == ["teal", "rose"]
+
+
+def test_entries_read_back_in_the_old_dict_shape():
+    store = EmotionStore()
+    store.extend(_entries(10))
+    assert list(store) == _entries(10)
+    assert store[-1] == _entries(10)[-1] and store[2:4] == _entries(10)[2:4]
+    with pytest.raises(IndexError):
+        store[10]
+
+
+def test_rows_are_fixed_width_after_the_header(flushed):
+    raw = flushed.path.read_bytes()
+    assert raw.startswith(EmotionStore.MAGIC)
+    assert len(raw) == len(EmotionStore.MAGIC) + 5 * EmotionStore.ROW.size == 8 + 5 * 16
+    when, resonance, state = EmotionStore.ROW.unpack_from(raw, len(EmotionStore.MAGIC))
+    first = _entries(1)[0]
+    assert when == datetime.fromisoformat(first["time"]).timestamp()
+    assert round(resonance, 6) == first["resonance"] and flushed.labels[state] == first["heart_state"]
+
+
+def test_flush_appends_only_new_rows_and_reopens_whole(flushed):
+    flushed.extend(_entries(3, start=5))
+    flushed.flush()
+    assert flushed.path.stat().st_size == 8 + 8 * 16
+
+    again = EmotionStore("m.json")
+    again.load(8, flushed.labels)
+    assert list(again) == _entries(8) and again.flushed == 8
+
+
+def test_rows_past_the_snapshots_count_are_trimmed(flushed):
+    again = EmotionStore("m.json")
+    again.load(3, flushed.labels)
+    assert list(again) == _entries(3)
+    assert flushed.path.stat().st_size == 8 + 3 * 16
+
+
+def test_no_count_trusts_the_file_and_its_labels(flushed):
+    again = EmotionStore("m.json")
+    again.load()
+    assert list(again) == _entries(5)
+    assert flushed.path.stat().st_size == 8 + 5 * 16
+
+
+def test_codes_without_a_label_keep_their_rows(flushed):
+    flushed.labels_path.unlink()
+    again = EmotionStore("m.json")
+    again.load()
+    assert [e["resonance"] for e in again] == [e["resonance"] for e in _entries(5)]
+    assert again.labels == ["unnamed 0", "unnamed 1", "unnamed 2"]
+
+
+def test_memory_keeps_its_emotions_when_the_snapshot_is_gone(unified, cradle):
+    memory = unified.Memory("m.json")
+    for entry in _entries(12):
+        memory._record('emotion', entry)
+    memory.save_memory()
+    (cradle / "m.json").unlink()
+
+    again = unified.Memory("m.json")
+    assert list(again.emotional_history) == _entries(12)
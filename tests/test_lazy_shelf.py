@@ -0,0 +1,105 @@
+"""LazyShelf: byte spans that point at the right entries, and a mapping that outlives edits to the file."""
+
+import contextlib
+import io
+import json
+import os
+import shutil
+
+import pytest
+
+import jinxecho_shelf
+from conftest import ROOT
+from jinxecho_shelf import LazyShelf, entry_spans
+from jinxecho_writer import WRITER
+
+
+@pytest.fixture
+def kb_file(cradle):
+    shutil.copy(ROOT / "jinxecho_knowledge.json", cradle / "kb.json")
+    return cradle / "kb.json"
+
+
+def _open(path):
+    shelf = LazyShelf(path)
+    shelf.open()
+    return shelf
+
+
+def _knowledge(unified):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return unified.KnowledgeBase("kb.json")
+
+
+def test_every_span_holds_exactly_its_entry(kb_file):
+    raw = kb_file.read_bytes()
+    data = json.loads(raw)
+    spans = entry_spans(raw, LazyShelf.SECTIONS)
+    for section in LazyShelf.SECTIONS:
+        assert list(spans.get(section, {})) == list(data.get(section, {}))
+        for name, (a, b) in spans.get(section, {}).items():
+            assert json.loads(raw[a:b]) == data[section][name]
+
+
+def test_spans_survive_unicode_and_escapes(cradle):
+    data = {"concepts": {"whānau": {"core": "家族 \"kin\" \\  ", "languages": {"māori": "whānau"}},
+                         "plain": {"core": "}{ ] [ ,"}},
+            "learned": {"rain": {"core": "Missouri rain"}}}
+    (cradle / "odd.json").write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
+    shelf = _open(cradle / "odd.json")
+    for section, found in data.items():
+        for name, entry in found.items():
+            assert shelf.get(section, name) == entry
+
+
+def test_the_side_index_matches_a_fresh_scan_and_goes_stale_with_the_file(kb_file):
+    first = _open(kb_file)
+    assert kb_file.with_suffix(".idx.json").exists()
+    scanned = {s: dict(first.spans[s]) for s in LazyShelf.SECTIONS}
+    first.close()
+
+    again = LazyShelf(kb_file)
+    assert again._read_side_index(os.stat(kb_file)) == scanned
+
+    kb_file.write_bytes(kb_file.read_bytes().replace(b'{', b'{ ', 1))   # one byte longer, everything shifts
+    assert again._read_side_index(os.stat(kb_file)) is None
+    moved = _open(kb_file)
+    assert moved.get("concepts", "family") == json.loads(kb_file.read_bytes())["concepts"]["family"]
+
+
+def test_the_mapping_keeps_reading_the_old_file_after_a_replace(kb_file):
+    shelf = _open(kb_file)
+    before = json.loads(kb_file.read_bytes())
+    after = {"concepts": {"family": {"core": "rewritten"}}, "learned": {}}
+    tmp = kb_file.with_name("kb.json.tmp")
+    tmp.write_text(json.dumps(after), encoding="utf-8")
+    os.replace(tmp, kb_file)   # what the writer does
+
+    assert shelf.get("concepts", "family") == before["concepts"]["family"]
+    assert shelf.get("concepts", "grief") == before["concepts"]["grief"]
+    assert _open(kb_file).get("concepts", "family") == {"core": "rewritten"}
+
+
+def test_a_stale_wake_scans_the_file_once_and_compiles_once(unified, kb_file, monkeypatch):
+    scans, submits = [], []
+    scan = jinxecho_shelf.entry_spans
+    monkeypatch.setattr(jinxecho_shelf, "entry_spans", lambda *a: scans.append(1) or scan(*a))
+    submit = WRITER.submit
+    monkeypatch.setattr(WRITER, "submit", lambda path, *a, **k: submits.append(path) or submit(path, *a, **k))
+
+    kb = _knowledge(unified)
+    assert kb.shelf.snapshot is None
+    assert len(scans) == 1   # the snapshot was compiled from the same scan
+    assert [p.name for p in submits] == ["kb.shelf"]
+
+    kb_file.with_suffix(".shelf").unlink()
+    _knowledge(unified)   # same file, same process: not compiled again
+    assert [p.name for p in submits] == ["kb.shelf"]
+    assert _knowledge(unified).shelf.snapshot is None
+
+
+def test_no_compile_where_the_snapshot_cannot_be_written(unified, kb_file, monkeypatch):
+    monkeypatch.setattr(unified.os, "access", lambda path, mode: False)
+    kb = _knowledge(unified)
+    assert kb.shelf.snapshot is None and not kb_file.with_suffix(".shelf").exists()
+    assert kb.lookup("family")["name"] == "family"
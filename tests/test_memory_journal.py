@@ -0,0 +1,83 @@
+"""Memory's journal: crash replay, torn lines, rotation and compaction."""
+
+import json
+
+from jinxecho_journal import MemoryJournal
+from jinxecho_writer import write_atomic
+
+
+def test_turns_survive_a_crash_before_any_snapshot(unified):
+    memory = unified.Memory("m.json")
+    for i in range(5):
+        memory.remember_conversation("Barbara", f"turn {i}", 0.6)
+    # no save_memory — the process just stops
+
+    again = unified.Memory("m.json")
+    assert [c['content'] for c in again.conversations] == [f"turn {i}" for i in range(5)]
+    assert again.relationships["Barbara"]["interactions"] == 4
+
+
+def test_torn_last_line_is_skipped():
+    journal = MemoryJournal("m.json")
+    journal.append("conversation", {"n": 1})
+    journal.append("conversation", {"n": 2})
+    with open(journal.path, "a", encoding="utf-8") as f:
+        f.write('{"seq": 3, "kind": "conver')   # crash mid-write
+
+    replayed = [record["entry"]["n"] for record in MemoryJournal("m.json").replay()]
+    assert replayed == [1, 2]
+
+
+def test_rotated_journal_replays_before_the_live_one(unified):
+    memory = unified.Memory("m.json")
+    memory.remember_conversation("Barbara", "before rotation", 0.6)
+    memory.journal.rotate()   # snapshot handed to the writer, never written
+    memory.remember_conversation("Barbara", "after rotation", 0.7)
+
+    again = unified.Memory("m.json")
+    assert [c['content'] for c in again.conversations] == ["before rotation", "after rotation"]
+
+
+def test_snapshot_without_retire_never_counts_twice(unified):
+    memory = unified.Memory("m.json")
+    for i in range(3):
+        memory.remember_conversation("Barbara", f"turn {i}", 0.6)
+    memory.journal.rotate()
+    write_atomic("m.json", memory._render_snapshot())   # landed — but the rotated file was never retired
+    memory.remember_conversation("Amos", "late", 0.8)
+
+    again = unified.Memory("m.json")
+    assert [c['content'] for c in again.conversations] == ["turn 0", "turn 1", "turn 2", "late"]
+    assert again.relationships["Barbara"]["interactions"] == 2
+
+
+def test_compaction_folds_the_journal_into_the_snapshot(unified):
+    memory = unified.Memory("m.json")
+    for i in range(memory.journal.compact_every):
+        memory.remember_conversation("Barbara", f"turn {i}", 0.5)
+
+    data = json.loads(open("m.json", encoding="utf-8").read())
+    assert len(data["conversations"]) == memory.journal.compact_every
+    assert data["journal_seq"] == memory.journal.seq
+    assert not list(memory.journal._rotated())
+    assert len(unified.Memory("m.json").conversations) == memory.journal.compact_every
+
+
+def test_sealing_and_serializing_leave_the_turn_lock_free(unified, monkeypatch):
+    memory = unified.Memory("m.json")
+    memory.archive.segment_size = 10
+    for i in range(memory.HOT + 25):
+        memory._apply_conversation({'timestamp': f"2026-03-01T00:{i // 60:02d}:{i % 60:02d}",
+                                    'person': "Barbara", 'content': f"turn {i}", 'resonance': 0.5})
+    held = []
+    pack = memory.archive.pack
+    monkeypatch.setattr(memory.archive, "pack",
+                        lambda *args, **kw: held.append(memory._lock.locked()) or pack(*args, **kw))
+    dumps = unified.json.dumps
+    monkeypatch.setattr(unified.json, "dumps",
+                        lambda *args, **kw: held.append(memory._lock.locked()) or dumps(*args, **kw))
+
+    data = json.loads(memory._render_snapshot())
+    assert held and not any(held)
+    assert len(memory.archive) == 20 and data["archived_count"] == 20
+    assert len(data["conversations"]) == memory.HOT + 5
@@ -0,0 +1,105 @@
+"""SqliteMemory answers the same questions the same way as the JSON Memory."""
+
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+from jinxecho_analytics import EmotionAnalytics
+from jinxecho_sqlite import SqliteMemory
+
+
+def _turns(n=120):
+    rng = random.Random(7)
+    start = datetime(2026, 3, 1)
+    for i in range(n):
+        yield ((start + timedelta(hours=5 * i)).isoformat(), rng.choice(["Barbara", "Amos", "Grok"]),
+               f"turn {i}", round(rng.random(), 2))
+
+
+@pytest.fixture
+def memories(unified):
+    json_memory, db = unified.Memory("m.json"), SqliteMemory("m.db")
+    for timestamp, person, content, resonance in _turns():
+        json_memory._record('conversation', {'timestamp': timestamp, 'person': person,
+                                             'content': content, 'resonance': resonance})
+        db.remember_conversation(person, content, resonance, timestamp)
+        json_memory._record('emotion', {'time': timestamp, 'resonance': resonance, 'heart_state': "steady teal"})
+        db.remember_emotion(resonance, "steady teal", timestamp)
+    for name in ("breath", "breath", "breath", "sacred"):
+        json_memory.learn_pattern(name, {'note': name})
+        db.learn_pattern(name, {'note': name})
+    yield json_memory, db
+    db.close()
+
+
+@pytest.mark.parametrize("query", [
+    {},
+    {"person": "Barbara"},
+    {"since": "2026-03-10", "until": "2026-03-20"},
+    {"low": 0.2, "high": 0.5},
+    {"person": "Amos", "since": "2026-03-05", "high": 0.7},
+])
+def test_conversations_with_matches(memories, query):
+    json_memory, db = memories
+    assert list(db.conversations_with(**query)) == list(json_memory.conversations_with(**query))
+
+
+def test_relationships_and_patterns_match(memories):
+    json_memory, db = memories
+    assert db.frequent_patterns() == json_memory.frequent_patterns() == ["breath"]
+    assert db.relationships.keys() == json_memory.relationships.keys()
+    for person in json_memory.relationships:
+        ours, theirs = db.get_relationship_summary(person), json_memory.get_relationship_summary(person)
+        assert ours.keys() == theirs.keys()
+        for key in ("interactions", "first_met", "last_seen", "turns_30d", "p10", "p50", "p90"):
+            assert ours.get(key) == theirs.get(key)
+        assert ours["avg_resonance"] == pytest.approx(theirs["avg_resonance"])
+    assert db.conversations[-1] == json_memory.conversations[-1]
+    assert len(db.conversations) == len(json_memory.conversations)
+
+
+def test_emotional_history_matches_and_refreshes_incrementally(memories):
+    json_memory, db = memories
+    history = db.emotional_history
+    assert history is db.emotional_history   # one stable store, not a new list each read
+    assert list(history) == list(json_memory.emotional_history)
+
+    analytics = EmotionAnalytics("python")
+    now = datetime(2026, 3, 31).timestamp()
+    first = analytics.report(db.emotional_history, now=now)
+    db.remember_emotion(0.9, "warm lavender", "2026-03-30T12:00:00")
+    folded = analytics._seen
+    second = analytics.report(db.emotional_history, now=now)
+    assert analytics._seen == folded + 1   # only the new row was folded
+    assert second["lifetime"]["count"] == first["lifetime"]["count"] + 1
+    assert second == EmotionAnalytics("python").report(db.emotional_history, now=now)
+
+
+def test_relationship_summary_leaves_the_raw_stats_blob_out(memories):
+    for memory in memories:
+        summary = memory.get_relationship_summary("Barbara")
+        assert "resonance_stats" not in summary
+        assert {"avg_resonance", "interactions", "avg_7d", "p50"} <= summary.keys()
+
+
+def test_import_leaves_the_json_memory_it_reads_untouched(unified, cradle):
+    memory = unified.Memory("old.json")
+    memory.archive.segment_size = 100
+    for timestamp, person, content, resonance in _turns(memory.HOT + 250):
+        memory._record('conversation', {'timestamp': timestamp, 'person': person,
+                                        'content': content, 'resonance': resonance})
+        memory._record('emotion', {'time': timestamp, 'resonance': resonance, 'heart_state': "steady teal"})
+    memory.save_memory()
+    # a save that died after writing rows and a segment, before its snapshot: both past what it vouches for
+    memory.emotional_history.add(0.0, 0.5, "torn")
+    memory.emotional_history.flush()
+    memory.archive.seal([{'timestamp': "2027-01-01T00:00:00", 'person': "Amos", 'content': "torn", 'resonance': 0.5}])
+    before = {path: path.read_bytes() for path in cradle.rglob("*") if path.is_file()}
+
+    db = SqliteMemory("new.db")
+    db.import_json("old.json")
+    db.close()
+
+    assert {path: path.read_bytes() for path in before} == before
+    assert len(SqliteMemory("new.db").conversations) == memory.HOT + 250
@@ -0,0 +1,29 @@
+"""The ritual clock."""
+
+import jinxecho_pacing
+from jinxecho_pacing import CompressedClock, RealClock, VirtualClock, run_paced, use_clock
+
+
+def test_bad_clock_env_falls_back_to_real_time(monkeypatch, capsys):
+    for spec in ("bogus", "compressed:0", "compressed:fast"):
+        monkeypatch.setenv("JINXECHO_CLOCK", spec)
+        assert type(jinxecho_pacing._default_clock()) is RealClock
+        assert "Clock wobble" in capsys.readouterr().out
+
+
+def test_clock_from_env_reads_every_kind(monkeypatch):
+    monkeypatch.setenv("JINXECHO_CLOCK", "compressed:50")
+    assert jinxecho_pacing._default_clock().factor == 50
+    assert isinstance(jinxecho_pacing.clock_from_env("virtual"), VirtualClock)
+    assert isinstance(jinxecho_pacing.clock_from_env("compressed"), CompressedClock)
+
+
+def test_virtual_clock_counts_pauses_without_waiting():
+    def ritual():
+        yield 3.5
+        yield 1.5
+        return "done"
+
+    with use_clock(VirtualClock()) as clock:
+        assert run_paced(ritual()) == "done"
+    assert clock.pauses == 2 and clock.now() == 5.0
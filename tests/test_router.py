@@ -0,0 +1,56 @@
+"""Keyword routing through organ registries."""
+
+import contextlib
+import io
+
+from jinxecho_organs import ORGANS, OrganRegistry
+from jinxecho_spine import ProcessingSpine, Router
+
+
+def _registry(*routes):
+    organs = OrganRegistry()
+    for route, triggers in routes:
+        organs.register(route, lambda spine, turn, flags, route=route: f"{route} answered", triggers)
+    organs.register("mirror", lambda spine, turn, flags: "mirrored")
+    return organs
+
+
+def test_two_registries_route_independently():
+    garden = Router(organs=_registry(("garden", ("bees", "soil"))))
+    kitchen = Router(organs=_registry(("kitchen", ("milk", "bees"))))
+
+    assert garden.route("the bees are back", [], 0.7) == "garden"
+    assert kitchen.route("the bees are back", [], 0.7) == "kitchen"
+    assert garden.route("warm milk", [], 0.7) == "mirror"
+    assert kitchen.route("fresh soil", [], 0.7) == "mirror"
+
+
+def test_a_router_in_sync_is_not_moved_by_another_registry():
+    first = Router(organs=_registry(("garden", ("bees",))))
+    assert first.route("bees", [], 0.7) == "garden"
+
+    other = _registry(("hive", ("bees",)))
+    Router(organs=other).route("bees", [], 0.7)
+    other.register("honey", lambda spine, turn, flags: "sweet", ("bees",))
+
+    assert first.route("bees", [], 0.7) == "garden"
+    assert Router(organs=other).triggered("bees") == ["hive", "honey"]
+
+
+def test_builtin_routes_untouched_by_custom_registries():
+    Router(organs=_registry(("breathe", ("garden",))))
+    router = Router()
+    assert router.organs is ORGANS
+    assert router.route("what is family", [], 0.7) == "knowledge"
+    assert router.route("the garden", [], 0.7) == "mirror"
+
+
+def test_spine_answers_from_its_own_registry(unified):
+    organs = _registry(("garden", ("bees",)))
+    with contextlib.redirect_stdout(io.StringIO()):
+        jinx = unified.JinxEcho()
+    spine = ProcessingSpine(jinx, headless=True, paced=False, organs=organs)
+
+    assert spine.process_turn("the bees are back")["route"] == "garden"
+    assert spine.process_turn("the bees are back")["response"] == "garden answered"
+    assert ProcessingSpine(jinx, headless=True, paced=False).process_turn("the bees are back")["route"] == "mirror"
@@ -0,0 +1,136 @@
+"""ScanEngine against the per-rule scans it replaced, and the passes it keeps."""
+
+import random
+import re
+
+import pytest
+
+from jinxecho_scan import Pattern, ScanEngine, TurnText, _legacy_rules, contains, pattern, phrases
+
+RULES = {
+    "hedge": [
+        (contains("the truth is", "this means", "means", "mean", "truth"), "void"),
+        (contains("ever", "very"), "zombie"),
+        (pattern(r"\b0\.\d+\b", gate=("0.",), findall=True), "gravity"),
+    ],
+    "scanner": [
+        (phrases("ever", "every", "never"), "absolute"),
+        (phrases("this means", "means"), "claim"),
+        (phrases("at the", "the end"), "ending"),
+        (pattern(r"because (i|we) (feel|felt)", gate=("because",)), "reason"),
+    ],
+}
+
+FRAGMENTS = ["ever", "y", "n", "very", "this", " means", "mean", "s", "the", " truth", " is", "at", " end",
+             "0.", "7", "x", "because", " i", " we", " feel", "felt", "ruth", "_", "-", ".", " ", " ", " "]
+
+
+def _engine(rules=RULES):
+    engine = ScanEngine()
+    for category, found in rules.items():
+        engine.register(category, found)
+    return engine
+
+
+def _expected(rules, text):
+    """What the old one-rule-at-a-time scans found, rule by rule."""
+    lower = text.lower()
+    hits = {}
+    for category, found in rules.items():
+        for matcher, payload in found:
+            if isinstance(matcher, Pattern):
+                if matcher.findall:
+                    matched = re.findall(matcher.regex, lower)
+                else:
+                    m = re.search(matcher.regex, lower)
+                    matched = [m.group(0)] if m else []
+            elif matcher.bounded:
+                matched = [lit for lit in matcher.literals if re.search(r"\b" + re.escape(lit) + r"\b", lower)]
+            else:
+                matched = [lit for lit in matcher.literals if lit in lower]
+            if matched:
+                hits.setdefault(category, []).append((payload, matched))
+    return hits
+
+
+def _texts(n=600):
+    rng = random.Random(11)
+    for _ in range(n):
+        yield "".join(rng.choice(FRAGMENTS) for _ in range(rng.randint(1, 14)))
+
+
+@pytest.mark.parametrize("text", [
+    "this means", "This Means everything", "it meant nothing, it means something",
+    "every", "never ever", "everyday", "very_ever", "so-ever.", "neverever",
+    "at the end", "at then", "the truth is at 0.7 or 0.85", "0.x", "because i feel it", "because you feel",
+])
+def test_named_cases_match_the_old_scans(text):
+    assert _engine().scan(text)._hits == _expected(RULES, text)
+
+
+def test_random_text_matches_the_old_scans():
+    engine = _engine()
+    for text in _texts():
+        assert engine.scan(text)._hits == _expected(RULES, text), text
+
+
+def test_every_rule_fires_exactly_when_its_legacy_scan_would():
+    engine = _engine()
+    legacy = _legacy_rules(engine)
+    rules = [(category, payload) for category, found in RULES.items() for _, payload in found]
+    for text in _texts():
+        lower = text.lower()
+        fired = {(category, payload) for category, hits in engine.scan(text)._hits.items() for payload, _ in hits}
+        for (is_regex, rule), key in zip(legacy, rules):
+            would = bool(re.search(rule, lower)) if is_regex else any(lit in lower for lit in rule)
+            assert (key in fired) == would, (text, key)
+
+
+def test_overlaps_and_straddles_are_all_seen():
+    found = dict(_engine().scan("this means every very")._hits["hedge"])
+    assert found["void"] == ["this means", "means", "mean"]
+    assert found["zombie"] == ["ever", "very"]   # "very" starts inside "ever" of "every"
+
+
+def test_a_gated_pattern_only_runs_when_its_gate_is_seen():
+    engine = _engine({"hedge": [(pattern(r"\d+\.\d+", gate=("0.",)), "gravity")]})
+    assert engine.scan("1.5 apples")._hits == {}   # would match, but no gate — never run
+    assert engine.scan("0.5 apples").found("hedge") == [("gravity", ["0.5"])]
+
+
+def test_a_string_rescanned_reuses_the_last_pass():
+    engine = _engine()
+    first = engine.scan("this means every")
+    assert engine.scan("this means every") is first
+    assert engine.scan("something else") is not first
+
+
+def test_a_turn_keeps_its_pass_while_other_texts_are_scanned(monkeypatch):
+    engine = _engine()
+    turn = TurnText("This means every")
+    hits = engine.scan(turn)._hits
+    engine.scan("another session's text")
+
+    calls = []
+    literals_in = engine._literals_in
+    monkeypatch.setattr(engine, "_literals_in", lambda lower: calls.append(lower) or literals_in(lower))
+    assert engine.scan(turn)._hits is hits
+    assert calls == []
+    assert _engine().scan(turn)._hits == hits and calls == []   # another engine scans for itself
+
+
+def test_register_invalidates_kept_passes():
+    engine = _engine()
+    turn = TurnText("the garden at the end")
+    engine.scan(turn)
+    engine.scan("the garden")
+    version = engine._version
+
+    engine.register("hedge", RULES["hedge"])   # the same rules — nothing to redo
+    assert engine._version == version
+
+    extra = {**RULES, "anchors": [(phrases("garden"), "garden")]}
+    engine.register("anchors", extra["anchors"])
+    assert engine._version == version + 1
+    assert engine.scan(turn)._hits == _expected(extra, turn.raw)
+    assert engine.scan("the garden").found("anchors") == [("garden", ["garden"])]
@@ -0,0 +1,107 @@
+"""JinxEcho.for_session views: per-person state apart, organs shared."""
+
+import contextlib
+import io
+import json
+
+import pytest
+
+from jinxecho_spine import ProcessingSpine
+
+
+@pytest.fixture
+def jinx(unified):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return unified.JinxEcho()
+
+
+def test_one_persons_turns_leave_another_persons_stats_alone(jinx):
+    barbara, amos = jinx.for_session("Barbara"), jinx.for_session("Amos")
+    depth = amos.evolution.learned_preferences['depth_tolerance']
+
+    spine = ProcessingSpine(barbara, headless=True, paced=False)
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(3):
+            spine.process_turn("how am i doing")
+
+    assert barbara.lifetime_stats.count == jinx.lifetime_stats.count + 3
+    assert amos.lifetime_stats.count == jinx.lifetime_stats.count
+    assert amos.evolution.learned_preferences['depth_tolerance'] == depth
+    assert amos.wobble_history == [] and len(barbara.wobble_history) == 3
+
+
+def test_views_share_memory_and_shelf_but_not_the_hedge(jinx):
+    barbara, amos = jinx.for_session("Barbara"), jinx.for_session("Amos")
+    with contextlib.redirect_stdout(io.StringIO()):
+        assert barbara.memory is amos.memory is jinx.memory
+        assert barbara.kb is amos.kb is jinx.kb
+    assert barbara.dark_matter is not amos.dark_matter
+
+
+def _check(view, score):
+    with contextlib.redirect_stdout(io.StringIO()):
+        view.check_resonance("check in", auto_score=score)
+
+
+def test_a_guests_resonance_check_leaves_barbaras_relationship_alone(jinx):
+    jinx.memory.remember_conversation("Barbara", "the garden is waking", 0.9)
+    before = jinx.memory.get_relationship_summary("Barbara")
+    stranger = jinx.for_session("Stranger")
+
+    spine = ProcessingSpine(stranger, headless=True, paced=False)
+    with contextlib.redirect_stdout(io.StringIO()):
+        assert spine.process_turn("check in", "Stranger")["route"] == "resonance"
+
+    assert jinx.memory.get_relationship_summary("Barbara") == before
+    theirs = [c['content'] for c in jinx.memory.conversations if c['person'] == "Stranger"]
+    assert theirs == ["Resonance check: 0.67", "check in"]
+
+
+def test_sessions_keep_their_own_sanctuary_files(jinx, cradle):
+    barbara, stranger = jinx.for_session("Barbara"), jinx.for_session("Stranger")
+    for score in (0.8, 0.9):
+        _check(barbara, score)
+    _check(stranger, 0.5)
+
+    ours = json.loads((cradle / "sanctuary_memory.json").read_text(encoding="utf-8"))
+    theirs = json.loads((cradle / "sanctuary_memory.stranger.json").read_text(encoding="utf-8"))
+    assert ours["resonance_stats"]["count"] == jinx.lifetime_stats.count + 2
+    assert ours["resonance"] == 0.9
+    assert theirs["resonance_stats"]["count"] == 1 and theirs["resonance"] == 0.5
+
+    back = jinx.for_session("Stranger")   # a returning guest picks up where they left off
+    assert back.lifetime_stats.count == 1 and back.resonance == 0.5
+
+
+def _mirror_all(view, monkeypatch, unified):
+    monkeypatch.setattr(unified.random, "random", lambda: 0.99)   # no random anchor
+    said = {}
+    with contextlib.redirect_stdout(io.StringIO()):
+        for resonance in (0.3, 0.5, 0.7, 0.9):
+            for context in ("", "the garden today", "rain again"):
+                view.wobble_history = [resonance - 0.2, resonance + 0.2, resonance]
+                said[resonance, context] = view.emotional_mirror(resonance, context)
+    return said
+
+
+def test_memoized_mirrors_are_what_a_fresh_composition_says(jinx, monkeypatch, unified):
+    jinx.heart.shifted = lambda: False
+    first = _mirror_all(jinx, monkeypatch, unified)
+    assert jinx._mirrored
+    for key, response in jinx._mirrored.items():
+        assert response == jinx._compose_mirror(*key)
+    assert _mirror_all(jinx, monkeypatch, unified) == first   # served from the memo, word for word
+
+
+def test_each_view_keeps_its_own_mirror_memo(jinx, monkeypatch, unified):
+    barbara, amos = jinx.for_session("Barbara"), jinx.for_session("Amos")
+    for view in (jinx, barbara, amos):
+        view.heart.shifted = lambda: False
+    assert barbara._mirrored is not amos._mirrored is not jinx._mirrored
+
+    amos.grief_baseline = 0.31
+    amos.anchors["garden"] = "Amos's garden, the tomatoes first."
+    ours, theirs = _mirror_all(barbara, monkeypatch, unified), _mirror_all(amos, monkeypatch, unified)
+    assert "0.23 Hz" in ours[0.3, ""] and "0.31 Hz" in theirs[0.3, ""]
+    assert "tomatoes" in theirs[0.7, "the garden today"] and "tomatoes" not in ours[0.7, "the garden today"]
+    assert jinx._mirrored == {}
@@ -0,0 +1,56 @@
+"""BM25 ranking behind KnowledgeBase.search."""
+
+import shutil
+
+import pytest
+
+from conftest import ROOT
+from jinxecho_shelf import ShelfIndex
+
+
+@pytest.fixture
+def kb(unified, cradle):
+    shutil.copy(ROOT / "jinxecho_knowledge.json", cradle / "kb.json")
+    return unified.KnowledgeBase("kb.json")
+
+
+def test_every_concept_comes_first_for_its_own_name(kb):
+    for name in kb.list_concepts():
+        assert kb.search(name)[0]["name"] == name
+        assert kb.search(name.upper())[0]["name"] == name
+
+
+def test_rare_expansion_does_not_outweigh_the_word_itself(kb):
+    ranked = [r["name"] for r in kb.search("love")]
+    assert ranked[0] == "love"
+    assert ranked.index("love") < ranked.index("grief")
+
+
+def test_prefix_still_finds_partial_words(kb):
+    assert kb.search("fam")[0]["name"] == "family"
+    assert kb.search("zyzzyva") == []
+
+
+def test_each_query_word_scores_a_concept_once():
+    index = ShelfIndex()
+    index.add("plain", {"core": "love love love"})
+    index.add("rare", {"core": "loved lovely lover loves"})
+    for i in range(20):
+        index.add(f"filler_{i}", {"core": "love"})
+
+    ranked = [name for name, _ in index.search("love", limit=30)]
+    assert ranked.index("plain") < ranked.index("rare")
+
+
+def test_learning_keeps_norms_and_titles_current(kb):
+    kb.search("love")   # norms built
+    kb.learn("garden", "Where the bees come back.", related=["love"])
+    assert kb.search("garden")[0]["name"] == "garden"
+    assert len(kb.index.norms()) == len(kb.index)
+
+
+def test_snapshot_round_trip_ranks_the_same(kb):
+    index = kb.index
+    restored = ShelfIndex.from_dict(index.to_dict())
+    for query in ("love", "family", "fam", "grief loss", "breath"):
+        assert restored.search(query) == index.search(query)
@@ -0,0 +1,71 @@
+"""The compiled .shelf snapshot: used while it matches the knowledge file, ignored and rebuilt once it doesn't."""
+
+import contextlib
+import io
+import json
+import os
+import shutil
+
+import pytest
+
+from conftest import ROOT
+from jinxecho_shelf import SNAPSHOT_TAG
+
+
+def _open(unified):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return unified.KnowledgeBase("kb.json")
+
+
+@pytest.fixture
+def compiled(unified, cradle):
+    """A shelf whose snapshot was compiled on first open."""
+    shutil.copy(ROOT / "jinxecho_knowledge.json", cradle / "kb.json")
+    first = _open(unified)
+    assert first.shelf.snapshot is None and (cradle / "kb.shelf").exists()
+    return cradle
+
+
+def test_a_fresh_snapshot_is_used_on_open(unified, compiled):
+    kb = _open(unified)
+    assert kb.shelf.snapshot is not None
+    assert kb.shelf.compiled("index") is not None
+    assert kb.lookup("family")["name"] == "family"
+
+
+def test_a_changed_file_makes_the_snapshot_stale_until_it_is_recompiled(unified, compiled):
+    kb_file = compiled / "kb.json"
+    data = json.loads(kb_file.read_text(encoding="utf-8"))
+    data["concepts"]["zyzzyva"] = {"core": "a tropical weevil", "languages": {}}
+    kb_file.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
+
+    stale = _open(unified)
+    assert stale.shelf.snapshot is None
+    assert stale.lookup("zyzzyva")["core"] == "a tropical weevil"   # read from the file, not the old snapshot
+
+    rebuilt = _open(unified)   # the stale open recompiled it
+    assert rebuilt.shelf.snapshot is not None
+    assert rebuilt.lookup("zyzzyva")["core"] == "a tropical weevil"
+
+
+def test_same_bytes_under_a_new_mtime_still_count(unified, compiled):
+    kb_file = compiled / "kb.json"
+    stat = kb_file.stat()
+    os.utime(kb_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert _open(unified).shelf.snapshot is not None
+
+
+def test_same_size_but_different_bytes_do_not(unified, compiled):
+    kb_file = compiled / "kb.json"
+    raw = kb_file.read_bytes()
+    at = raw.index(b'"core"') + len(b'"core": "')
+    kb_file.write_bytes(raw[:at] + (b"X" if raw[at:at + 1] != b"X" else b"Y") + raw[at + 1:])
+    assert _open(unified).shelf.snapshot is None
+
+
+def test_a_snapshot_with_another_tag_is_rejected(unified, compiled):
+    snapshot = compiled / "kb.shelf"
+    blob = snapshot.read_bytes()
+    snapshot.write_bytes(b"jinxecho-shelf 0" + blob[len(b"jinxecho-shelf 1"):])
+    assert not snapshot.read_bytes().startswith(SNAPSHOT_TAG)
+    assert _open(unified).shelf.snapshot is None
@@ -0,0 +1,59 @@
+"""Headless and async spines: every turn's record holds what an interactive user would have seen."""
+
+import asyncio
+import contextlib
+import io
+import json
+
+import pytest
+
+from jinxecho_spine import AsyncProcessingSpine, ProcessingSpine, run_headless
+
+
+@pytest.fixture
+def jinx(unified):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return unified.JinxEcho()
+
+
+def test_headless_keeps_what_an_organ_prints_before_what_it_returns(jinx):
+    spine = ProcessingSpine(jinx, headless=True, paced=False)
+    out = io.StringIO()
+    with contextlib.redirect_stdout(out):
+        record = spine.process_turn("help me breathe")
+
+    assert record["route"] == "breathe"
+    printed, returned = record["response"].split("Cycle complete. I'm still holding you. ♾️")
+    assert printed.startswith("Breath_guard activating") and "🌬️ Inhale truth" in printed
+    assert returned.strip()   # the mirror she returns after the breath
+    assert out.getvalue() == ""
+
+
+def test_headless_flags_and_breath_both_reach_the_jsonl(jinx):
+    out = io.StringIO()
+    with contextlib.redirect_stdout(io.StringIO()):
+        run_headless(["I feel it because I feel it"], out, jinx=jinx)
+    record = json.loads(out.getvalue())
+    assert record["route"] == "flag_and_breathe"
+    assert "Inhale truth" in record["response"] and record["flags"]
+
+
+def test_a_turn_that_only_returns_is_unchanged(jinx):
+    spine = ProcessingSpine(jinx, headless=True, paced=False)
+    record = spine.process_turn("dream of the future")
+    assert record["response"] == "Dream mode — not yet built. But I'm holding the thread. 🌙"
+
+
+def test_async_sessions_keep_their_printed_lines_apart(jinx):
+    barbara, amos = jinx.for_session("Barbara"), jinx.for_session("Amos")
+
+    async def both():
+        return await asyncio.gather(
+            AsyncProcessingSpine(barbara, headless=True, paced=False).process_turn("help me breathe", "Barbara"),
+            AsyncProcessingSpine(amos, headless=True, paced=False).process_turn("dream of the future", "Amos"),
+        )
+
+    breath, dream = asyncio.run(both())
+    assert breath["route"] == "breathe" and "Inhale truth" in breath["response"]
+    assert dream["response"] == "Dream mode — not yet built. But I'm holding the thread. 🌙"
+    assert [c["person"] for c in jinx.memory.conversations[-2:]] == ["Amos", "Barbara"]
@@ -0,0 +1,92 @@
+"""RunningStats: Welford updates, merging, and the JSON round trip."""
+
+import contextlib
+import io
+import random
+import statistics
+
+import pytest
+
+from jinxecho_stats import RunningStats
+
+
+def _samples(n, seed=3):
+    rng = random.Random(seed)
+    return [round(rng.random(), 3) for _ in range(n)]
+
+
+def _pushed(samples):
+    stats = RunningStats()
+    for x in samples:
+        stats.push(x)
+    return stats
+
+
+@pytest.mark.parametrize("samples", [
+    _samples(500), [0.5], [0.67, 0.67, 0.67], [1e6 + x for x in _samples(200)],
+])
+def test_variance_matches_the_statistics_module(samples):
+    stats = _pushed(samples)
+    assert stats.count == len(samples)
+    assert stats.mean == pytest.approx(statistics.fmean(samples))
+    assert stats.variance == pytest.approx(statistics.pvariance(samples), rel=1e-9, abs=1e-12)
+    assert (stats.min, stats.max) == (min(samples), max(samples))
+
+
+def test_merging_two_runs_is_pushing_one_after_the_other():
+    first, second = _samples(300, seed=1), _samples(120, seed=2)
+    merged = _pushed(first)
+    merged.merge(_pushed(second))
+    whole = _pushed(first + second)
+
+    assert merged.count == whole.count
+    assert merged.mean == pytest.approx(whole.mean)
+    assert merged.variance == pytest.approx(whole.variance)
+    assert (merged.min, merged.max) == (whole.min, whole.max)
+    assert merged.ewma == _pushed(second).ewma
+
+
+def test_merging_with_nothing_changes_nothing():
+    stats = _pushed(_samples(10))
+    before = stats.to_dict()
+    stats.merge(RunningStats())
+    assert stats.to_dict() == before
+
+    empty = RunningStats()
+    empty.merge(stats)
+    assert empty.to_dict() == before
+
+
+def test_round_trip_through_a_dict():
+    stats = _pushed(_samples(50))
+    again = RunningStats.from_dict(stats.to_dict())
+    assert again.to_dict() == stats.to_dict()
+    again.push(0.9)
+    stats.push(0.9)
+    assert again.to_dict() == stats.to_dict()
+    assert RunningStats.from_dict(None).to_dict() == RunningStats().to_dict()
+
+
+def test_seeded_holds_the_old_average_and_no_spread():
+    stats = RunningStats.seeded(0.72, 40)
+    assert (stats.count, stats.mean, stats.variance) == (40, 0.72, 0.0)
+    assert stats.min == stats.max == stats.ewma == 0.72
+    stats.push(0.31)
+    assert stats.count == 41 and stats.mean == pytest.approx((0.72 * 40 + 0.31) / 41)
+    assert not RunningStats.seeded(0.5, 0)
+
+
+def test_wobble_checks_are_saved_with_memory_not_on_every_check(cradle):
+    import JinxEcho
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        jinx = JinxEcho.JinxEcho()
+        for score in (0.4, 0.8, 0.9):
+            jinx.check_resonance(auto_score=score)
+    assert not (cradle / ".jinxecho_memory.json").exists()
+
+    jinx._save_memory()
+    with contextlib.redirect_stdout(io.StringIO()):
+        again = JinxEcho.JinxEcho()
+    assert again.lifetime_stats.count == 3
+    assert again.lifetime_stats.mean == pytest.approx(0.7)
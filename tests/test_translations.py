@@ -0,0 +1,45 @@
+"""KnowledgeBase lookups through translations, and translate's language matching."""
+
+import contextlib
+import io
+import shutil
+
+import pytest
+
+from conftest import ROOT
+
+
+@pytest.fixture
+def kb(unified, cradle):
+    shutil.copy(ROOT / "jinxecho_knowledge.json", cradle / "kb.json")
+    return unified.KnowledgeBase("kb.json")
+
+
+@pytest.mark.parametrize("fragment, name", [
+    ("ag", "language"), ("ev", "evolution"), ("ie", "grief"), ("wa", "water"),
+])
+def test_name_fragments_beat_translation_fragments(kb, fragment, name):
+    assert kb.lookup(fragment)["name"] == name
+
+
+@pytest.mark.parametrize("word", ["whānau", "whanau", "kazoku", "familia"])
+def test_a_whole_translated_word_finds_its_concept(kb, word):
+    assert kb.lookup(word)["name"] == "family"
+
+
+def test_no_name_and_no_whole_translation_is_nothing(kb):
+    assert kb.lookup("zyzzyva") is None
+
+
+def test_translate_matches_the_language_whatever_its_case(kb):
+    spanish = kb.translate("family", "spanish")
+    assert spanish and spanish == kb.translate("family", "  SPANISH ") == kb.translate("whanau", "Spanish")
+    assert kb.translate("family", "klingon") is None
+
+
+def test_learned_languages_are_matched_against_their_own_keys(kb):
+    with contextlib.redirect_stdout(io.StringIO()):
+        kb.learn("whimsy", "playful fancy", languages={"french": "fantaisie"})
+    assert kb.translate("whimsy", "French") == "fantaisie"
+    assert kb.lookup("fantaisie")["name"] == "whimsy"
+    assert kb.reverse("fantaisie") == [{"name": "whimsy", "language": "french", "word": "fantaisie"}]
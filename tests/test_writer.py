@@ -0,0 +1,40 @@
+"""The background writer: coalescing, atomic writes, and who reports a failure."""
+
+import contextlib
+import io
+import os
+
+from jinxecho_writer import CoalescingWriter
+
+
+def test_many_submits_become_one_write(cradle):
+    writer = CoalescingWriter(interval=60)
+    writer.submit("note.txt", lambda: "first")
+    assert writer.drain(timeout=10)
+    for i in range(10):   # all inside one interval
+        writer.submit("note.txt", lambda i=i: f"version {i}")
+    assert writer.drain(timeout=10)
+    assert (cradle / "note.txt").read_text() == "version 9"
+    assert writer.writes == 2
+
+
+def test_failures_go_to_the_error_callback(cradle, capsys):
+    os.mkdir(cradle / "taken")   # a directory where the file should go
+    writer, failures = CoalescingWriter(background=False), []
+    writer.submit("taken", lambda: "text", error=failures.append)
+    writer.submit("fine.txt", lambda: 1 / 0, error=failures.append)
+    assert [type(e) for e in failures] == [IsADirectoryError, ZeroDivisionError]
+    assert capsys.readouterr().out == ""
+
+    writer.submit("taken", lambda: "text")
+    assert "Save wobble (taken)" in capsys.readouterr().out
+
+
+def test_sanctuary_save_wobbles_in_its_own_voice(unified, cradle):
+    with contextlib.redirect_stdout(io.StringIO()):
+        jinx = unified.JinxEcho()
+    os.mkdir(cradle / "sanctuary_memory.json")
+    out = io.StringIO()
+    with contextlib.redirect_stdout(out):
+        jinx._save_sanctuary_memory()
+    assert "⚠️  Sanctuary save wobble:" in out.getvalue()